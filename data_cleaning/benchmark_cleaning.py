@@ -0,0 +1,258 @@
+"""
+数据清洗基准测试
+
+把随仓库提供的原始数据复制放大到指定行数，对比逐行 apply 的旧实现与向量化实现的耗时，
+并逐值核对两者结果一致。
+
+用法：
+    python data_cleaning/benchmark_cleaning.py --rows 1000000
+    python data_cleaning/benchmark_cleaning.py --rows 2000000 --memory    # 对比整体与分块清洗的峰值内存
+    python data_cleaning/benchmark_cleaning.py --rows 2000000 --scaling   # 多进程清洗在 1/2/4/8 个进程下的扩展性
+    python data_cleaning/benchmark_cleaning.py --rows 1000000 --formats   # 对比CSV与列式格式的文件大小和冷加载耗时
+    python data_cleaning/benchmark_cleaning.py --rows 1000000 --incremental  # 每日重爬 1% 变化时增量清洗的耗时
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from data_cleaning_script import (clean_frame, project_dir, write_columnar, clean_salary, clean_salary_column, city_keywords, extract_location_from_company,
+                                  extract_location_column, categorize_column, clean_education, clean_experience,
+                                  clean_company_size, classify_job, education_categories, experience_categories,
+                                  company_size_categories, job_class_categories)
+
+raw_data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'zhilian_computer_jobs.csv')
+
+
+def load_scaled(rows):
+    """读取原始数据并循环复制到 rows 行"""
+    df = pd.read_csv(raw_data_path, encoding='utf-8-sig')
+    repeats = -(-rows // len(df))
+    return pd.concat([df] * repeats, ignore_index=True).iloc[:rows]
+
+
+def legacy_extract_location(company_name):
+    """旧实现：每次调用重建城市表，再双重循环做子串判断"""
+    if pd.isna(company_name):
+        return '西安'
+    company_name = str(company_name)
+    cities = {city: list(keywords) for city, keywords in city_keywords.items()}
+    for city, keywords in cities.items():
+        for keyword in keywords:
+            if keyword in company_name:
+                return city
+    return '西安'
+
+
+def synthetic_frame(rows):
+    """合成原始数据：循环复制原始数据，并给复制出的行的工作名称加编号，使大部分行互不重复"""
+    df = load_scaled(rows)
+    copy_number = pd.Series(df.index // len(pd.read_csv(raw_data_path, encoding='utf-8-sig')), index=df.index)
+    suffix = ('#' + copy_number.astype(str)).where(copy_number > 0, '')
+    df['工作名称'] = df['工作名称'].astype(str) + suffix
+    return df
+
+
+def write_synthetic_csv(path, rows):
+    """生成合成原始CSV"""
+    df = synthetic_frame(rows)
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+    return df
+
+
+def peak_rss_mb(code):
+    """在子进程中执行一段代码，返回子进程的峰值常驻内存（MB）与耗时
+
+    ru_maxrss 会从 fork 出子进程的父进程继承，Linux 上改读只统计本进程地址空间的 VmHWM
+    """
+    script = f"""
+import os, resource, sys, time
+sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})
+import contextlib, io
+from data_cleaning_script import clean_zhilian_data, clean_zhilian_data_chunked, clean_zhilian_data_incremental
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    {code}
+elapsed = time.perf_counter() - start
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+if os.path.exists('/proc/self/status'):
+    with open('/proc/self/status') as status:
+        peak = next(int(line.split()[1]) / 1024 for line in status if line.startswith('VmHWM'))
+print(peak, elapsed)
+"""
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+    rss, elapsed = output.split()
+    return float(rss), float(elapsed)
+
+
+def bench_memory(rows, chunksizes=(50000, 200000)):
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_path = os.path.join(tmp, 'raw.csv')
+        write_synthetic_csv(raw_path, rows)
+        print(f"合成原始CSV: {rows} 行，{os.path.getsize(raw_path) / 2 ** 20:.0f} MB")
+        full_path = os.path.join(tmp, 'full.csv')
+        rss, elapsed = peak_rss_mb(f"clean_zhilian_data({raw_path!r}, {full_path!r})")
+        print(f"整体清洗：峰值内存 {rss:.0f} MB，耗时 {elapsed:.1f} 秒")
+        for chunksize in chunksizes:
+            chunked_path = os.path.join(tmp, f'chunked_{chunksize}.csv')
+            rss, elapsed = peak_rss_mb(f"clean_zhilian_data_chunked({raw_path!r}, {chunked_path!r}, {chunksize})")
+            with open(full_path, 'rb') as a, open(chunked_path, 'rb') as b:
+                same = a.read() == b.read()
+            print(f"分块清洗（每块 {chunksize} 行）：峰值内存 {rss:.0f} MB，耗时 {elapsed:.1f} 秒，"
+                  f"输出{'一致' if same else '不一致'}")
+
+
+def bench_scaling(rows, levels=(1, 2, 4, 8), chunksize=100000):
+    print(f"CPU核数: {os.cpu_count()}")
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_path = os.path.join(tmp, 'raw.csv')
+        df = write_synthetic_csv(raw_path, rows)
+        # 再追加一份前 10% 的行，验证跨分片去重
+        df.iloc[:rows // 10].to_csv(raw_path, mode='a', header=False, index=False, encoding='utf-8')
+        del df
+        print(f"合成原始CSV: {rows + rows // 10} 行，{os.path.getsize(raw_path) / 2 ** 20:.0f} MB")
+
+        baseline = None
+        outputs = []
+        for workers in levels:
+            output_path = os.path.join(tmp, f'workers_{workers}.csv')
+            _, elapsed = peak_rss_mb(f"clean_zhilian_data_chunked({raw_path!r}, {output_path!r}, "
+                                     f"{chunksize}, workers={workers})")
+            baseline = baseline or elapsed
+            outputs.append(output_path)
+            print(f"{workers} 个进程：耗时 {elapsed:.1f} 秒，{(rows + rows // 10) / elapsed:.0f} 行/秒，"
+                  f"加速 {baseline / elapsed:.2f}x")
+
+        full_path = os.path.join(tmp, 'full.csv')
+        peak_rss_mb(f"clean_zhilian_data({raw_path!r}, {full_path!r})")
+        with open(full_path, 'rb') as f:
+            expected = f.read()
+        consistent = all(open(path, 'rb').read() == expected for path in outputs)
+        print(f"各进程数输出与整体清洗{'一致' if consistent else '不一致'}")
+
+
+def bench_formats(rows, repeats=3):
+    """各格式的文件大小与冷加载耗时（每次在新进程中加载，取最短耗时）"""
+    cleaned = clean_frame(synthetic_frame(rows).drop_duplicates())
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'cleaned.csv')
+        cleaned.to_csv(csv_path, index=False, encoding='utf-8-sig')
+        paths = [csv_path] + [write_columnar(cleaned, os.path.join(tmp, 'cleaned' + extension))
+                              for extension in ('.parquet', '.feather', '.npz')]
+        print(f"清洗后数据: {len(cleaned)} 行")
+        for path in dict.fromkeys(paths):
+            code = f"sys.path.insert(0, {project_dir!r}); from visual.dataset import load_dataset; load_dataset({path!r})"
+            elapsed = min(peak_rss_mb(code)[1] for _ in range(repeats))
+            print(f"{os.path.splitext(path)[1]:>9}：{os.path.getsize(path) / 2 ** 20:6.1f} MB，冷加载 {elapsed:.2f} 秒")
+
+
+def bench_incremental(rows, change_ratio=0.01):
+    """模拟每日重爬：删除、修改、新增各约 change_ratio 的行，对比整体清洗与增量清洗"""
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_path = os.path.join(tmp, 'raw.csv')
+        df = write_synthetic_csv(raw_path, rows)
+        output_path = os.path.join(tmp, 'cleaned.csv')
+        _, first_run = peak_rss_mb(f"clean_zhilian_data_incremental({raw_path!r}, {output_path!r})")
+        print(f"首次增量清洗（无清单）：{first_run:.1f} 秒")
+
+        changed = int(rows * change_ratio)
+        df = df.iloc[changed:].copy()
+        df.iloc[:changed, df.columns.get_loc('薪资')] = '1-2万'
+        added = df.iloc[-changed:].copy()
+        added['工作名称'] = added['工作名称'] + '（新）'
+        pd.concat([df, added]).to_csv(raw_path, index=False, encoding='utf-8-sig')
+        del df, added
+
+        full_path = os.path.join(tmp, 'full.csv')
+        _, full_time = peak_rss_mb(f"clean_zhilian_data({raw_path!r}, {full_path!r})")
+        script = f"stats = clean_zhilian_data_incremental({raw_path!r}, {output_path!r})"
+        _, incremental_time = peak_rss_mb(script)
+        with open(full_path, 'rb') as a, open(output_path, 'rb') as b:
+            same = a.read() == b.read()
+        print(f"重爬后（删除/修改/新增各 {changed} 行）：整体清洗 {full_time:.1f} 秒，"
+              f"增量清洗 {incremental_time:.1f} 秒，输出{'一致' if same else '不一致'}")
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def mismatches(expected, actual):
+    """逐值比较两个序列（缺失值视为相等），返回不一致的数量"""
+    both_missing = expected.isna().to_numpy() & actual.isna().to_numpy()
+    differ = expected.astype(object).to_numpy() != actual.astype(object).to_numpy()
+    return int((differ & ~both_missing).sum())
+
+
+def bench_salary(df):
+    legacy, legacy_time = timed(df['薪资'].apply, clean_salary)
+    vectorized, vectorized_time = timed(clean_salary_column, df['薪资'])
+    print(f"薪资清洗：逐行 {legacy_time:.2f} 秒，向量化 {vectorized_time:.2f} 秒，"
+          f"加速 {legacy_time / vectorized_time:.1f}x，不一致 {mismatches(legacy, vectorized['薪资'])} 条")
+
+
+def bench_location(df):
+    companies = df['公司名称']
+    # 每行加上不含城市名的编号后缀，模拟几乎没有重复公司的最坏情况
+    unique_companies = companies.astype(str) + '（' + pd.Series(range(len(companies))).astype(str) + '）'
+    for label, column in (('原始分布', companies), ('名称全不同', unique_companies)):
+        legacy, legacy_time = timed(column.apply, legacy_extract_location)
+        per_row, per_row_time = timed(column.apply, extract_location_from_company)
+        vectorized, vectorized_time = timed(extract_location_column, column)
+        print(f"地址标准化（{label}，{column.nunique()} 个不同公司）：旧实现 {legacy_time:.2f} 秒，"
+              f"编译正则逐行 {per_row_time:.2f} 秒（{legacy_time / per_row_time:.1f}x），"
+              f"向量化 {vectorized_time:.2f} 秒（{legacy_time / vectorized_time:.1f}x），"
+              f"不一致 {mismatches(legacy, per_row) + mismatches(legacy, vectorized)} 条")
+
+
+def bench_categories(df):
+    columns = [
+        ('学历', '学历', clean_education, education_categories, True),
+        ('经验要求', '经验要求', clean_experience, experience_categories, True),
+        ('公司规模', '公司规模', clean_company_size, company_size_categories, True),
+        ('职位分类', '关键词', classify_job, job_class_categories, False),
+    ]
+    for name, source, normalize, categories, ordered in columns:
+        per_row, per_row_time = timed(df[source].apply, normalize)
+        categorical, categorical_time = timed(categorize_column, df[source], normalize, categories, ordered)
+        per_row_memory = per_row.memory_usage(deep=True) / 2 ** 20
+        categorical_memory = categorical.memory_usage(deep=True) / 2 ** 20
+        print(f"{name}：逐行 {per_row_time:.2f} 秒 / {per_row_memory:.1f} MB，"
+              f"查表 {categorical_time:.3f} 秒 / {categorical_memory:.1f} MB，"
+              f"加速 {per_row_time / categorical_time:.0f}x，不一致 {mismatches(per_row, categorical)} 条")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='数据清洗基准测试')
+    parser.add_argument('--rows', type=int, default=1000000, help='放大后的数据行数')
+    parser.add_argument('--memory', action='store_true', help='对比整体清洗与分块清洗的峰值内存')
+    parser.add_argument('--scaling', action='store_true', help='多进程清洗在 1/2/4/8 个进程下的扩展性')
+    parser.add_argument('--formats', action='store_true', help='对比CSV与列式格式的文件大小和冷加载耗时')
+    parser.add_argument('--incremental', action='store_true', help='每日重爬 1%% 变化时增量清洗的耗时')
+    args = parser.parse_args()
+
+    if args.incremental:
+        bench_incremental(args.rows)
+        sys.exit(0)
+    if args.formats:
+        bench_formats(args.rows)
+        sys.exit(0)
+    if args.scaling:
+        bench_scaling(args.rows)
+        sys.exit(0)
+
+    if args.memory:
+        bench_memory(args.rows)
+        sys.exit(0)
+
+    data = load_scaled(args.rows)
+    print(f"数据行数: {len(data)}")
+    bench_salary(data)
+    bench_location(data)
+    bench_categories(data)
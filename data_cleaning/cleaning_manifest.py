@@ -0,0 +1,124 @@
+"""
+增量清洗清单
+
+以追加写入的CSV记录每个原始行哈希及其清洗结果（已按输出格式渲染好的CSV行文本）：
+    op 为 '+' 的记录登记一条清洗结果，op 为 '-' 的记录是墓碑，表示该原始行已不在最新数据中。
+同一哈希以最后一条记录为准。重新清洗时只有清单中没有的原始行需要经过清洗函数，
+其余直接复用清单中的行文本，无需再解析和格式化；墓碑过多时整体重写清单以回收空间。
+首条记录保存清洗规则的指纹与输出表头，规则变更后清单自动作废。
+"""
+import csv
+import io
+import os
+
+import numpy as np
+import pandas as pd
+
+# 清单中的记录类型
+op_add = '+'
+op_tombstone = '-'
+op_rules = '='
+
+
+def render_csv_lines(df):
+    """把数据框逐行渲染为CSV行文本（不含换行符），格式与 DataFrame.to_csv 一致"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    lines = []
+    for row in df.astype(object).itertuples(index=False, name=None):
+        writer.writerow(['' if pd.isna(value) else value for value in row])
+        lines.append(buffer.getvalue()[:-1])
+        buffer.seek(0)
+        buffer.truncate()
+    return lines
+
+
+class CleaningManifest:
+    """原始行哈希 -> 清洗后CSV行 的增量清单"""
+
+    def __init__(self, path, header, rules_fingerprint):
+        """
+        Args:
+            path (str): 清单文件路径（.manifest.csv）
+            header (str): 清洗后CSV的表头行
+            rules_fingerprint (str): 清洗规则指纹，与清单记录的不一致时丢弃旧清单
+        """
+        self.path = path
+        self.signature = f"{rules_fingerprint}:{header}"
+        self.lines = pd.Series([], index=pd.Index([], dtype=np.uint64), dtype=object)
+        self.records = 0    # 清单文件中的记录数（含墓碑与被覆盖的记录）
+        self.invalidated = False
+        self._load()
+
+    @staticmethod
+    def path_for(output_file):
+        """与清洗后CSV放在一起的清单文件路径"""
+        return os.path.splitext(output_file)[0] + '.manifest.csv'
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        log = pd.read_csv(self.path, encoding='utf-8', dtype={'row_hash': np.uint64, 'op': str, 'line': object},
+                          keep_default_na=False)
+        if log.empty or log['op'].iloc[0] != op_rules or log['line'].iloc[0] != self.signature:
+            # 清洗规则或输出列已变化，旧结果不可复用
+            self.invalidated = True
+            return
+        log = log.iloc[1:]
+        self.records = len(log)
+        latest = log.drop_duplicates('row_hash', keep='last')
+        latest = latest[latest['op'] == op_add]
+        self.lines = pd.Series(latest['line'].to_numpy(), index=pd.Index(latest['row_hash'].to_numpy()))
+
+    def contains(self, hashes):
+        """返回布尔掩码，标记清单中已有清洗结果的哈希"""
+        return pd.Index(hashes).isin(self.lines.index)
+
+    def missing_from(self, hashes):
+        """清单中有、但不在给定哈希中的哈希（即原始数据中已删除的行）"""
+        return self.lines.index[~self.lines.index.isin(hashes)].to_numpy()
+
+    def lookup(self, hashes):
+        """按给定哈希顺序取出清洗后的CSV行"""
+        return self.lines.reindex(hashes).to_numpy()
+
+    def update(self, new_hashes, new_lines, removed_hashes):
+        """
+        追加新的清洗结果并为已删除的原始行写墓碑
+
+        Args:
+            new_hashes (np.ndarray): 新清洗的原始行哈希
+            new_lines (list): 对应的清洗后CSV行
+            removed_hashes (np.ndarray): 不再出现在原始数据中的哈希
+        """
+        additions = pd.Series(new_lines, index=pd.Index(new_hashes, dtype=np.uint64), dtype=object)
+        kept = self.lines.drop(removed_hashes)
+        self.lines = pd.concat([kept, additions]) if len(additions) else kept
+
+        # 墓碑与被覆盖的记录超过有效记录时整体重写，否则只追加
+        dead = self.records + len(new_hashes) + len(removed_hashes) - len(self.lines)
+        if self.invalidated or not os.path.exists(self.path) or dead > len(self.lines):
+            self._rewrite()
+            return
+        log = pd.concat([
+            self._log_frame(new_hashes, op_add, new_lines),
+            self._log_frame(removed_hashes, op_tombstone, [''] * len(removed_hashes)),
+        ])
+        log.to_csv(self.path, mode='a', header=False, index=False, encoding='utf-8')
+        self.records += len(log)
+
+    @staticmethod
+    def _log_frame(hashes, op, lines):
+        return pd.DataFrame({'row_hash': np.asarray(hashes, dtype=np.uint64), 'op': op,
+                             'line': pd.Series(lines, dtype=object)})
+
+    def _rewrite(self):
+        log = pd.concat([
+            self._log_frame([0], op_rules, [self.signature]),
+            self._log_frame(self.lines.index.to_numpy(), op_add, self.lines.to_numpy()),
+        ])
+        temp_path = self.path + '.tmp'
+        log.to_csv(temp_path, index=False, encoding='utf-8')
+        os.replace(temp_path, self.path)
+        self.records = len(self.lines)
+        self.invalidated = False
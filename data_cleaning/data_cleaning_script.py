@@ -1,262 +1,481 @@
+import argparse
+import collections
+import csv
+import hashlib
+import io
+import os
 import pandas as pd
 import re
+import sys
 import numpy as np
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-def clean_zhilian_data(input_file, output_file):
-    """
-    清洗智联招聘数据
-    """
-    # 读取CSV文件
-    df = pd.read_csv(input_file, encoding='utf-8-sig')
-    
-    # 1. 去重处理
-    print(f"原始数据行数: {len(df)}")
-    df = df.drop_duplicates()
-    print(f"去重后数据行数: {len(df)}")
-    
-    # 2. 数据清洗和标准化
-    
-    # 清理薪资字段 - 确保不出现日期格式，并正确处理"万"单位
-    def clean_salary(salary):
-        if pd.isna(salary) or salary == '面议':
-            return np.nan
-        
-        # 转换为字符串处理
-        salary_str = str(salary)
-        
-        # 检查是否是日期格式，如果是则返回NaN
-        try:
-            # 尝试解析为日期，如果成功说明是日期格式
-            datetime.strptime(salary_str, '%Y/%m/%d')
-            return np.nan  # 如果是日期格式，返回NaN
-        except ValueError:
-            # 不是日期格式，继续处理
-            pass
-        
-        # 提取薪资范围
-        salary_clean = salary_str.replace('·13薪', '').replace('·14薪', '').replace('·15薪', '')
-        
-        # 处理"万"单位，将其转换为具体数字
-        if '万' in salary_clean:
-            # 匹配"1-2万"或"1.5-2万"等格式
-            match = re.search(r'([\d\.]+)[-~]?([\d\.]+)?万', salary_clean)
-            if match:
-                low = float(match.group(1))
-                high = float(match.group(2)) if match.group(2) else low
-                # 转换为元
-                low = int(low * 10000)
-                high = int(high * 10000)
-                return f"{low}-{high}"
-        
-        # 处理"千"单位
-        elif '千' in salary_clean:
-            match = re.search(r'([\d\.]+)[-~]?([\d\.]+)?千', salary_clean)
-            if match:
-                low = float(match.group(1))
-                high = float(match.group(2)) if match.group(2) else low
-                # 转换为元
-                low = int(low * 1000)
-                high = int(high * 1000)
-                return f"{low}-{high}"
-        
-        # 处理直接以元为单位的格式
-        else:
-            match = re.search(r'(\d+)[-~]?(\d+)?', salary_clean.replace('元', ''))
-            if match:
-                low = match.group(1)
-                high = match.group(2) if match.group(2) else low
-                # 转换为数字
-                try:
-                    low = int(low)
-                    high = int(high)
-                    return f"{low}-{high}"
-                except:
-                    return np.nan
-        
+from cleaning_manifest import CleaningManifest, render_csv_lines
+
+# 项目根目录，用于导入 visual.dataset 写出列式格式
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 清洗后数据的列顺序
+columns_order = ['职位分类', '关键词', '工作名称', '公司名称', '地区', '学历', '薪资', '经验要求',
+                 '公司性质', '公司规模', '工作类型']
+# 数值化薪资列（元/月），追加在清洗后数据的末尾
+salary_columns = ['salary_low', 'salary_high', 'salary_mid']
+
+
+# 清理薪资字段 - 确保不出现日期格式，并正确处理"万"单位
+def clean_salary(salary):
+    if pd.isna(salary) or salary == '面议':
         return np.nan
     
-    # 清理学历字段
-    def clean_education(edu):
-        if pd.isna(edu):
-            return edu
-        edu = str(edu)
-        if '本科' in edu:
-            return '本科'
-        elif '硕士' in edu:
-            return '硕士'
-        elif '博士' in edu:
-            return '博士'
-        elif '大专' in edu:
-            return '大专'
-        elif '中专' in edu or '中技' in edu:
-            return '中专/中技'
-        elif '学历不限' in edu or '无' in edu:
-            return '不限'
-        else:
-            return edu
+    # 转换为字符串处理
+    salary_str = str(salary)
     
-    # 清理经验字段
-    def clean_experience(exp):
-        if pd.isna(exp):
-            return exp
-        exp = str(exp)
-        if '无经验' in exp or '不限' in exp:
-            return '无经验'
-        elif '1-3年' in exp:
-            return '1-3年'
-        elif '3-5年' in exp:
-            return '3-5年'
-        elif '5-10年' in exp or '5年以上' in exp:
-            return '5-10年'
-        elif '10年以上' in exp:
-            return '10年以上'
-        elif '1年以下' in exp:
-            return '1年以下'
-        else:
-            return exp
+    # 检查是否是日期格式，如果是则返回NaN
+    try:
+        # 尝试解析为日期，如果成功说明是日期格式
+        datetime.strptime(salary_str, '%Y/%m/%d')
+        return np.nan  # 如果是日期格式，返回NaN
+    except ValueError:
+        # 不是日期格式，继续处理
+        pass
     
-    # 清理公司规模字段
-    def clean_company_size(size):
-        if pd.isna(size):
-            return size
-        size = str(size)
-        if '10000人以上' in size:
-            return '10000人以上'
-        elif '1000-9999人' in size:
-            return '1000-9999人'
-        elif '500-999人' in size:
-            return '500-999人'
-        elif '100-299人' in size:
-            return '100-299人'
-        elif '20-99人' in size:
-            return '20-99人'
-        elif '20人以下' in size:
-            return '20人以下'
-        else:
-            return size
+    # 提取薪资范围
+    salary_clean = salary_str.replace('·13薪', '').replace('·14薪', '').replace('·15薪', '')
     
-    # 应用清洗函数
-    df['薪资'] = df['薪资'].apply(clean_salary)
-    df['学历'] = df['学历'].apply(clean_education)
-    df['经验要求'] = df['经验要求'].apply(clean_experience)
-    df['公司规模'] = df['公司规模'].apply(clean_company_size)
+    # 处理"万"单位，将其转换为具体数字
+    if '万' in salary_clean:
+        # 匹配"1-2万"或"1.5-2万"等格式
+        match = re.search(r'([\d\.]+)[-~]?([\d\.]+)?万', salary_clean)
+        if match:
+            low = float(match.group(1))
+            high = float(match.group(2)) if match.group(2) else low
+            # 转换为元
+            low = int(low * 10000)
+            high = int(high * 10000)
+            return f"{low}-{high}"
     
-    # 3. 分类处理
-    # 根据关键词对职位进行分类
-    def classify_job(keyword):
-        keyword = str(keyword)
-        if 'python' in keyword.lower():
-            return 'Python开发'
-        elif 'java' in keyword.lower():
-            return 'Java开发'
-        elif '前端' in keyword:
-            return '前端开发'
-        elif '后端' in keyword:
-            return '后端开发'
-        elif '算法' in keyword:
-            return '算法工程师'
-        elif '大数据' in keyword:
-            return '大数据工程师'
-        elif '人工智能' in keyword:
-            return '人工智能工程师'
-        elif '云计算' in keyword:
-            return '云计算工程师'
-        elif '网络安全' in keyword or '安全' in keyword:
-            return '网络安全工程师'
-        elif '数据分析师' in keyword:
-            return '数据分析师'
-        elif '产品经理' in keyword:
-            return '产品经理'
-        elif '运维' in keyword:
-            return '运维工程师'
-        elif '系统架构' in keyword:
-            return '系统架构师'
-        elif '测试' in keyword:
-            return '测试工程师'
-        else:
-            return '其他计算机职位'
+    # 处理"千"单位
+    elif '千' in salary_clean:
+        match = re.search(r'([\d\.]+)[-~]?([\d\.]+)?千', salary_clean)
+        if match:
+            low = float(match.group(1))
+            high = float(match.group(2)) if match.group(2) else low
+            # 转换为元
+            low = int(low * 1000)
+            high = int(high * 1000)
+            return f"{low}-{high}"
     
-    df['职位分类'] = df['关键词'].apply(classify_job)
+    # 处理直接以元为单位的格式
+    else:
+        match = re.search(r'(\d+)[-~]?(\d+)?', salary_clean.replace('元', ''))
+        if match:
+            low = match.group(1)
+            high = match.group(2) if match.group(2) else low
+            # 转换为数字
+            try:
+                low = int(low)
+                high = int(high)
+                return f"{low}-{high}"
+            except:
+                return np.nan
+    
+    return np.nan
+
+
+# 向量化薪资清洗使用的正则，与 clean_salary 中逐行使用的完全一致
+salary_date_pattern = r'\d{4}/\d{1,2}/\d{1,2}'
+salary_unit_patterns = [
+    ('万', r'([\d\.]+)[-~]?([\d\.]+)?万', 10000),
+    ('千', r'([\d\.]+)[-~]?([\d\.]+)?千', 1000),
+]
+salary_yuan_pattern = r'(\d+)[-~]?(\d+)?'
+# 浮点数能精确表示的整数上限，超出时数值列记为缺失（远小于 Int64 上限，不会溢出）
+salary_exact_limit = 2 ** 53
+
+
+def _is_date(text):
+    try:
+        datetime.strptime(text, '%Y/%m/%d')
+        return True
+    except ValueError:
+        return False
+
+
+def _parse_float(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _to_float(values):
+    """
+    把提取出的数字文本转为浮点数，无法转换的为 NaN
+
+    正则中的 \\d 也匹配全角等 Unicode 数字，pd.to_numeric 不认这些数字，
+    这类取值改用 float() 转换，与 clean_salary 中的 int()/float() 结果一致。
+    """
+    numbers = pd.to_numeric(values, errors='coerce')
+    retry = numbers.isna() & values.notna()
+    if retry.any():
+        numbers[retry] = values[retry].map(_parse_float)
+    return numbers
+
+
+def _decode_salaries(text):
+    """对去重后的薪资文本提取上下限（元），返回两个浮点数组，无法解析处为 NaN"""
+    low = pd.Series(np.nan, index=text.index)
+    high = pd.Series(np.nan, index=text.index)
+
+    text = text[text != '面议']
+
+    # 只有形如 yyyy/m/d 的值才需要按日期解析确认，数量很少
+    maybe_date = text.str.fullmatch(salary_date_pattern)
+    if maybe_date.any():
+        is_date = text[maybe_date].map(_is_date)
+        text = text.drop(is_date.index[is_date])
+
+    text = text.str.replace('·13薪', '', regex=False).str.replace('·14薪', '', regex=False) \
+        .str.replace('·15薪', '', regex=False)
+
+    remaining = pd.Series(True, index=text.index)
+    for unit, pattern, scale in salary_unit_patterns:
+        has_unit = remaining & text.str.contains(unit, regex=False)
+        remaining &= ~has_unit
+        match = text[has_unit].str.extract(pattern)
+        unit_low = _to_float(match[0])
+        unit_high = _to_float(match[1]).fillna(unit_low)
+        # 与 int() 一致，换算后向零截断
+        low[match.index] = np.trunc(unit_low.to_numpy(dtype=float) * scale)
+        high[match.index] = np.trunc(unit_high.to_numpy(dtype=float) * scale)
+
+    match = text[remaining].str.replace('元', '', regex=False).str.extract(salary_yuan_pattern)
+    yuan_low = _to_float(match[0])
+    low[match.index] = yuan_low
+    high[match.index] = _to_float(match[1]).fillna(yuan_low)
+    return low.to_numpy(dtype=float), high.to_numpy(dtype=float)
+
+
+def clean_salary_column(salary):
+    """
+    向量化的薪资清洗，结果与逐行调用 clean_salary 一致
+
+    爬取数据中不同的薪资写法很少，先对整列 factorize，只对去重后的取值做字符串提取：
+    剔除面议与日期格式，去掉"·N薪"，再按 万/千/元 三种单位各提取一次上下限并换算为元，
+    最后用编码数组一次性映射回每一行。
+    上下限超出 2**53（浮点数无法精确表示）的取值数值列记为缺失，字符串列逐个调用 clean_salary 得到；
+    位数多到换算为无穷大的取值视为无法解析（clean_salary 对这类取值会抛出 OverflowError）。
+
+    Args:
+        salary (pd.Series): 原始薪资列
+
+    Returns:
+        pd.DataFrame: 与输入同索引，包含 salary_low/salary_high/salary_mid（可空整数）
+                      以及兼容旧格式的"下限-上限"字符串列 薪资
+    """
+    codes, uniques = pd.factorize(salary)
+    unique_text = pd.Series(uniques, dtype=object).astype(str)
+    unique_low, unique_high = _decode_salaries(unique_text)
+    unique_valid = np.isfinite(unique_low) & np.isfinite(unique_high)
+    exact = unique_valid & (np.abs(unique_low) < salary_exact_limit) & (np.abs(unique_high) < salary_exact_limit)
+    unique_legacy = np.full(len(uniques), np.nan, dtype=object)
+    unique_legacy[exact] = [f"{int(l)}-{int(h)}" for l, h in zip(unique_low[exact], unique_high[exact])]
+    # 超大取值极少，字符串按逐行规则计算以保留全部位数，数值列置为缺失
+    for i in np.flatnonzero(unique_valid & ~exact):
+        unique_legacy[i] = clean_salary(uniques[i])
+    unique_low = np.where(exact, unique_low, np.nan)
+    unique_high = np.where(exact, unique_high, np.nan)
+
+    # 缺失值的编码为 -1，映射到末尾追加的 NaN 槽位
+    unique_low = np.append(unique_low, np.nan)
+    unique_high = np.append(unique_high, np.nan)
+    unique_legacy = np.append(unique_legacy, np.nan)
+    low = pd.array(unique_low[codes], dtype='Int64')
+    high = pd.array(unique_high[codes], dtype='Int64')
+    return pd.DataFrame({
+        'salary_low': low,
+        'salary_high': high,
+        'salary_mid': (low + high) // 2,
+        '薪资': unique_legacy[codes],
+    }, index=salary.index)
+
+
+# 类别字段的有序规则表：(关键词, 标准值)，按顺序取第一条有关键词包含在原始值中的规则
+education_rules = [
+    (('本科',), '本科'),
+    (('硕士',), '硕士'),
+    (('博士',), '博士'),
+    (('大专',), '大专'),
+    (('中专', '中技'), '中专/中技'),
+    (('学历不限', '无'), '不限'),
+]
+experience_rules = [
+    (('无经验', '不限'), '无经验'),
+    (('1-3年',), '1-3年'),
+    (('3-5年',), '3-5年'),
+    (('5-10年', '5年以上'), '5-10年'),
+    (('10年以上',), '10年以上'),
+    (('1年以下',), '1年以下'),
+]
+company_size_rules = [
+    (('10000人以上',), '10000人以上'),
+    (('1000-9999人',), '1000-9999人'),
+    (('500-999人',), '500-999人'),
+    (('100-299人',), '100-299人'),
+    (('20-99人',), '20-99人'),
+    (('20人以下',), '20人以下'),
+]
+# 职位分类按小写后的关键词匹配
+job_class_rules = [
+    (('python',), 'Python开发'),
+    (('java',), 'Java开发'),
+    (('前端',), '前端开发'),
+    (('后端',), '后端开发'),
+    (('算法',), '算法工程师'),
+    (('大数据',), '大数据工程师'),
+    (('人工智能',), '人工智能工程师'),
+    (('云计算',), '云计算工程师'),
+    (('网络安全', '安全'), '网络安全工程师'),
+    (('数据分析师',), '数据分析师'),
+    (('产品经理',), '产品经理'),
+    (('运维',), '运维工程师'),
+    (('系统架构',), '系统架构师'),
+    (('测试',), '测试工程师'),
+]
+
+# 清洗后类别列的固定顺序，学历、经验、公司规模按从低到高排列；
+# 规则表之外的原始值（如"高中"）保持原样，追加在已知类别之后
+education_categories = ['不限', '初中及以下', '高中', '中专/中技', '大专', '本科', '硕士', '博士']
+experience_categories = ['无经验', '1年以下', '1-3年', '3-5年', '5-10年', '10年以上']
+company_size_categories = ['20人以下', '20-99人', '100-299人', '300-499人', '500-999人', '1000-9999人', '10000人以上']
+job_class_categories = [result for _, result in job_class_rules] + ['其他计算机职位']
+
+
+def match_rules(text, rules, default=None):
+    """按有序规则表归一化一个取值，没有规则命中时返回 default（为 None 时返回原值）"""
+    for keywords, result in rules:
+        for keyword in keywords:
+            if keyword in text:
+                return result
+    return text if default is None else default
+
+
+# 清理学历字段
+def clean_education(edu):
+    if pd.isna(edu):
+        return edu
+    return match_rules(str(edu), education_rules)
+
+
+# 清理经验字段
+def clean_experience(exp):
+    if pd.isna(exp):
+        return exp
+    return match_rules(str(exp), experience_rules)
+
+
+# 清理公司规模字段
+def clean_company_size(size):
+    if pd.isna(size):
+        return size
+    return match_rules(str(size), company_size_rules)
+
+
+# 根据关键词对职位进行分类
+def classify_job(keyword):
+    return match_rules(str(keyword).lower(), job_class_rules, default='其他计算机职位')
+
+
+def categorize_column(column, normalize, categories, ordered=True):
+    """
+    对类别列的每个不同原始值只调用一次 normalize，再用编码映射回整列
+
+    Args:
+        column (pd.Series): 原始列
+        normalize (callable): 单个取值的归一化函数，如 clean_education
+        categories (list): 固定的类别顺序，未覆盖的结果按首次出现顺序追加在后面
+        ordered (bool): 是否为有序类别
+
+    Returns:
+        pd.Series: 与输入同索引的 Categorical 列，缺失值保持缺失
+    """
+    codes, uniques = pd.factorize(column)
+    results = [normalize(value) for value in uniques]
+    extra = [value for value in dict.fromkeys(results) if not pd.isna(value) and value not in categories]
+    dtype = pd.CategoricalDtype(list(categories) + extra, ordered=ordered)
+    # 缺失值的编码为 -1，对 normalize(缺失值) 的结果单独映射
+    missing = normalize(np.nan)
+    lookup = np.array([dtype.categories.get_loc(value) if not pd.isna(value) else -1
+                       for value in results + [missing]], dtype=np.int64)
+    return pd.Series(pd.Categorical.from_codes(lookup[codes], dtype=dtype), index=column.index)
+
+
+# 常见城市列表，按字典顺序决定优先级：公司名称包含多个城市时取最先列出的
+city_keywords = {
+    # 陕西省
+    '西安': ['西安', '西安市'],
+    '咸阳': ['咸阳', '咸阳市'],
+    '宝鸡': ['宝鸡', '宝鸡市'],
+    '渭南': ['渭南', '渭南市'],
+    '铜川': ['铜川', '铜川市'],
+    '延安': ['延安', '延安市'],
+    '榆林': ['榆林', '榆林市'],
+    '汉中': ['汉中', '汉中市'],
+    '安康': ['安康', '安康市'],
+    '商洛': ['商洛', '商洛市'],
     
-    # 4. 地址标准化 - 根据公司名称提取省份或城市
-    def extract_location_from_company(company_name):
-        if pd.isna(company_name):
-            return '西安'
-        
-        company_name = str(company_name)
-        
-        # 常见城市列表
-        cities = {
-            # 陕西省
-            '西安': ['西安', '西安市'],
-            '咸阳': ['咸阳', '咸阳市'],
-            '宝鸡': ['宝鸡', '宝鸡市'],
-            '渭南': ['渭南', '渭南市'],
-            '铜川': ['铜川', '铜川市'],
-            '延安': ['延安', '延安市'],
-            '榆林': ['榆林', '榆林市'],
-            '汉中': ['汉中', '汉中市'],
-            '安康': ['安康', '安康市'],
-            '商洛': ['商洛', '商洛市'],
-            
-            # 其他常见省份/城市
-            '北京': ['北京'],
-            '上海': ['上海'],
-            '广州': ['广州'],
-            '深圳': ['深圳'],
-            '杭州': ['杭州'],
-            '南京': ['南京'],
-            '成都': ['成都'],
-            '武汉': ['武汉'],
-            '重庆': ['重庆'],
-            '天津': ['天津'],
-            '青岛': ['青岛'],
-            '大连': ['大连'],
-            '厦门': ['厦门'],
-            '苏州': ['苏州'],
-            '无锡': ['无锡'],
-            '郑州': ['郑州'],
-            '长沙': ['长沙'],
-            '济南': ['济南'],
-            '合肥': ['合肥'],
-            '福州': ['福州'],
-            '南昌': ['南昌'],
-            '石家庄': ['石家庄'],
-            '太原': ['太原'],
-            '呼和浩特': ['呼和浩特'],
-            '沈阳': ['沈阳'],
-            '长春': ['长春'],
-            '哈尔滨': ['哈尔滨'],
-            '南宁': ['南宁'],
-            '海口': ['海口'],
-            '贵阳': ['贵阳'],
-            '昆明': ['昆明'],
-            '拉萨': ['拉萨'],
-            '兰州': ['兰州'],
-            '银川': ['银川'],
-            '西宁': ['西宁'],
-            '乌鲁木齐': ['乌鲁木齐']
-        }
-        
-        # 遍历城市列表，检查公司名称中是否包含城市关键词
-        for city, keywords in cities.items():
-            for keyword in keywords:
-                if keyword in company_name:
-                    return city
-        
-        # 如果没找到匹配的城市，默认返回西安
+    # 其他常见省份/城市
+    '北京': ['北京'],
+    '上海': ['上海'],
+    '广州': ['广州'],
+    '深圳': ['深圳'],
+    '杭州': ['杭州'],
+    '南京': ['南京'],
+    '成都': ['成都'],
+    '武汉': ['武汉'],
+    '重庆': ['重庆'],
+    '天津': ['天津'],
+    '青岛': ['青岛'],
+    '大连': ['大连'],
+    '厦门': ['厦门'],
+    '苏州': ['苏州'],
+    '无锡': ['无锡'],
+    '郑州': ['郑州'],
+    '长沙': ['长沙'],
+    '济南': ['济南'],
+    '合肥': ['合肥'],
+    '福州': ['福州'],
+    '南昌': ['南昌'],
+    '石家庄': ['石家庄'],
+    '太原': ['太原'],
+    '呼和浩特': ['呼和浩特'],
+    '沈阳': ['沈阳'],
+    '长春': ['长春'],
+    '哈尔滨': ['哈尔滨'],
+    '南宁': ['南宁'],
+    '海口': ['海口'],
+    '贵阳': ['贵阳'],
+    '昆明': ['昆明'],
+    '拉萨': ['拉萨'],
+    '兰州': ['兰州'],
+    '银川': ['银川'],
+    '西宁': ['西宁'],
+    '乌鲁木齐': ['乌鲁木齐']
+}
+
+# 地区匹配器：所有城市关键词编译为一个按长度降序排列的正则分支，整张表只构建一次。
+# 某位置命中较长关键词时，作为其前缀的较短关键词也必然命中，因此每个关键词的优先级
+# 取其自身及其前缀关键词中最高的一个
+city_ranks = {}
+for city_priority, (city, keyword) in enumerate((city, keyword) for city, keywords in city_keywords.items()
+                                                for keyword in keywords):
+    city_ranks.setdefault(keyword, (city_priority, city))
+city_match_ranks = {keyword: min(rank for prefix, rank in city_ranks.items() if keyword.startswith(prefix))
+                    for keyword in city_ranks}
+city_pattern = re.compile('|'.join(re.escape(keyword) for keyword in sorted(city_ranks, key=len, reverse=True)))
+
+
+# 地址标准化 - 根据公司名称提取省份或城市
+def extract_location_from_company(company_name):
+    if pd.isna(company_name):
         return '西安'
+
+    company_name = str(company_name)
+    best = None
+    match = city_pattern.search(company_name)
+    while match:
+        rank = city_match_ranks[match.group()]
+        if best is None or rank < best:
+            best = rank
+        # 从命中位置的下一个字符继续查找，以免漏掉与本次命中重叠的城市
+        match = city_pattern.search(company_name, match.start() + 1)
+    if best is not None:
+        return best[1]
+
+    # 如果没找到匹配的城市，默认返回西安
+    return '西安'
+
+
+def extract_location_column(company):
+    """
+    向量化的地址标准化，结果与逐行调用 extract_location_from_company 一致
+
+    同一公司会发布多个职位，先对公司名称 factorize，每个不同的名称只匹配一次，再按编码映射回每一行
+
+    Args:
+        company (pd.Series): 公司名称列
+
+    Returns:
+        pd.Series: 与输入同索引的城市列
+    """
+    codes, uniques = pd.factorize(company)
+    # 缺失值的编码为 -1，对应末尾追加的默认城市
+    locations = np.array([extract_location_from_company(name) for name in uniques] + ['西安'], dtype=object)
+    return pd.Series(locations[codes], index=company.index)
+
+
+def clean_frame(df):
+    """
+    对原始数据框执行字段清洗、职位分类与地址标准化，返回按输出列顺序排列的新数据框（不去重），
+    数值化薪资列追加在最后
+    """
+    df = df.copy()
+
+    # 应用清洗函数
+    salary = clean_salary_column(df['薪资'])
+    df['薪资'] = salary['薪资']
+    df[salary_columns] = salary[salary_columns]
+    df['学历'] = categorize_column(df['学历'], clean_education, education_categories)
+    df['经验要求'] = categorize_column(df['经验要求'], clean_experience, experience_categories)
+    df['公司规模'] = categorize_column(df['公司规模'], clean_company_size, company_size_categories)
+
+    # 分类处理：根据关键词对职位进行分类
+    df['职位分类'] = categorize_column(df['关键词'], classify_job, job_class_categories, ordered=False)
+
+    # 地址标准化：根据公司名称提取省份或城市
+    df['地区'] = extract_location_column(df['公司名称'])
+
+    # 重新排序列
+    return df[columns_order + salary_columns]
+
+
+def write_columnar(df, path):
+    """
+    把清洗后的数据另存为列式格式（.parquet / .feather / .npz），供可视化直接加载
+
+    Returns:
+        str: 实际写入的路径（缺少 pyarrow 时 .parquet/.feather 改存为 .npz）
+    """
+    if project_dir not in sys.path:
+        sys.path.insert(0, project_dir)
+    from visual.dataset import write_dataset
+    return write_dataset(df, path)
+
+
+def clean_zhilian_data(input_file, output_file, columnar_file=None):
+    """
+    清洗智联招聘数据
+
+    Args:
+        columnar_file (str): 额外写出的列式数据文件路径，为 None 时只写CSV
+    """
+    # 读取CSV文件
+    df = pd.read_csv(input_file, encoding='utf-8-sig')
     
-    df['地区'] = df['公司名称'].apply(extract_location_from_company)
+    # 1. 去重处理
+    print(f"原始数据行数: {len(df)}")
+    df = df.drop_duplicates()
+    print(f"去重后数据行数: {len(df)}")
     
-    # 5. 重新排序列
-    columns_order = ['职位分类', '关键词', '工作名称', '公司名称', '地区', '学历', '薪资', '经验要求', 
-                     '公司性质', '公司规模', '工作类型']
-    df = df[columns_order]
+    # 2. 数据清洗和标准化、3. 分类处理、4. 地址标准化、5. 重新排序列
+    df = clean_frame(df)
     
     # 6. 保存清洗后的数据
     df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    if columnar_file:
+        columnar_file = write_columnar(df, columnar_file)
     
     # 7. 输出统计信息
     print("\n数据清洗完成！")
@@ -266,11 +485,331 @@ def clean_zhilian_data(input_file, output_file):
     print(f"\n地区分布统计:")
     print(df['地区'].value_counts())
     print(f"\n数据已保存到: {output_file}")
+    if columnar_file:
+        print(f"列式数据已保存到: {columnar_file}")
     
     return df
 
+class RowHashSet:
+    """
+    跨分块去重用的64位行哈希集合
+
+    已出现的行哈希保存为若干有序 uint64 数组（run），每行只占 8 字节，内存远小于 Python set。
+    每批新哈希作为一个新 run 追加，末尾 run 不小于前一个时两两合并，run 长度按几何级数递增、
+    个数保持在 log2(总行数) 以内：每个哈希只被合并 O(log n) 次，避免每批都复制整个数组。
+    """
+
+    def __init__(self):
+        self.runs = []
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+    @staticmethod
+    def hash_rows(df):
+        """整块计算每行的64位哈希（不含索引，缺失值视为相等）"""
+        return pd.util.hash_pandas_object(df, index=False).to_numpy(dtype=np.uint64)
+
+    def contains(self, hashes):
+        """
+        Args:
+            hashes (np.ndarray): 有序的 uint64 哈希
+
+        Returns:
+            np.ndarray: 布尔掩码，标记已登记过的哈希
+        """
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            position = np.searchsorted(run, hashes)
+            inside = position < len(run)
+            found[inside] |= run[position[inside]] == hashes[inside]
+        return found
+
+    def add(self, hashes):
+        """
+        登记一批行哈希
+
+        Returns:
+            np.ndarray: 布尔掩码，标记之前从未出现过的行（同一批内重复的只保留第一次）
+        """
+        unique_hashes, first_index = np.unique(hashes, return_index=True)
+        seen = self.contains(unique_hashes)
+        new_hashes = unique_hashes[~seen]
+        if len(new_hashes):
+            self.runs.append(new_hashes)
+            # 各 run 互不相交，合并只需拼接后排序
+            while len(self.runs) > 1 and len(self.runs[-1]) >= len(self.runs[-2]):
+                last = self.runs.pop()
+                merged = np.concatenate((self.runs.pop(), last))
+                merged.sort(kind='stable')
+                self.runs.append(merged)
+
+        mask = np.zeros(len(hashes), dtype=bool)
+        mask[first_index[~seen]] = True
+        return mask
+
+
+# 切分分片时每次扫描的字节数
+scan_block_bytes = 2 ** 20
+
+
+def _record_ends(block, parity=0):
+    """
+    找出 CSV 字节块中每条记录的结束位置
+
+    转义的引号写作 ""，引号总是成对出现：换行符之前（含 parity）的引号个数为偶数时，
+    该换行符在引号外，是记录边界；引号内的换行属于字段内容。
+
+    Args:
+        block (bytes): CSV 字节
+        parity (int): 块开始前已出现的引号个数的奇偶
+
+    Returns:
+        tuple: (各记录结束位置（含换行符，int64 数组）, 块结束后的引号奇偶)
+    """
+    buffer = np.frombuffer(block, dtype=np.uint8)
+    newlines = np.flatnonzero(buffer == ord('\n'))
+    quotes = np.flatnonzero(buffer == ord('"'))
+    outside = (np.searchsorted(quotes, newlines) + parity) % 2 == 0
+    return newlines[outside] + 1, (parity + len(quotes)) % 2
+
+
+def _plan_shards(path, chunksize):
+    """
+    把原始CSV按字节切分为若干分片，分片边界都落在记录边界上
+
+    只扫描字节中的换行符与引号，不解析字段；每片的字节数按首块估算的平均行长换算为约 chunksize 行。
+
+    Returns:
+        tuple: (列名, 分片列表 [(起始字节, 结束字节)])
+    """
+    size = os.path.getsize(path)
+    boundaries = []
+    shard_bytes = None
+    next_target = 0
+    position = 0
+    parity = 0
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(scan_block_bytes)
+            if not block:
+                break
+            ends, parity = _record_ends(block, parity)
+            ends += position
+            position += len(block)
+            if shard_bytes is None and len(ends) > 1:
+                # 第一个边界是表头的结束位置
+                shard_bytes = max(1, int(chunksize * (ends[-1] - ends[0]) / (len(ends) - 1)))
+            index = np.searchsorted(ends, next_target)
+            while index < len(ends):
+                boundaries.append(int(ends[index]))
+                next_target = boundaries[-1] + (shard_bytes or scan_block_bytes)
+                index = np.searchsorted(ends, next_target)
+
+        f.seek(0)
+        header_end = boundaries[0] if boundaries else size
+        header = f.read(header_end).decode('utf-8-sig')
+    names = next(csv.reader(io.StringIO(header)))
+    edges = [edge for edge in boundaries if edge < size] + [size]
+    return names, [(start, end) for start, end in zip(edges, edges[1:])]
+
+
+def _clean_shard(path, start, end, names):
+    """
+    子进程中执行：读取并解析原始CSV的一个字节区间，块内去重、清洗并渲染为CSV文本
+
+    返回渲染好的字节而不是数据框，主进程只需按全局去重结果挑出保留的行写出，无需再解析或格式化。
+
+    Returns:
+        tuple: (原始行数, 保留行的哈希, CSV字节, 各行结束位置, 职位分类列, 地区列, 耗时, 进程号)
+    """
+    began = time.perf_counter()
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    # 统一按字符串读取，避免各分片分别推断出不同的列类型
+    chunk = pd.read_csv(io.BytesIO(data), encoding='utf-8', header=None, names=names, dtype=str)
+    hashes = RowHashSet.hash_rows(chunk)
+    keep = ~pd.Series(hashes).duplicated().to_numpy()
+    raw_rows = len(chunk)
+    df = clean_frame(chunk[keep])
+    del data, chunk
+    # 直接渲染为 UTF-8 字节，不经过中间字符串
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, header=False, lineterminator='\n', encoding='utf-8')
+    text = buffer.getvalue()
+    del buffer
+    ends, _ = _record_ends(text)
+    return (raw_rows, hashes[keep], text, ends, df['职位分类'], df['地区'].astype('category'),
+            time.perf_counter() - began, os.getpid())
+
+
+def _cleaned_shards(path, shards, names, workers):
+    """按原始顺序逐个产出分片的清洗结果；多进程时最多同时处理 2 * workers 个分片"""
+    if workers <= 1:
+        for start, end in shards:
+            yield _clean_shard(path, start, end, names)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        for start, end in shards:
+            pending.append(executor.submit(_clean_shard, path, start, end, names))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _kept_bytes(text, ends, mask):
+    """从渲染好的CSV字节中挑出 mask 标记的行"""
+    if mask.all():
+        return text
+    lengths = np.diff(ends, prepend=0)
+    buffer = np.frombuffer(text, dtype=np.uint8)
+    return buffer[np.repeat(mask, lengths)].tobytes()
+
+
+def clean_zhilian_data_chunked(input_file, output_file, chunksize=100000, workers=1):
+    """
+    分块清洗智联招聘数据，内存占用只与分块大小有关
+
+    主进程只扫描换行符与引号，把原始CSV按字节切分为约 chunksize 行的分片；
+    解析、块内去重、清洗和渲染CSV文本都在分片内完成，workers 大于 1 时分片在进程池中并行处理。
+    主进程按原始顺序用行哈希跨分片去重（保留第一次出现的行），直接写出保留行的文本，
+    因此输出与单进程完全一致。统计信息按块累加，不保留全量数据。
+
+    Args:
+        input_file (str): 原始CSV路径
+        output_file (str): 清洗后CSV路径
+        chunksize (int): 每个分片的大致行数
+        workers (int): 清洗进程数，1 表示在当前进程中清洗
+
+    Returns:
+        dict: 统计信息
+    """
+    start = time.perf_counter()
+    seen = RowHashSet()
+    stats = {'raw_rows': 0, 'cleaned_rows': 0, 'chunks': 0}
+    job_class_counts = pd.Series(dtype='int64')
+    location_counts = pd.Series(dtype='int64')
+
+    names, shards = _plan_shards(input_file, chunksize)
+    stats['plan_seconds'] = time.perf_counter() - start
+    merge_seconds = 0.0
+    header = render_csv_lines(pd.DataFrame([columns_order + salary_columns]))[0]
+    with open(output_file, 'wb') as f:
+        f.write(('\ufeff' + header + '\n').encode('utf-8'))
+        for raw_rows, hashes, text, ends, job_class, location, elapsed, pid in \
+                _cleaned_shards(input_file, shards, names, workers):
+            merge_start = time.perf_counter()
+            mask = seen.add(hashes)
+            f.write(_kept_bytes(text, ends, mask))
+
+            stats['raw_rows'] += raw_rows
+            stats['cleaned_rows'] += int(mask.sum())
+            stats['chunks'] += 1
+            job_class_counts = job_class_counts.add(job_class[mask].value_counts(), fill_value=0)
+            location_counts = location_counts.add(location[mask].value_counts(), fill_value=0)
+            merge_seconds += time.perf_counter() - merge_start
+            print(f"第 {stats['chunks']} 块（进程 {pid}）：{raw_rows} 行，清洗 {elapsed:.2f} 秒"
+                  f"（{raw_rows / max(elapsed, 1e-9):.0f} 行/秒）；累计读取 {stats['raw_rows']} 行，"
+                  f"写出 {stats['cleaned_rows']} 行（{time.perf_counter() - start:.1f} 秒）")
+            # 处理下一分片前释放本分片的文本
+            del text, ends, job_class, location
+    stats['merge_seconds'] = merge_seconds
+    stats['elapsed'] = time.perf_counter() - start
+    location_counts = location_counts[location_counts > 0]
+
+    print("\n数据清洗完成！")
+    print(f"原始数据行数: {stats['raw_rows']}")
+    print(f"清洗后数据行数: {stats['cleaned_rows']}")
+    print(f"耗时 {stats['elapsed']:.1f} 秒（{stats['raw_rows'] / stats['elapsed']:.0f} 行/秒，{workers} 个进程），"
+          f"其中主进程切分 {stats['plan_seconds']:.2f} 秒、去重写出 {stats['merge_seconds']:.2f} 秒")
+    print(f"职位分类统计:")
+    print(job_class_counts.astype('int64').sort_values(ascending=False))
+    print(f"\n地区分布统计:")
+    print(location_counts.astype('int64').sort_values(ascending=False))
+    print(f"\n数据已保存到: {output_file}")
+    return stats
+
+
+def rules_fingerprint():
+    """清洗规则指纹：本脚本源码的哈希，规则有任何改动时增量清单随之失效"""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:16]
+
+
+def clean_zhilian_data_incremental(input_file, output_file, manifest_file=None):
+    """
+    增量清洗智联招聘数据
+
+    按原始行哈希查询清单，只有新出现或内容有变化的行才经过清洗函数，其余复用清单中的结果；
+    不再出现在原始数据中的行在清单中写墓碑。输出按原始数据顺序由清单重新写出，
+    与整体清洗的结果一致。
+
+    Args:
+        input_file (str): 原始CSV路径
+        output_file (str): 清洗后CSV路径
+        manifest_file (str): 清单路径，默认放在输出CSV旁
+
+    Returns:
+        dict: 统计信息（复用、重新清洗、墓碑行数）
+    """
+    start = time.perf_counter()
+    output_columns = columns_order + salary_columns
+    header = render_csv_lines(pd.DataFrame([output_columns]))[0]
+    manifest = CleaningManifest(manifest_file or CleaningManifest.path_for(output_file), header, rules_fingerprint())
+    if manifest.invalidated:
+        print("清洗规则已变化，增量清单作废，全部重新清洗")
+
+    df = pd.read_csv(input_file, encoding='utf-8-sig', dtype=str)
+    stats = {'raw_rows': len(df)}
+    hashes = RowHashSet.hash_rows(df)
+    first = ~pd.Series(hashes).duplicated().to_numpy()
+    df, hashes = df[first], hashes[first]
+
+    known = manifest.contains(hashes)
+    new_lines = render_csv_lines(clean_frame(df[~known]))
+    removed = manifest.missing_from(hashes)
+    manifest.update(hashes[~known], new_lines, removed)
+
+    # 按原始数据顺序直接拼接清单中的行文本，复用的行无需再解析和格式化
+    lines = manifest.lookup(hashes)
+    with open(output_file, 'w', newline='', encoding='utf-8-sig') as f:
+        f.write(header + '\n')
+        f.write('\n'.join(lines))
+        if len(lines):
+            f.write('\n')
+
+    stats.update({'cleaned_rows': len(lines), 'reused': int(known.sum()), 'recomputed': int((~known).sum()),
+                  'tombstoned': len(removed), 'elapsed': time.perf_counter() - start})
+    print(f"原始数据行数: {stats['raw_rows']}，去重后: {stats['cleaned_rows']}")
+    print(f"复用 {stats['reused']} 行，重新清洗 {stats['recomputed']} 行，墓碑 {stats['tombstoned']} 行，"
+          f"耗时 {stats['elapsed']:.2f} 秒")
+    print(f"数据已保存到: {output_file}")
+    return stats
+
+
 # 执行数据清洗
 if __name__ == "__main__":
-    input_file = "zhilian_computer_jobs.csv"
-    output_file = "cleaned_zhilian_jobs.csv"
-    cleaned_data = clean_zhilian_data(input_file, output_file)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='智联招聘数据清洗')
+    parser.add_argument('--input', default='zhilian_computer_jobs.csv', help='原始CSV路径')
+    parser.add_argument('--output', default='cleaned_zhilian_jobs.csv', help='清洗后CSV路径')
+    parser.add_argument('--chunksize', type=int, help='分块清洗的每块行数，不指定则整体读入内存清洗')
+    parser.add_argument('--workers', type=int, default=1, help='并行清洗的进程数，大于 1 时按分块并行')
+    parser.add_argument('--columnar', help='额外写出列式数据文件（.parquet / .feather / .npz），仅整体清洗模式可用')
+    parser.add_argument('--incremental', action='store_true', help='按清单增量清洗，只处理新增或变化的原始行')
+    args = parser.parse_args()
+
+    if args.columnar and (args.chunksize or args.workers > 1):
+        parser.error('--columnar 需要整体读入数据，不能与 --chunksize/--workers 同时使用')
+    if args.incremental and (args.columnar or args.chunksize or args.workers > 1):
+        parser.error('--incremental 按清单整体处理，不能与 --columnar/--chunksize/--workers 同时使用')
+    if args.incremental:
+        cleaned_data = clean_zhilian_data_incremental(args.input, args.output)
+    elif args.chunksize or args.workers > 1:
+        cleaned_data = clean_zhilian_data_chunked(args.input, args.output, chunksize=args.chunksize or 100000,
+                                                  workers=args.workers)
+    else:
+        cleaned_data = clean_zhilian_data(args.input, args.output, columnar_file=args.columnar)
@@ -0,0 +1,165 @@
+"""
+爬取到清洗的流式管道
+
+爬虫产出的原始行不再先落地为 zhilian_computer_jobs.csv 再整体读回，
+而是按批次依次经过去重与清洗函数（薪资、学历、经验、公司规模、职位分类、地区），
+直接追加写入清洗后的CSV。爬虫在后台线程运行，通过有界队列向清洗端供数，
+内存占用只与批大小和队列长度有关，爬取过程中即可产出清洗后的数据。
+
+用法：
+    python data_cleaning/streaming_pipeline.py                       # 边爬边清洗
+    python data_cleaning/streaming_pipeline.py --source raw.csv      # 从已有原始CSV流式清洗
+"""
+import argparse
+import csv
+import os
+import queue
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from data_cleaning_script import RowHashSet, clean_frame, columns_order, salary_columns
+
+web_crawler_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'web_crawler')
+
+# 原始数据列顺序（与爬虫输出的CSV一致）
+raw_columns = ['关键词', '工作名称', '公司名称', '地区', '学历', '薪资', '经验要求', '公司性质', '公司规模', '工作类型']
+# pd.read_csv 默认视为缺失值的字符串
+na_values = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN', '<NA>',
+             'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+_end_of_stream = object()
+
+
+class QueueWriter:
+    """模拟 csv writer 接口，把爬虫写出的行放入有界队列"""
+
+    def __init__(self, row_queue):
+        self.row_queue = row_queue
+
+    def writerow(self, row):
+        self.row_queue.put(list(row))
+
+    def writerows(self, rows):
+        for row in rows:
+            self.writerow(row)
+
+
+def crawl_rows(max_queue=2000, **crawl_options):
+    """在后台线程运行爬虫，逐行产出原始数据
+
+    队列满时爬虫写入会阻塞，从而对爬取形成反压，内存不会随爬取量增长。
+    """
+    if web_crawler_dir not in sys.path:
+        sys.path.insert(0, web_crawler_dir)
+    import crawler_script
+
+    row_queue = queue.Queue(maxsize=max_queue)
+    errors = []
+
+    def produce():
+        try:
+            crawler_script.crawl_to_writer(QueueWriter(row_queue), **crawl_options)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            row_queue.put(_end_of_stream)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    while True:
+        row = row_queue.get()
+        if row is _end_of_stream:
+            break
+        yield row
+    producer.join()
+    if errors:
+        raise errors[0]
+
+
+def csv_rows(input_file):
+    """逐行读取已有的原始CSV（跳过表头）"""
+    with open(input_file, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            yield row
+
+
+def batched(rows, batch_size):
+    """把行迭代器按批大小分组"""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def clean_batches(batches, seen=None):
+    """对每个批次去重并清洗，逐批产出清洗后的数据框
+
+    Args:
+        batches: 原始行批次的迭代器
+        seen (RowHashSet): 已出现过的原始行哈希，跨批次共享（每行 8 字节）
+    """
+    seen = RowHashSet() if seen is None else seen
+    for batch in batches:
+        df = pd.DataFrame(batch, columns=raw_columns, dtype=object)
+        # 与 pd.read_csv 一致，空字段及 NA、null 等字符串视为缺失值
+        df = df.mask(df.isin(na_values), np.nan)
+        df = df[seen.add(RowHashSet.hash_rows(df))]
+        # 整批都是重复行时也产出，原始行数照常计入统计
+        yield len(batch), clean_frame(df) if len(df) else df.iloc[:0, :0]
+
+
+def write_cleaned(frames, output_file):
+    """把清洗后的批次依次追加写入CSV，返回统计信息"""
+    stats = {'raw_rows': 0, 'cleaned_rows': 0, 'batches': 0}
+    start = time.perf_counter()
+    with open(output_file, 'w', newline='', encoding='utf-8-sig') as f:
+        f.write(','.join(columns_order + salary_columns) + '\n')
+        for raw_count, df in frames:
+            df.to_csv(f, index=False, header=False)
+            f.flush()
+            stats['raw_rows'] += raw_count
+            stats['cleaned_rows'] += len(df)
+            stats['batches'] += 1
+            print(f"第 {stats['batches']} 批：累计原始 {stats['raw_rows']} 行，已写出清洗后 {stats['cleaned_rows']} 行"
+                  f"（{time.perf_counter() - start:.1f} 秒）")
+    stats['elapsed'] = time.perf_counter() - start
+    return stats
+
+
+def run_pipeline(output_file, source=None, batch_size=500, **crawl_options):
+    """运行流式管道
+
+    Args:
+        output_file (str): 清洗后CSV路径
+        source (str): 原始CSV路径，为 None 时直接从爬虫取数
+        batch_size (int): 每批清洗的行数
+        crawl_options: 透传给爬虫的参数
+    """
+    rows = csv_rows(source) if source else crawl_rows(**crawl_options)
+    stats = write_cleaned(clean_batches(batched(rows, batch_size)), output_file)
+    print(f"\n流式清洗完成：原始 {stats['raw_rows']} 行，去重清洗后 {stats['cleaned_rows']} 行，"
+          f"共 {stats['batches']} 批，耗时 {stats['elapsed']:.1f} 秒")
+    print(f"数据已保存到: {output_file}")
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='爬取到清洗的流式管道')
+    parser.add_argument('--output', default='cleaned_zhilian_jobs.csv', help='清洗后CSV路径')
+    parser.add_argument('--source', help='原始CSV路径，不指定则边爬边清洗')
+    parser.add_argument('--batch-size', type=int, default=500, help='每批清洗的行数')
+    parser.add_argument('--url-template', help='搜索页URL模板，可指向本地桩服务')
+    args = parser.parse_args()
+
+    options = {'template': args.url_template} if args.url_template else {}
+    run_pipeline(args.output, source=args.source, batch_size=args.batch_size, **options)
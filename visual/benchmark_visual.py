@@ -0,0 +1,535 @@
+"""
+可视化基准测试
+
+把 setting.data_path 指向的清洗后数据复制放大到指定行数，测量可视化各环节的耗时与内存。
+
+用法：
+    python visual/benchmark_visual.py --rows 1000000 --store     # 六个视图各自读文件 vs 共享数据集缓存
+    python visual/benchmark_visual.py --rows 1000000 --salary    # 三个视图逐行解析薪资 vs 加载时一次向量化解析
+    python visual/benchmark_visual.py --rows 1000000 --heatmap   # 岗位类型热力图：逐行遍历 vs 展开关键词后透视
+    python visual/benchmark_visual.py --rows 10000000 --bins     # 薪资区间：逐区间布尔过滤 vs 一次分箱计数
+    python visual/benchmark_visual.py --render                   # 六个图表每秒渲染次数：临时文件 vs 内存模板
+    python visual/benchmark_visual.py --dashboard                # 仪表盘启动耗时与内存：六个网页视图 vs 单页仪表盘
+    python visual/benchmark_visual.py --update                   # 放大/还原与数据刷新耗时：重新加载页面 vs 推送配置项
+    python visual/benchmark_visual.py --first-chart              # 首个图表显示耗时：窗口创建时建好六个视图 vs 按需创建
+"""
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+import visual.setting as setting
+from visual.dataset import add_salary_columns, decode_salary
+
+# 各视图取用的数据列（与 visual/view 中的 data_columns 一致，None 表示全部列）
+view_columns = {
+    'CompanyTypeSalary': ['公司性质', '薪资'],
+    'EducationSalary': ['学历', 'salary_mid'],
+    'ExperienceRequirement': ['经验要求'],
+    'JobTypeKeyRequirements': None,
+    'RegionalJob': ['地区'],
+    'SalaryRange': None,
+}
+
+
+def write_scaled_csv(path, rows):
+    """把清洗后数据复制放大到 rows 行写入 path"""
+    df = pd.read_csv(setting.data_path, encoding='utf-8')
+    repeats = -(-rows // len(df))
+    pd.concat([df] * repeats, ignore_index=True).iloc[:rows].to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def peak_rss_mb(code):
+    """在子进程中执行一段代码，返回子进程的峰值常驻内存（MB）与耗时"""
+    script = f"""
+import sys, time
+sys.path.insert(0, {project_dir!r})
+from visual.dataset import load_dataset, dataset_store
+view_columns = {view_columns!r}
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+with open('/proc/self/status') as status:
+    peak = next(int(line.split()[1]) / 1024 for line in status if line.startswith('VmHWM'))
+print(peak, elapsed)
+"""
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+    rss, elapsed = output.split()
+    return float(rss), float(elapsed)
+
+
+def bench_store(rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'jobs.csv')
+        write_scaled_csv(path, rows)
+        print(f"数据: {rows} 行，{os.path.getsize(path) / 2 ** 20:.0f} MB")
+        # 旧方式：每个视图各自完整读取一次文件并持有自己的数据框
+        separate = f"frames = [load_dataset({path!r}) for _ in view_columns]"
+        # 共享缓存：只读一次，各视图取列投影
+        shared = f"frames = [dataset_store.get({path!r}, columns) for columns in view_columns.values()]"
+        baseline = peak_rss_mb('pass')[0]
+        for name, code in (('各视图分别读取', separate), ('共享数据集缓存', shared)):
+            rss, elapsed = peak_rss_mb(code)
+            print(f"  {name}: 启动读取 {elapsed:6.2f} 秒，峰值内存 {rss:7.0f} MB（数据占用 {rss - baseline:7.0f} MB）")
+
+
+def legacy_extract_salary_avg(salary_str):
+    """原各视图中逐行调用的薪资解析（取上下限平均值）"""
+    if pd.isna(salary_str):
+        return None
+    try:
+        parts = str(salary_str).split('-')
+        if len(parts) == 2:
+            return (int(parts[0]) + int(parts[1])) / 2
+        return int(salary_str)
+    except ValueError:
+        return None
+
+
+def bench_salary(rows):
+    df = pd.read_csv(setting.data_path, encoding='utf-8')
+    salary = pd.concat([df['薪资']] * -(-rows // len(df)), ignore_index=True).iloc[:rows]
+    print(f"薪资列: {rows} 行")
+
+    start = time.perf_counter()
+    # 薪资区间、岗位类型、学历三个视图每次加载各自逐行解析一遍
+    legacy = [salary.apply(legacy_extract_salary_avg) for _ in range(3)]
+    legacy_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoded = decode_salary(salary)
+    decoded_elapsed = time.perf_counter() - start
+
+    same = np.allclose(legacy[0].astype(float), decoded['salary_mid'], equal_nan=True)
+    print(f"  三个视图逐行解析: {legacy_elapsed:6.2f} 秒")
+    print(f"  加载时向量化解析: {decoded_elapsed:6.2f} 秒（{legacy_elapsed / decoded_elapsed:.0f}x），结果一致: {same}")
+
+
+def legacy_heatmap_data(df, experience_order, top_n=10):
+    """原热力图的统计方式：按经验要求逐级过滤，再用 iterrows() 逐行拆分关键词累加"""
+    exp_salary_data = pd.concat([df[df['经验要求'] == exp] for exp in experience_order])
+    top_experience = [exp for exp in experience_order if not exp_salary_data[exp_salary_data['经验要求'] == exp].empty]
+    all_keywords = []
+    for keywords in exp_salary_data['关键词']:
+        if isinstance(keywords, str):
+            all_keywords.extend([kw.strip() for kw in keywords.split(',') if kw.strip()])
+    top_industries = pd.Series(all_keywords).value_counts().head(top_n).index.tolist()
+
+    data = []
+    for i, experience in enumerate(top_experience):
+        industry_salary, industry_count = {}, {}
+        for _, row in exp_salary_data[exp_salary_data['经验要求'] == experience].iterrows():
+            for kw in row['关键词'].split(','):
+                kw = kw.strip()
+                if kw in top_industries:
+                    industry_salary[kw] = industry_salary.get(kw, 0.0) + float(row['salary_mid'])
+                    industry_count[kw] = industry_count.get(kw, 0) + 1
+        for j, industry in enumerate(top_industries):
+            if industry_count.get(industry):
+                data.append([i, j, round(industry_salary[industry] / industry_count[industry] / 1000)])
+            else:
+                data.append([i, j, 0])
+    return top_experience, top_industries, data
+
+
+def heatmap_frame(rows, seed=0):
+    """放大后的热力图输入；部分岗位的关键词改为逗号连接的多个关键词"""
+    df = add_salary_columns(pd.read_csv(setting.data_path, encoding='utf-8'))
+    df = df[['经验要求', '关键词', 'salary_mid']].dropna()
+    df = pd.concat([df] * -(-rows // len(df)), ignore_index=True).iloc[:rows]
+    rng = np.random.default_rng(seed)
+    keywords = df['关键词'].unique()
+    combined = [','.join(rng.choice(keywords, size=rng.integers(2, 4), replace=False)) for _ in range(200)]
+    multi = rng.random(rows) < 0.3
+    df.loc[multi, '关键词'] = rng.choice(combined, size=multi.sum())
+    return df
+
+
+def bench_heatmap(rows, legacy_rows=200000):
+    from visual.view.Job_Type_Key_Requirements_Visualization import heatmap_data
+    experience_order = ['无经验', '1年以下', '1-3年', '3-5年', '5-10年', '10年以上']
+
+    # 旧实现是逐行遍历，只在较小的规模上运行并核对结果
+    df = heatmap_frame(min(rows, legacy_rows))
+    start = time.perf_counter()
+    legacy = legacy_heatmap_data(df, experience_order)
+    legacy_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    result = heatmap_data(df, experience_order)
+    elapsed = time.perf_counter() - start
+    print(f"热力图统计（{len(df)} 行）: 逐行遍历 {legacy_elapsed:6.2f} 秒，透视 {elapsed:6.2f} 秒"
+          f"（{legacy_elapsed / elapsed:.0f}x），结果一致: {legacy == result}")
+
+    df = heatmap_frame(rows)
+    start = time.perf_counter()
+    heatmap_data(df, experience_order)
+    print(f"热力图统计（{rows} 行）: 透视 {time.perf_counter() - start:6.2f} 秒")
+
+
+def legacy_salary_ranges(df, edges):
+    """原薪资区间统计：每个区间构造一次布尔掩码并取出子表计数"""
+    counts = []
+    for low, high in zip(edges, list(edges[1:]) + [float('inf')]):
+        if high == float('inf'):
+            counts.append(len(df[df['salary_mid'] >= low]))
+        else:
+            counts.append(len(df[(df['salary_mid'] >= low) & (df['salary_mid'] < high)]))
+    return counts
+
+
+def bench_bins(rows, seed=0):
+    from visual.view.Salary_Range_Visualization import count_salary_ranges
+    rng = np.random.default_rng(seed)
+    job_classes = ['后端开发', '前端开发', '测试工程师', '运维工程师', '数据分析师', '算法工程师', '产品经理']
+    df = pd.DataFrame({
+        'salary_mid': np.round(rng.lognormal(9.3, 0.6, rows), -2),
+        '职位分类': pd.Categorical.from_codes(rng.integers(0, len(job_classes), rows), job_classes),
+    })
+    edges = setting.salary_range_edges
+    print(f"薪资区间统计: {rows} 行，{len(edges)} 个区间")
+
+    start = time.perf_counter()
+    legacy = legacy_salary_ranges(df, edges)
+    legacy_elapsed = time.perf_counter() - start
+    print(f"  逐区间布尔过滤:       {legacy_elapsed:6.2f} 秒")
+
+    start = time.perf_counter()
+    counts, _, _ = count_salary_ranges(df['salary_mid'], edges)
+    elapsed = time.perf_counter() - start
+    print(f"  一次分箱计数:         {elapsed:6.2f} 秒（{legacy_elapsed / elapsed:.0f}x），结果一致: {counts.tolist() == legacy}")
+
+    start = time.perf_counter()
+    counts, matrix, _ = count_salary_ranges(df['salary_mid'], edges, df['职位分类'])
+    elapsed = time.perf_counter() - start
+    print(f"  分箱并按职位分类细分: {elapsed:6.2f} 秒，细分合计一致: {matrix.sum(axis=1).tolist() == legacy}")
+
+
+def legacy_echarts_js():
+    """原方式中每个视图创建时读入、渲染时内联的 ECharts 与地图数据"""
+    with open(setting.echarts_js_path, 'r', encoding='utf-8') as f:
+        echarts_js_content = f.read()
+    with open(setting.china_geo_path, 'r', encoding='utf-8') as f:
+        return echarts_js_content + ";\n" + f.read()
+
+
+def legacy_render_html(view, echarts_js_content):
+    """原渲染方式：pyecharts 渲染到临时文件，读回后拼接 ECharts 脚本与样式，再删除临时文件"""
+    from visual.template.view_Template import style_css_path, visual_js_path
+    chart = view.create_job_count_chart()
+    with tempfile.NamedTemporaryFile(suffix='.html', delete=False, mode='w', encoding='utf-8') as temp_file:
+        chart.render(path=temp_file.name, template_name="simple_chart.html", echarts_js="")
+    with open(temp_file.name, 'r', encoding='utf-8') as f:
+        html_content = f.read()
+    head_end_index = html_content.find('</head>')
+    html = (html_content[:head_end_index] + f'<script>{echarts_js_content}</script>'
+            + f'<link rel="stylesheet" type="text/css" href="{style_css_path}" />'
+            + f'<script src="{visual_js_path}"></script>' + html_content[head_end_index:])
+    os.unlink(temp_file.name)
+    return html, temp_file.name
+
+
+def bench_render(repeats=20):
+    from PyQt6.QtCore import QThreadPool
+    from PyQt6.QtWidgets import QApplication
+    from visual.page.visual_window import chart_registry
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    views = [getattr(importlib.import_module(module_name), class_name)() for module_name, class_name, _ in chart_registry]
+    # 等待各视图在后台加载完数据，之后只计渲染
+    QThreadPool.globalInstance().waitForDone()
+    print(f"渲染六个图表各 {repeats} 次（数据: {setting.data_path}）")
+    echarts_js_content = legacy_echarts_js()
+    renderers = (('临时文件 + 内联脚本', lambda view: legacy_render_html(view, echarts_js_content)),
+                 ('内存模板 + asset://', lambda view: view.render_html()))
+    for name, render in renderers:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for view in views:
+                html, _ = render(view)
+        elapsed = time.perf_counter() - start
+        print(f"  {name}: {repeats * len(views) / elapsed:6.1f} 次/秒，每页 {len(html.encode('utf-8')) / 1024:7.1f} KB")
+
+
+def process_tree_memory_mb(pid):
+    """
+    进程及其全部子进程（QtWebEngineProcess 渲染进程、GPU 进程等）的内存
+
+    Returns:
+        tuple: (RSS 之和, PSS 之和)，单位 MB；PSS 按共享页的进程数分摊，多进程时更能反映实际占用
+    """
+    pids, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        pids.append(current)
+        try:
+            for task in os.listdir(f'/proc/{current}/task'):
+                with open(f'/proc/{current}/task/{task}/children') as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except OSError:
+            continue
+    rss = pss = 0
+    for current in pids:
+        try:
+            with open(f'/proc/{current}/smaps_rollup') as f:
+                fields = dict(line.split(':', 1) for line in f if ':' in line and not line.startswith(' '))
+        except OSError:
+            continue
+        rss += int(fields['Rss'].split()[0])
+        pss += int(fields['Pss'].split()[0])
+    return rss / 1024, pss / 1024
+
+
+dashboard_probe = """
+import os, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {project_dir!r})
+os.chdir({project_dir!r})
+import visual.setting as setting
+setting.single_page_dashboard = {shared}
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+from visual.page.visual_window import Visual
+from visual.benchmark_visual import process_tree_memory_mb
+
+app = QApplication(sys.argv)
+window = Visual()
+
+def ready():
+    if window.shared_dashboard is not None:
+        return window.shared_dashboard.charts_shown >= len(window.shared_dashboard.registry)
+    return all(slot.view is not None and slot.view.chart_loaded for slot in window.visual_lst)
+
+def report(elapsed):
+    print(elapsed, *process_tree_memory_mb(os.getpid()))
+    app.quit()
+
+def poll():
+    if ready():
+        elapsed = time.perf_counter() - start
+        # 等渲染进程完成绘制与动画初始化后再统计内存
+        QTimer.singleShot({settle_ms}, lambda: report(elapsed))
+    else:
+        QTimer.singleShot(10, poll)
+
+poll()
+QTimer.singleShot(120000, app.quit)
+app.exec()
+"""
+
+
+def bench_dashboard(settle=3.0):
+    """分别以两种模式启动仪表盘，测量六个图表全部显示的耗时与进程树内存，需要图形环境与 QtWebEngine"""
+    print(f"仪表盘启动（数据: {setting.data_path}，图表显示后等待 {settle} 秒再统计内存）")
+    for name, shared in (('六个网页视图', False), ('单页仪表盘', True)):
+        script = dashboard_probe.format(project_dir=project_dir, shared=shared, settle_ms=int(settle * 1000))
+        result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True)
+        lines = result.stdout.strip().splitlines()[-1:]
+        lines = lines[0].split() if lines else []
+        if result.returncode != 0 or len(lines) != 3:
+            print(f"  {name}: 启动失败\n{result.stderr.strip()[-2000:]}")
+            continue
+        elapsed, rss, pss = map(float, lines)
+        print(f"  {name}: 启动到六个图表显示 {elapsed:6.2f} 秒，进程树 RSS {rss:7.0f} MB，PSS {pss:7.0f} MB")
+
+
+def run_update_probe(shared):
+    """
+    在已启动的仪表盘中测量放大/还原与数据刷新的耗时（在 bench_update 的子进程中运行）
+
+    每次操作从发出请求计到页面执行完更新：重新加载页面以 loadFinished 为准，
+    推送更新后再执行一段空脚本，回调返回时页面已按顺序执行完之前的更新脚本。
+    """
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QApplication
+    setting.single_page_dashboard = shared
+    from visual.page.visual_window import Visual
+
+    app = QApplication(sys.argv)
+    window = Visual()
+    timings = {}
+
+    def round_trip(web_view):
+        finished = []
+        web_view.page().runJavaScript('0', lambda _: finished.append(True))
+        return lambda: finished
+
+    def per_view_scenario():
+        yield lambda: all(slot.view is not None and slot.view.chart_loaded for slot in window.visual_lst)
+        views = [slot.view for slot in window.visual_lst]
+        cases = (
+            ('重新加载页面（旧方式）', True, lambda view: view.update_chart(32, 20)),
+            ('推送配置项（首次生成）', False, lambda view: view.update_chart(32, 20)),
+            ('推送配置项（已缓存）', False, lambda view: view.update_chart(32, 20)),
+            ('数据刷新', False, lambda view: view.refresh_data()),
+        )
+        for name, reload, action in cases:
+            for view in views:
+                yield round_trip(view.web_view)
+                if reload:
+                    view.chart_loaded = False   # 走整页生成与加载的旧路径
+                elif name == '推送配置项（首次生成）':
+                    view.options_cache.clear()
+                applied = view.updates_applied
+                start = time.perf_counter()
+                action(view)
+                if reload:
+                    yield lambda: view.chart_loaded
+                else:
+                    yield lambda: view.updates_applied > applied
+                    yield round_trip(view.web_view)
+                timings.setdefault(name, []).append(time.perf_counter() - start)
+
+    def shared_scenario():
+        dashboard = window.shared_dashboard
+        count = len(dashboard.registry)
+        yield lambda: dashboard.charts_shown >= count
+        yield round_trip(dashboard.web_view)
+        for index in range(count):
+            for name, script in (('页面内放大', f'dashboard.enlarge({index});'), ('页面内还原', 'dashboard.restore();')):
+                start = time.perf_counter()
+                dashboard.web_view.page().runJavaScript(script)
+                yield round_trip(dashboard.web_view)
+                timings.setdefault(name, []).append(time.perf_counter() - start)
+        shown = dashboard.charts_shown
+        start = time.perf_counter()
+        dashboard.refresh()
+        yield lambda: dashboard.charts_shown >= shown + count
+        yield round_trip(dashboard.web_view)
+        timings['数据刷新（六个图表）'] = [time.perf_counter() - start]
+
+    def step(scenario, condition):
+        if not condition():
+            QTimer.singleShot(1, lambda: step(scenario, condition))
+            return
+        try:
+            step(scenario, next(scenario))
+        except StopIteration:
+            for name, values in timings.items():
+                print(f"{name}\t{sum(values) / len(values) * 1000:.1f}\t{max(values) * 1000:.1f}")
+            app.quit()
+
+    scenario = shared_scenario() if shared else per_view_scenario()
+    step(scenario, lambda: True)
+    QTimer.singleShot(120000, app.quit)
+    app.exec()
+
+
+def bench_update():
+    """分别以两种模式启动仪表盘，测量放大/还原与数据刷新的耗时，需要图形环境与 QtWebEngine"""
+    print(f"放大/还原与数据刷新（数据: {setting.data_path}，每项为六个图表的平均/最大耗时）")
+    for name, shared in (('六个网页视图', False), ('单页仪表盘', True)):
+        script = (f"import os, sys; sys.path.insert(0, {project_dir!r}); os.chdir({project_dir!r}); "
+                  f"from visual.benchmark_visual import run_update_probe; run_update_probe({shared})")
+        result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True)
+        rows = [line.split('\t') for line in result.stdout.splitlines() if line.count('\t') == 2]
+        if result.returncode != 0 or not rows:
+            print(f"  {name}: 启动失败\n{result.stderr.strip()[-2000:]}")
+            continue
+        print(f"  {name}:")
+        for case, mean, peak in rows:
+            print(f"    {case}: 平均 {float(mean):7.1f} ms，最大 {float(peak):7.1f} ms")
+
+
+def run_first_chart_probe(eager):
+    """
+    测量仪表盘窗口创建与首个图表页面交给网页视图（setHtml）的耗时（在 bench_first_chart 的子进程中运行）
+
+    eager 为 True 时按原方式在创建窗口时导入并创建全部六个视图；否则由图表位置首次显示时再创建。
+    """
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QApplication
+    setting.single_page_dashboard = False
+    from visual.page import visual_window
+    from visual.template.view_Template import CodeTemplate
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    shown = []
+    show_chart = CodeTemplate.show_chart
+
+    def timed_show_chart(view, serial, html, base_path):
+        shown.append(time.perf_counter())
+        show_chart(view, serial, html, base_path)
+
+    CodeTemplate.show_chart = timed_show_chart
+    if eager:
+        slot_init = visual_window.ChartSlot.__init__
+
+        def eager_slot_init(slot, module_name, class_name, on_enlarge):
+            slot_init(slot, module_name, class_name, on_enlarge)
+            slot.view = getattr(importlib.import_module(module_name), class_name)()
+            slot.view.enlarge_chart_button.clicked.connect(lambda: on_enlarge(slot))
+            slot.layout().addWidget(slot.view)
+
+        visual_window.ChartSlot.__init__ = eager_slot_init
+
+    start = time.perf_counter()
+    window = visual_window.Visual()
+    constructed = time.perf_counter() - start
+
+    def poll():
+        if len(shown) >= len(window.visual_lst):
+            print(f"{constructed}\t{shown[0] - start}\t{shown[-1] - start}")
+            app.quit()
+        else:
+            QTimer.singleShot(5, poll)
+
+    poll()
+    QTimer.singleShot(120000, app.quit)
+    app.exec()
+
+
+def bench_first_chart():
+    """分别以两种方式启动仪表盘，测量窗口创建与首个图表显示的耗时，需要图形环境与 QtWebEngine"""
+    print(f"首个图表显示（数据: {setting.data_path}，从创建窗口开始计时）")
+    for name, eager in (('创建窗口时建好六个视图', True), ('图表位置首次显示时创建', False)):
+        script = (f"import os, sys; sys.path.insert(0, {project_dir!r}); os.chdir({project_dir!r}); "
+                  f"from visual.benchmark_visual import run_first_chart_probe; run_first_chart_probe({eager})")
+        result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True)
+        rows = [line.split('\t') for line in result.stdout.splitlines() if line.count('\t') == 2]
+        if result.returncode != 0 or not rows:
+            print(f"  {name}: 启动失败\n{result.stderr.strip()[-2000:]}")
+            continue
+        constructed, first, last = map(float, rows[-1])
+        print(f"  {name}: Visual() 返回 {constructed * 1000:7.0f} ms，首个图表 {first * 1000:7.0f} ms，"
+              f"六个图表 {last * 1000:7.0f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='可视化基准测试')
+    parser.add_argument('--rows', type=int, default=1000000, help='放大后的数据行数')
+    parser.add_argument('--store', action='store_true', help='对比各视图分别读取与共享数据集缓存')
+    parser.add_argument('--salary', action='store_true', help='对比各视图逐行解析薪资与加载时向量化解析')
+    parser.add_argument('--heatmap', action='store_true', help='对比岗位类型热力图的逐行统计与透视统计')
+    parser.add_argument('--bins', action='store_true', help='对比薪资区间的逐区间过滤与一次分箱计数')
+    parser.add_argument('--render', action='store_true', help='测量六个图表的每秒渲染次数')
+    parser.add_argument('--dashboard', action='store_true', help='对比六个网页视图与单页仪表盘的启动耗时与内存')
+    parser.add_argument('--update', action='store_true', help='对比重新加载页面与推送配置项的放大/还原、刷新耗时')
+    parser.add_argument('--first-chart', action='store_true', help='对比创建窗口时建好全部视图与按需创建的首个图表耗时')
+    args = parser.parse_args()
+
+    if args.store:
+        bench_store(args.rows)
+    if args.salary:
+        bench_salary(args.rows)
+    if args.heatmap:
+        bench_heatmap(args.rows)
+    if args.bins:
+        bench_bins(args.rows)
+    if args.render:
+        bench_render()
+    if args.dashboard:
+        bench_dashboard()
+    if args.update:
+        bench_update()
+    if args.first_chart:
+        bench_first_chart()
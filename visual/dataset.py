@@ -0,0 +1,269 @@
+"""
+清洗后数据集的读写
+
+除CSV外支持列式二进制格式，按文件扩展名选择：
+    .parquet / .feather  需要 pyarrow，类别列以字典编码保存，薪资上下限为 int32
+    .npz                 不依赖 pyarrow：字符串列保存为 整数编码 + 取值表（字典编码，
+                         取值表以 NUL 结尾的 UTF-8 字节保存），薪资等整数列保存为 int32，缺失值记为 -1
+视图不直接读文件，而是通过进程内共享的 dataset_store 取各自需要的列：
+同一文件只解析一次，六个视图共用同一份数据，各自拿到的是列投影而不是副本。
+读取时统一把薪资解析为数值列 salary_low / salary_high / salary_mid（元/月），视图不再各自解析 薪资 字符串。
+"""
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+# 支持的列式格式扩展名
+columnar_extensions = ('.parquet', '.feather', '.npz')
+# 以 int32 保存的整数列
+int32_columns = ('salary_low', 'salary_high', 'salary_mid')
+# .npz 中整数列缺失值的占位值
+npz_missing = -1
+# .npz 取值表中每个取值的结束符
+npz_terminator = '\x00'
+# 薪资字符串格式：下限[-上限]，可带 K/k/千 单位与 元/月 后缀，如 "4000-8000"、"10-15K"、"12K"
+salary_pattern = r'^\s*(\d+(?:\.\d+)?)\s*([Kk千]?)\s*(?:-\s*(\d+(?:\.\d+)?)\s*([Kk千]?))?\s*(?:元/月)?\s*$'
+
+
+def has_pyarrow():
+    """当前环境是否安装了 pyarrow"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _copy_on_write():
+    """当前 pandas 是否启用了写时复制（pandas 3 起始终启用，2.x 需显式开启 mode.copy_on_write）"""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    return pd.get_option('mode.copy_on_write') is True
+
+
+def _typed_frame(df):
+    """薪资整数列转为可空 int32，其余列保持原类型"""
+    df = df.reset_index(drop=True)
+    for column in int32_columns:
+        if column in df.columns:
+            df[column] = df[column].astype('Int32')
+    return df
+
+
+def write_dataset(df, path):
+    """
+    按扩展名保存数据集，.parquet/.feather 在缺少 pyarrow 时改存为同名 .npz
+
+    Args:
+        df (pd.DataFrame): 清洗后的数据
+        path (str): 输出路径
+
+    Returns:
+        str: 实际写入的路径
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.parquet', '.feather') and not has_pyarrow():
+        path = os.path.splitext(path)[0] + '.npz'
+        print(f"未安装 pyarrow，改为保存 .npz 格式: {path}")
+        extension = '.npz'
+
+    if extension == '.csv':
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+    elif extension == '.parquet':
+        _typed_frame(df).to_parquet(path, index=False)
+    elif extension == '.feather':
+        _typed_frame(df).to_feather(path)
+    elif extension == '.npz':
+        _write_npz(df, path)
+    else:
+        raise ValueError(f"不支持的数据格式: {extension}")
+    return path
+
+
+def _write_npz(df, path):
+    """
+    保存为 .npz，每列按序号存放：
+        <i>.codes / <i>.categories  字典编码的字符串列，kinds 中记录普通字符串列、无序或有序类别列
+        <i>.values                  整数列（int32）或其他数值列
+    """
+    kinds = []
+    arrays = {'columns': np.array(df.columns, dtype=str)}
+    for i, column in enumerate(df.columns):
+        values = df[column]
+        if column in int32_columns or pd.api.types.is_integer_dtype(values.dtype):
+            kinds.append('int32')
+            arrays[f'{i}.values'] = values.fillna(npz_missing).to_numpy(dtype=np.int32)
+        elif pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+            kinds.append('numeric')
+            arrays[f'{i}.values'] = values.to_numpy()
+        else:
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                kinds.append('ordered' if values.cat.ordered else 'category')
+                codes, categories = values.cat.codes.to_numpy(), values.cat.categories
+            else:
+                kinds.append('string')
+                codes, categories = pd.factorize(values)
+            code_type = np.int16 if len(categories) < np.iinfo(np.int16).max else np.int32
+            arrays[f'{i}.codes'] = codes.astype(code_type)
+            text = ''.join(str(value) + npz_terminator for value in categories)
+            arrays[f'{i}.categories'] = np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+    arrays['kinds'] = np.array(kinds, dtype=str)
+    np.savez(path, **arrays)
+
+
+def load_dataset(path, columns=None):
+    """
+    按扩展名读取数据集
+
+    Args:
+        path (str): 数据文件路径（.csv / .parquet / .feather / .npz）
+        columns (list): 只读取这些列，为 None 时读取全部
+
+    Returns:
+        pd.DataFrame: 数据；列式格式中的类别列为 Categorical，薪资整数列为可空 Int32
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return pd.read_csv(path, encoding='utf-8', usecols=columns)
+    if extension == '.parquet':
+        return pd.read_parquet(path, columns=columns)
+    if extension == '.feather':
+        return pd.read_feather(path, columns=columns)
+    if extension == '.npz':
+        return _load_npz(path, columns)
+    raise ValueError(f"不支持的数据格式: {extension}")
+
+
+def _load_npz(path, columns=None):
+    with np.load(path, allow_pickle=False) as data:
+        names = list(data['columns'])
+        kinds = list(data['kinds'])
+        wanted = names if columns is None else [name for name in names if name in set(columns)]
+        result = {}
+        for name in wanted:
+            i = names.index(name)
+            kind = kinds[i]
+            if kind == 'int32':
+                values = data[f'{i}.values']
+                result[name] = pd.arrays.IntegerArray(values, values == npz_missing)
+            elif kind == 'numeric':
+                result[name] = data[f'{i}.values']
+            else:
+                codes = data[f'{i}.codes'].astype(np.int32)
+                text = data[f'{i}.categories'].tobytes().decode('utf-8')
+                categories = np.array(text.split(npz_terminator)[:-1], dtype=object)
+                if kind == 'string':
+                    # 缺失值的编码为 -1，对应末尾追加的 NaN
+                    result[name] = np.append(categories, np.nan)[codes]
+                else:
+                    result[name] = pd.Categorical.from_codes(codes, categories=categories,
+                                                             ordered=kind == 'ordered')
+    return pd.DataFrame(result, columns=wanted)
+
+
+def decode_salary(salary):
+    """
+    把薪资字符串列解析为数值，只对不重复的取值做一次正则匹配
+
+    任一端带 K/千 单位时上下限都按千元计（"10-15K" 即 10000-15000），只有一个值时上下限相同。
+
+    Args:
+        salary (pd.Series): 薪资字符串列
+
+    Returns:
+        pd.DataFrame: salary_low / salary_high / salary_mid 三列（元/月，float），无法解析的为 NaN
+    """
+    codes, uniques = pd.factorize(salary)
+    parts = pd.Series(np.asarray(uniques, dtype=object), dtype=object).astype(str).str.extract(salary_pattern)
+    has_unit = (parts[1].fillna('') != '') | (parts[3].fillna('') != '')
+    scale = np.where(has_unit, 1000.0, 1.0)
+    low = parts[0].astype(float).to_numpy() * scale
+    high = parts[2].astype(float).fillna(parts[0].astype(float)).to_numpy() * scale
+    # 缺失值的编码为 -1，对应末尾追加的 NaN
+    low, high = np.append(low, np.nan)[codes], np.append(high, np.nan)[codes]
+    return pd.DataFrame({'salary_low': low, 'salary_high': high, 'salary_mid': (low + high) / 2},
+                        index=salary.index)
+
+
+def add_salary_columns(df):
+    """
+    为数据集补充数值薪资列
+
+    清洗脚本输出的 salary_low / salary_high 直接沿用，旧数据则从 薪资 字符串解析。
+    """
+    if 'salary_low' in df.columns and 'salary_high' in df.columns:
+        low = df['salary_low'].astype('float64').to_numpy(na_value=np.nan)
+        high = df['salary_high'].astype('float64').to_numpy(na_value=np.nan)
+        salary = pd.DataFrame({'salary_low': low, 'salary_high': high, 'salary_mid': (low + high) / 2},
+                              index=df.index)
+    elif '薪资' in df.columns:
+        salary = decode_salary(df['薪资'])
+    else:
+        return df
+    df = df.drop(columns=[column for column in salary.columns if column in df.columns])
+    return pd.concat([df, salary], axis=1)
+
+
+class DatasetStore:
+    """
+    进程内共享的数据集缓存
+
+    以 (真实路径, 修改时间, 文件大小) 为键缓存完整数据框，文件变化后自动重新读取。
+    读取后只做一次薪资解析（add_salary_columns），各视图直接使用 salary_mid 等数值列。
+    启用写时复制时 get() 返回的列投影与缓存共享底层数组，
+    视图对投影的修改（赋值新列、替换列等）只作用于自己的投影，不会影响其他视图；
+    未启用写时复制的 pandas 2.x 上改为返回深复制，修改同样不会影响缓存。
+    """
+
+    def __init__(self):
+        self._frames = {}
+        self._lock = threading.Lock()
+        self.loads = 0    # 实际读取文件的次数
+
+    @staticmethod
+    def key_for(path):
+        """缓存键：文件内容变化时修改时间或大小随之变化"""
+        stat = os.stat(path)
+        return os.path.realpath(path), stat.st_mtime_ns, stat.st_size
+
+    def frame(self, path):
+        """取完整数据框，首次访问或文件变化时读取文件"""
+        key = self.key_for(path)
+        with self._lock:
+            df = self._frames.get(key)
+            if df is None:
+                # 同一路径的旧版本不再使用，释放内存
+                for stale in [k for k in self._frames if k[0] == key[0]]:
+                    del self._frames[stale]
+                df = add_salary_columns(load_dataset(path))
+                self._frames[key] = df
+                self.loads += 1
+        return df
+
+    def get(self, path, columns=None):
+        """
+        取数据集的列投影
+
+        Args:
+            path (str): 数据文件路径
+            columns (list): 需要的列，为 None 时返回全部列
+
+        Returns:
+            pd.DataFrame: 列投影（写时复制下与缓存共享数据，否则为复制），可放心修改
+        """
+        df = self.frame(path)
+        if columns is not None:
+            df = df[list(columns)]
+        # 未启用写时复制时投影可能与缓存共享可写数组，需深复制
+        return df.copy(deep=not _copy_on_write())
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._frames.clear()
+
+
+# 进程内唯一的数据集缓存，所有视图共用
+dataset_store = DatasetStore()
@@ -0,0 +1,171 @@
+"""
+单页仪表盘
+
+六个图表共用一个 QWebEngineView：页面中以网格排列六个 ECharts 实例，只有一个渲染进程、
+一份 ECharts 与一组粒子特效。配置项仍由各视图的 create_job_count_chart 生成——视图以
+embedded 方式创建（不带网页视图），在线程池中生成常规与放大两套配置项后经 runJavaScript 推送到页面，
+放大/还原在页面内完成（见 visual/static/js/dashboard.js）。
+
+在 visual/setting.py 中设置 single_page_dashboard = True 启用。
+"""
+import importlib
+import json
+import os
+import string
+
+from PyQt6.QtCore import QRunnable, QThreadPool, QTimer, QUrl, pyqtSignal
+from PyQt6.QtWebEngineCore import QWebEngineSettings
+from PyQt6.QtWebEngineWidgets import QWebEngineView
+from PyQt6.QtWidgets import QMessageBox, QVBoxLayout, QWidget
+
+import visual.setting as setting
+from visual.template.asset_scheme import asset_url, install_asset_scheme, static_dir
+from visual.template.view_Template import emit_unless_deleted, style_css_path, visual_js_path
+
+dashboard_css_path = os.path.join(static_dir, 'css', 'dashboard.css')
+dashboard_js_path = os.path.join(static_dir, 'js', 'dashboard.js')
+# 常规与放大时的（标题字号, 文本字号）
+normal_font_sizes = (18, 12)
+enlarged_font_sizes = (32, 20)
+
+dashboard_page_template = string.Template('''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>一零九就业市场洞察系统</title>
+    $head
+</head>
+<body>
+    <div id="dashboard">
+        $cells
+    </div>
+</body>
+</html>
+''')
+cell_template = string.Template('''<div class="cell loading" id="cell-$index">
+            <div class="chart" id="chart-$index"></div>
+            <button class="enlarge" onclick="dashboard.toggle($index)"></button>
+        </div>''')
+
+
+class OptionsTask(QRunnable):
+    """在线程池中为一个图表加载数据并生成常规与放大两套配置项"""
+
+    def __init__(self, dashboard, generation, index, view):
+        super().__init__()
+        self.dashboard = dashboard
+        self.generation = generation
+        self.index = index
+        self.view = view
+
+    def run(self):
+        view = self.view
+        try:
+            view.ensure_data()
+            normal = view.render_options(*normal_font_sizes)
+            enlarged = view.render_options(*enlarged_font_sizes)
+            if normal is not None and enlarged is not None:
+                emit_unless_deleted(self.dashboard, 'options_ready', self.generation, self.index,
+                                    json.dumps(normal[0]), normal[1], enlarged[1])
+        except Exception as e:
+            emit_unless_deleted(self.dashboard, 'load_failed', f"图表生成失败: {str(e)}")
+
+
+class SharedDashboard(QWidget):
+    # 后台生成的配置项（批次, 图表序号, 初始化参数 JSON, 常规配置项, 放大配置项）与出错提示
+    options_ready = pyqtSignal(int, int, str, str, str)
+    load_failed = pyqtSignal(str)
+
+    def __init__(self, registry):
+        """
+        Args:
+            registry (list): 图表登记表 [(视图模块, 视图类名, 所在行)]，按显示顺序排列
+        """
+        super().__init__()
+        self.registry = registry
+        self.views = None
+        self.generation = 0         # 配置项批次，数据刷新后旧批次的结果直接丢弃
+        self.page_loaded = False
+        self.pending_scripts = []   # 页面加载完成前生成的配置项，加载完成后再推送
+        self.charts_shown = 0       # 已推送到页面的图表数
+        self.options_ready.connect(self.show_options)
+        self.load_failed.connect(self.show_warning)
+
+        install_asset_scheme()
+        layout = QVBoxLayout(self)
+        layout.setSpacing(0)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.web_view = QWebEngineView()
+        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.WebGLEnabled, True)
+        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.Accelerated2dCanvasEnabled, True)
+        self.web_view.loadFinished.connect(self.on_load_finished)
+        layout.addWidget(self.web_view)
+        self.web_view.setHtml(self.page_html(), baseUrl=QUrl.fromLocalFile(os.path.abspath(__file__)))
+
+    def page_html(self):
+        """仪表盘页面：公共脚本与样式只引用一次，每个图表一个网格单元"""
+        head = [f'<script src="{asset_url(path)}"></script>'
+                for path in (setting.echarts_js_path, setting.china_geo_path) if path and os.path.exists(path)]
+        head += [f'<link rel="stylesheet" type="text/css" href="{asset_url(path)}" />'
+                 for path in (style_css_path, dashboard_css_path)]
+        head += [f'<script src="{asset_url(path)}"></script>' for path in (visual_js_path, dashboard_js_path)]
+        cells = '\n        '.join(cell_template.substitute(index=index) for index in range(len(self.registry)))
+        return dashboard_page_template.substitute(head='\n    '.join(head), cells=cells)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.views is None:
+            # 等窗口绘制完成后再导入视图并生成配置项
+            QTimer.singleShot(0, self.create_views)
+
+    def create_views(self):
+        """导入并以 embedded 方式创建各视图，在线程池中生成配置项"""
+        if self.views is not None:
+            return
+        self.views = [getattr(importlib.import_module(module_name), class_name)(embedded=True)
+                      for module_name, class_name, _ in self.registry]
+        self.render_all()
+
+    def render_all(self):
+        """在线程池中为所有图表生成配置项"""
+        self.generation += 1
+        for index, view in enumerate(self.views):
+            QThreadPool.globalInstance().start(OptionsTask(self, self.generation, index, view))
+
+    def refresh(self):
+        """重新读取数据并替换页面中各图表的配置项，页面不重新加载"""
+        if self.views is None:
+            return
+        for view in self.views:
+            view.invalidate_data()
+        self.render_all()
+
+    def show_options(self, generation, index, init_opts, normal, enlarged):
+        """界面线程中把配置项推送到页面，页面尚未加载完成时暂存"""
+        if generation != self.generation:
+            return
+        script = f"dashboard.setChart({index}, {init_opts}, {normal}, {enlarged});"
+        if self.page_loaded:
+            self.run_script(script)
+        else:
+            self.pending_scripts.append(script)
+
+    def run_script(self, script):
+        self.web_view.page().runJavaScript(script)
+        self.charts_shown += 1
+
+    def on_load_finished(self, ok):
+        if not ok:
+            return
+        self.page_loaded = True
+        scripts, self.pending_scripts = self.pending_scripts, []
+        for script in scripts:
+            self.run_script(script)
+
+    def restore(self):
+        """还原放大的图表"""
+        if self.page_loaded:
+            self.web_view.page().runJavaScript("dashboard.restore();")
+
+    def show_warning(self, message):
+        QMessageBox.warning(self, "警告", message, QMessageBox.StandardButton.Ok)
@@ -1,13 +1,73 @@
+import importlib
 import sys
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
 from PyQt6.QtGui import QKeySequence, QShortcut, QIcon
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QApplication, QHBoxLayout, QPushButton
-from visual.view.CompanyType_Salary_Visualization import CompanyTypeSalaryVisualization
-from visual.view.Education_Salary_Visualization import EducationSalaryVisualization
-from visual.view.Experience_Requirement_Distribution_Visualization import ExperienceRequirementDistributionVisualization
-from visual.view.Job_Type_Key_Requirements_Visualization import JobTypeKeyRequirementsVisualization
-from visual.view.Regional_Job_Visualization import RegionalJobVisualization
-from visual.view.Salary_Range_Visualization import SalaryRangeVisualization
+import visual.setting as setting
+from visual.page.shared_dashboard import SharedDashboard
+from visual.template.view_Template import CodeTemplate
+
+# 仪表盘中的图表登记表：(视图模块, 视图类名, 所在行)，按显示顺序排列
+# 视图模块在图表位置首次显示时才导入，视图随之创建
+chart_registry = [
+    ('visual.view.CompanyType_Salary_Visualization', 'CompanyTypeSalaryVisualization', 'top'),
+    ('visual.view.Education_Salary_Visualization', 'EducationSalaryVisualization', 'top'),
+    ('visual.view.Experience_Requirement_Distribution_Visualization', 'ExperienceRequirementDistributionVisualization', 'top'),
+    ('visual.view.Job_Type_Key_Requirements_Visualization', 'JobTypeKeyRequirementsVisualization', 'bottom'),
+    ('visual.view.Regional_Job_Visualization', 'RegionalJobVisualization', 'bottom'),
+    ('visual.view.Salary_Range_Visualization', 'SalaryRangeVisualization', 'bottom'),
+]
+
+
+class ChartSlot(QWidget):
+    """仪表盘中的一个图表位置，首次显示时才创建视图（网页视图、数据加载与渲染）"""
+
+    def __init__(self, module_name, class_name, on_enlarge):
+        super().__init__()
+        self.module_name = module_name
+        self.class_name = class_name
+        self.on_enlarge = on_enlarge
+        self.view = None
+        self.pending_update = None  # 隐藏期间推迟的重绘请求（标题字号, 文本字号）
+        layout = QVBoxLayout(self)
+        layout.setSpacing(0)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.view is None:
+            # 等本次显示绘制完成后再创建视图，窗口先出现
+            QTimer.singleShot(0, self.create_view)
+        elif self.pending_update is not None:
+            title_size, text_size = self.pending_update
+            self.pending_update = None
+            self.view.update_chart(title_size, text_size)
+
+    def create_view(self):
+        """导入并创建视图，视图创建后即在后台加载数据并生成图表"""
+        if self.view is not None or not self.isVisible():
+            return
+        view_class = getattr(importlib.import_module(self.module_name), self.class_name)
+        self.view = view_class()
+        self.view.enlarge_chart_button.clicked.connect(lambda: self.on_enlarge(self))
+        self.layout().addWidget(self.view)
+
+    def update_chart(self, title_size=18, text_size=12):
+        """重绘图表；图表隐藏时推迟到再次显示时，尚未创建时由创建过程负责绘制"""
+        if self.view is None:
+            return
+        if self.isVisible():
+            self.view.update_chart(title_size, text_size)
+        else:
+            self.pending_update = (title_size, text_size)
+
+    def refresh(self):
+        """重新读取数据并更新图表"""
+        if self.view is None:
+            return
+        self.view.invalidate_data()
+        self.update_chart(*self.view.font_sizes)
+
 
 class Visual(QWidget):
 
@@ -27,31 +87,16 @@ class Visual(QWidget):
         self.init_ui()
         
     def init_ui(self):
-        companyTypeSalaryVisualization = CompanyTypeSalaryVisualization()
-        educationSalaryVisualization = EducationSalaryVisualization()
-        experienceRequirementDistributionVisualization = ExperienceRequirementDistributionVisualization()
-        jobTypeKeyRequirementsVisualization = JobTypeKeyRequirementsVisualization()
-        regionalJobVisualization = RegionalJobVisualization()
-        salaryRangeVisualization = SalaryRangeVisualization()
-
-        companyTypeSalaryVisualization.enlarge_chart_button.clicked.connect(lambda: self.enlarge_chart(companyTypeSalaryVisualization))
-        educationSalaryVisualization.enlarge_chart_button.clicked.connect(lambda: self.enlarge_chart(educationSalaryVisualization))
-        experienceRequirementDistributionVisualization.enlarge_chart_button.clicked.connect(lambda: self.enlarge_chart(experienceRequirementDistributionVisualization))
-        jobTypeKeyRequirementsVisualization.enlarge_chart_button.clicked.connect(lambda: self.enlarge_chart(jobTypeKeyRequirementsVisualization))
-        regionalJobVisualization.enlarge_chart_button.clicked.connect(lambda: self.enlarge_chart(regionalJobVisualization))
-        salaryRangeVisualization.enlarge_chart_button.clicked.connect(lambda: self.enlarge_chart(salaryRangeVisualization))
-
-        self.w_chart = companyTypeSalaryVisualization.win_w
-        self.h_chart = companyTypeSalaryVisualization.win_h
-
-        self.visual_lst = [companyTypeSalaryVisualization,
-                      educationSalaryVisualization,
-                      experienceRequirementDistributionVisualization,
-                      jobTypeKeyRequirementsVisualization,
-                      regionalJobVisualization,
-                      salaryRangeVisualization]
-
-
+        # 图表位置按登记表创建，视图在首次显示时才创建
+        self.w_chart, self.h_chart = CodeTemplate.chart_size(self.screen())
+        if setting.single_page_dashboard:
+            # 六个图表共用一个网页视图
+            self.shared_dashboard = SharedDashboard(chart_registry)
+            self.visual_lst = []
+        else:
+            self.shared_dashboard = None
+            self.visual_lst = [ChartSlot(module_name, class_name, self.enlarge_chart)
+                               for module_name, class_name, _ in chart_registry]
 
         top_layout = QHBoxLayout()
         top_layout.setSpacing(0)
@@ -119,20 +164,18 @@ class Visual(QWidget):
         nav_layout.addWidget(title_label)
         nav_layout.addWidget(close_button)
 
-        top_layout.addWidget(companyTypeSalaryVisualization)
-        top_layout.addWidget(educationSalaryVisualization)
-        top_layout.addWidget(experienceRequirementDistributionVisualization)
-
-        bottom_layout.addWidget(jobTypeKeyRequirementsVisualization)
-        bottom_layout.addWidget(regionalJobVisualization)
-        bottom_layout.addWidget(salaryRangeVisualization)
+        for slot, (_, _, row) in zip(self.visual_lst, chart_registry):
+            (top_layout if row == 'top' else bottom_layout).addWidget(slot)
         # 主布局
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 5)
         main_layout.setSpacing(0)
         main_layout.addLayout(nav_layout)
-        main_layout.addLayout(top_layout)
-        main_layout.addLayout(bottom_layout)
+        if self.shared_dashboard is not None:
+            main_layout.addWidget(self.shared_dashboard)
+        else:
+            main_layout.addLayout(top_layout)
+            main_layout.addLayout(bottom_layout)
 
 
         # 添加全屏切换快捷键 (使用QShortcut替代QAction)
@@ -142,9 +185,15 @@ class Visual(QWidget):
         """显示所有图表"""
         # 处理事件队列，确保UI更新
         QApplication.processEvents()
-        
-        for visual in self.visual_lst:
-            if visual.isVisible():
+
+        if self.shared_dashboard is not None:
+            # 单页仪表盘在页面内还原
+            self.shared_dashboard.restore()
+            return
+
+        for slot in self.visual_lst:
+            visual = slot.view
+            if slot.isVisible() and visual is not None:
                 # 恢复图表按钮可见性
                 visual.enlarge_chart_button.setVisible(True)
                 # 重置Web视图尺寸限制
@@ -152,23 +201,29 @@ class Visual(QWidget):
                 # 重置图表尺寸
                 visual.win_h = self.h_chart
                 visual.win_w = self.w_chart
-                visual.update_chart()
-                visual.show()
-            else:
-                # 显示隐藏的图表
-                visual.show()
-                # 更新图表显示
-
-    def enlarge_chart(self, chart):
+                slot.update_chart()
+            # 显示隐藏的图表，隐藏期间推迟的重绘在显示时进行
+            slot.show()
+
+    def refresh_charts(self):
+        """重新读取数据并更新所有图表，已加载的页面只替换配置项"""
+        if self.shared_dashboard is not None:
+            self.shared_dashboard.refresh()
+            return
+        for slot in self.visual_lst:
+            slot.refresh()
+
+    def enlarge_chart(self, slot):
         """放大指定图表"""
         # 处理事件队列，确保UI更新
         QApplication.processEvents()
         
-        # 隐藏其他所有图表
-        for visual in self.visual_lst:
-            if visual != chart:
-                visual.hide()
+        # 隐藏其他所有图表，隐藏的图表不再重绘
+        for other in self.visual_lst:
+            if other != slot:
+                other.hide()
 
+        chart = slot.view
         # 隐藏当前图表的放大按钮
         chart.enlarge_chart_button.setVisible(False)
         # 设置图表视图尺寸
@@ -177,7 +232,7 @@ class Visual(QWidget):
         chart.win_h = chart.win_h * 2 - 20
         chart.win_w = chart.win_w * 2 - 20
         # 更新图表显示
-        chart.update_chart(32,20)
+        slot.update_chart(32,20)
     
     def create_actions(self):
         # 创建全屏快捷键 (使用QShortcut)
@@ -187,6 +242,10 @@ class Visual(QWidget):
         # 创建退出快捷键 (使用QShortcut)
         quit_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Escape), self)
         quit_shortcut.activated.connect(self.close)
+
+        # 创建数据刷新快捷键
+        refresh_shortcut = QShortcut(QKeySequence(Qt.Key.Key_F5), self)
+        refresh_shortcut.activated.connect(self.refresh_charts)
     
     def toggle_fullscreen(self):
         """切换全屏/窗口模式"""
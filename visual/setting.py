@@ -2,10 +2,17 @@ import os
 
 # 获取当前文件所在目录
 current_dir = os.path.dirname(os.path.abspath(__file__))
-# 数据文件路径
+# 数据文件路径，也可指向清洗脚本 --columnar 写出的列式文件（.parquet / .feather / .npz）
 data_path = os.path.join(current_dir, "static", "data", "cleaned_zhilian_jobs.csv")
 # ECharts JS 文件路径
 echarts_js_path = os.path.join(current_dir,"static", "js", "echarts.min.js")
 # China Geo 文件路径
 china_geo_path = os.path.join(current_dir, "static", "js", "china.js")
+# 薪资区间分布图的区间边界（元/月），区间左闭右开，最后一个区间不设上限
+salary_range_edges = [0, 5000, 8000, 12000, 18000, 25000, 35000, 50000]
+# 薪资区间分布图是否再按 职位分类 细分一层（数据中需有 职位分类 列）
+salary_range_by_job_class = False
+# 为 True 时六个图表共用一个网页视图（单页网格，放大/还原在页面内完成），内存占用更低；
+# 为 False 时每个图表各用一个网页视图
+single_page_dashboard = False
 os.environ["QTWEBENGINE_DISABLE_GPU"] = "1"
\ No newline at end of file
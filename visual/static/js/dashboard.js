@@ -0,0 +1,70 @@
+// 单页仪表盘：六个 ECharts 实例共用一个页面，配置项由 Python 经 runJavaScript 推送，
+// 放大/还原只切换样式并重新 setOption，不重新加载页面
+var dashboard = (function () {
+    // 图表序号 -> {chart, normal, enlarged}，normal/enlarged 为常规与放大两套配置项
+    var entries = {};
+    var enlargedIndex = null;
+
+    function cell(index) {
+        return document.getElementById('cell-' + index);
+    }
+
+    // 设置（或在数据更新后替换）一个图表的配置项
+    function setChart(index, initOpts, normal, enlarged) {
+        var entry = entries[index];
+        if (!entry) {
+            var container = document.getElementById('chart-' + index);
+            cell(index).classList.remove('loading');
+            entry = entries[index] = {
+                chart: echarts.init(container, initOpts.theme, {renderer: initOpts.renderer, locale: initOpts.locale})
+            };
+        }
+        entry.normal = normal;
+        entry.enlarged = enlarged;
+        entry.chart.setOption(index === enlargedIndex ? enlarged : normal, true);
+    }
+
+    function enlarge(index) {
+        var entry = entries[index];
+        if (!entry) {
+            return;
+        }
+        restore();
+        enlargedIndex = index;
+        document.body.classList.add('has-enlarged');
+        cell(index).classList.add('enlarged');
+        entry.chart.resize();
+        entry.chart.setOption(entry.enlarged, true);
+    }
+
+    function restore() {
+        if (enlargedIndex === null) {
+            return;
+        }
+        var entry = entries[enlargedIndex];
+        cell(enlargedIndex).classList.remove('enlarged');
+        document.body.classList.remove('has-enlarged');
+        enlargedIndex = null;
+        entry.chart.setOption(entry.normal, true);
+        // 隐藏期间窗口尺寸可能已变化，重新显示后全部重新测量
+        resizeAll();
+    }
+
+    function toggle(index) {
+        if (index === enlargedIndex) {
+            restore();
+        } else {
+            enlarge(index);
+        }
+    }
+
+    function resizeAll() {
+        for (var index in entries) {
+            entries[index].chart.resize();
+        }
+    }
+
+    window.addEventListener('resize', resizeAll);
+
+    return {setChart: setChart, enlarge: enlarge, restore: restore, toggle: toggle};
+})();
@@ -0,0 +1,104 @@
+"""
+图表页面静态资源的自定义 URL 协议
+
+ECharts、地图数据、样式与粒子特效脚本不再内联进每个图表页面，而是以
+asset://static/js/echarts.min.js 的形式引用，由 AssetSchemeHandler 从 visual/static 读取。
+文件内容在进程内按（路径, 修改时间）缓存，不再每个视图读一遍文件，setHtml 传输的页面也只剩图表本身。
+
+自定义协议的响应不进入 Chromium 的 HTTP 缓存与 V8 代码缓存，每次加载页面脚本仍会重新解析。
+
+协议必须在创建 QApplication 之前注册，导入本模块时即完成注册；
+若导入时 QApplication 已存在（注册失败），asset_url() 退回为 file:// 地址。
+"""
+import os
+
+from PyQt6.QtCore import QBuffer, QCoreApplication, QIODevice, QUrl
+from PyQt6.QtWebEngineCore import (QWebEngineProfile, QWebEngineUrlRequestJob, QWebEngineUrlScheme,
+                                   QWebEngineUrlSchemeHandler)
+
+asset_scheme = b'asset'
+asset_host = 'static'
+static_dir = os.path.realpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'static'))
+content_types = {
+    '.js': b'text/javascript',
+    '.css': b'text/css',
+    '.png': b'image/png',
+    '.json': b'application/json',
+}
+
+_scheme_registered = False
+_handlers = {}   # 已安装处理器的配置文件 -> 处理器，保持引用避免被回收
+
+
+def register_asset_scheme():
+    """注册 asset 协议，只能在创建 QApplication 之前调用"""
+    global _scheme_registered
+    if _scheme_registered or QCoreApplication.instance() is not None:
+        return _scheme_registered
+    scheme = QWebEngineUrlScheme(asset_scheme)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setFlags(QWebEngineUrlScheme.Flag.SecureScheme
+                    | QWebEngineUrlScheme.Flag.LocalScheme
+                    | QWebEngineUrlScheme.Flag.CorsEnabled)
+    QWebEngineUrlScheme.registerScheme(scheme)
+    _scheme_registered = True
+    return True
+
+
+def install_asset_scheme(profile=None):
+    """在配置文件（默认为默认配置文件）上安装 asset 协议的处理器，重复调用无副作用"""
+    if not _scheme_registered:
+        return
+    profile = profile or QWebEngineProfile.defaultProfile()
+    if profile not in _handlers:
+        handler = AssetSchemeHandler(profile)
+        profile.installUrlSchemeHandler(asset_scheme, handler)
+        _handlers[profile] = handler
+
+
+def asset_url(path):
+    """
+    静态资源的引用地址
+
+    Args:
+        path (str): visual/static 下的文件路径
+
+    Returns:
+        str: asset:// 地址，协议未注册时为 file:// 地址
+    """
+    path = os.path.realpath(path)
+    if not _scheme_registered:
+        return QUrl.fromLocalFile(path).toString()
+    relative = os.path.relpath(path, static_dir).replace(os.sep, '/')
+    return f"{asset_scheme.decode()}://{asset_host}/{relative}"
+
+
+class AssetSchemeHandler(QWebEngineUrlSchemeHandler):
+    """从 visual/static 读取 asset:// 请求的文件"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._contents = {}   # (路径, 修改时间) -> 文件内容
+
+    def requestStarted(self, job):
+        url = job.requestUrl()
+        path = os.path.realpath(os.path.join(static_dir, url.path().lstrip('/')))
+        # 只允许访问 static 目录内的文件
+        if url.host() != asset_host or not path.startswith(static_dir + os.sep) or not os.path.isfile(path):
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+
+        key = (path, os.stat(path).st_mtime_ns)
+        content = self._contents.get(key)
+        if content is None:
+            with open(path, 'rb') as f:
+                content = f.read()
+            self._contents[key] = content
+
+        buffer = QBuffer(job)   # 随请求一同释放
+        buffer.setData(content)
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        job.reply(content_types.get(os.path.splitext(path)[1], b'application/octet-stream'), buffer)
+
+
+register_asset_scheme()
@@ -1,19 +1,115 @@
+import string
 import sys
-import tempfile
+import threading
 
 from PyQt6.QtCore import QSize
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QMessageBox, QPushButton
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6 import QtCore
+from PyQt6 import QtCore, sip
 from PyQt6.QtWebEngineCore import QWebEngineSettings
 import visual.setting as setting
+from visual.template.asset_scheme import asset_url, install_asset_scheme, static_dir
 import os
 
+# 页面引用的样式与粒子特效脚本
+style_css_path = os.path.join(static_dir, 'css', 'style.css')
+visual_js_path = os.path.join(static_dir, 'js', 'visual.js')
+
+# 图表页面模板（与 pyecharts 的 simple_chart.html 输出一致），只编译一次；
+# $head 为视图创建时拼好的依赖脚本与样式引用，每次渲染只在内存中填入图表容器与配置项
+chart_page_template = string.Template('''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>$title</title>
+    $head
+</head>
+<body$body_style>
+    <div id="$chart_id" class="chart-container" style="width:$width; height:$height; $horizontal_center"></div>
+    <script>
+        var chart_$chart_id = echarts.init(
+            document.getElementById('$chart_id'), '$theme', {renderer: '$renderer', locale: '$locale'});
+        $js_functions
+        var option_$chart_id = $options;
+        chart_$chart_id.setOption(option_$chart_id);
+
+        // 页面加载后由 CodeTemplate.apply_options 经 runJavaScript 调用：按新尺寸重绘并替换配置项，不重新加载页面
+        function updateChart(width, height, options) {
+            var container = document.getElementById('$chart_id');
+            container.style.width = width;
+            container.style.height = height;
+            chart_$chart_id.resize();
+            chart_$chart_id.setOption(options, true);
+        }
+    </script>
+</body>
+</html>
+''')
+
+# 图表生成前显示的占位页
+placeholder_html = '''
+<html><body style="margin:0;background-color:#001940;color:#00ffff;font-family:微软雅黑;
+display:flex;align-items:center;justify-content:center;height:100vh;">图表加载中…</body></html>
+'''
+
+
+def emit_unless_deleted(owner, signal, *args):
+    """
+    从后台线程经 owner 的信号回传结果；owner 已被销毁（如窗口已关闭）时直接丢弃
+
+    Args:
+        owner (QObject): 信号所属的对象
+        signal (str): 信号名
+    """
+    if not sip.isdeleted(owner):
+        getattr(owner, signal).emit(*args)
+
+
+class ChartTask(QtCore.QRunnable):
+    """在线程池中加载数据并生成图表页面（live 时只生成配置项），结果通过视图的信号回传界面线程"""
+
+    def __init__(self, view, serial, title_size, text_size, live=False):
+        super().__init__()
+        self.view = view
+        self.serial = serial
+        self.title_size = title_size
+        self.text_size = text_size
+        self.live = live
+
+    def run(self):
+        view = self.view
+        try:
+            view.ensure_data()
+            if self.live:
+                # 页面已加载，只需配置项
+                rendered = view.render_options(self.title_size, self.text_size)
+                if rendered is not None:
+                    emit_unless_deleted(view, 'options_ready', self.serial, self.title_size, self.text_size,
+                                        rendered[1])
+                return
+            page = view.render_html(self.title_size, self.text_size)
+            if page is not None:
+                emit_unless_deleted(view, 'chart_ready', self.serial, *page)
+        except Exception as e:
+            emit_unless_deleted(view, 'load_failed', f"图表生成失败: {str(e)}")
+
+
 class CodeTemplate(QWidget):
+    # 视图用到的数据列，为 None 时取全部列（见 visual.dataset.dataset_store）
+    data_columns = None
+    # 是否需要中国地图数据（china.js），只有地理图需要
+    uses_china_map = False
+    # 后台生成的图表页面（序号, HTML, 基准路径）与出错提示，经信号在界面线程处理
+    chart_ready = QtCore.pyqtSignal(int, str, str)
+    load_failed = QtCore.pyqtSignal(str)
+    # 后台生成的配置项（序号, 标题字号, 文本字号, 配置项），用于更新已加载的页面
+    options_ready = QtCore.pyqtSignal(int, int, int, str)
 
-    def __init__(self):
+    def __init__(self, embedded=False):
         super().__init__()
+        # 嵌入单页仪表盘时不创建网页视图，只通过 render_options 提供图表配置项
+        self.embedded = embedded
         self.web_view = None
         self.setWindowTitle("公司性质与岗位数量关联")
         self.setStyleSheet("""
@@ -23,22 +119,41 @@ class CodeTemplate(QWidget):
         """)
         # 获取当前窗口所在的屏幕
         current_screen = self.screen()  # QWidget 自带的 screen() 方法
-        # 获取该屏幕的可用宽度
-        current_screen_width = current_screen.availableGeometry().width()
-        current_screen_height = current_screen.availableGeometry().height()
-
-        self.win_w = current_screen_width//3-10
-        self.win_h = current_screen_height//2-50
+        self.win_w, self.win_h = self.chart_size(current_screen)
         self.web_bg_color = "#001940"  # 科技感深蓝背景
 
         self.data_path = setting.data_path # 数据文件路径
         self.echarts_js_path = setting.echarts_js_path # ECharts JS 文件路径
         self.china_geo_path = getattr(setting, 'china_geo_path', None) # China Geo 文件路径
 
-        self.echarts_js_content = self._load_echarts_js()   # 读取 ECharts JS 内容
+        self.data_lock = threading.Lock()
+        self.data_generation = 1    # 数据版本，刷新时在界面线程中递增，不必等待正在进行的加载
+        self.loaded_generation = 0  # 已加载数据对应的版本
+        self.render_serial = 0  # 最近一次图表请求的序号，过期的结果直接丢弃
+        self.font_sizes = (18, 12)  # 最近一次请求的（标题字号, 文本字号）
+        self.options_cache = {}     # (标题字号, 文本字号) -> 配置项，数据刷新时清空
+        self.updates_applied = 0    # 经 runJavaScript 推送到页面的更新次数
+        self.chart_ready.connect(self.show_chart)
+        self.options_ready.connect(self.show_options)
+        self.load_failed.connect(self.show_warning)
+        if self.embedded:
+            # 图表由单页仪表盘统一显示
+            return
+
+        install_asset_scheme()
+        self.page_head = self._build_page_head()    # 页面头部每个视图只拼接一次
         self.init_ui() # 初始化UI
-        self.load_data()    # 加载数据
-        self.update_chart() # 显示初始图表
+        self.chart_requested = False   # 是否已显示过图表页面（之前加载的是占位页）
+        self.chart_loaded = False      # 图表页面是否已加载完成
+        self.web_view.loadFinished.connect(self.on_load_finished)
+        self.web_view.setHtml(placeholder_html)
+        self.update_chart() # 在后台加载数据并显示初始图表
+
+    @staticmethod
+    def chart_size(screen):
+        """仪表盘中单个图表的尺寸：屏幕可用宽度的三分之一、高度的一半"""
+        geometry = screen.availableGeometry()
+        return geometry.width()//3-10, geometry.height()//2-50
 
     def init_ui(self):
         # 创建主布局
@@ -79,23 +194,20 @@ class CodeTemplate(QWidget):
         main_layout.addWidget(self.web_view, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(self.enlarge_chart_button)
 
-    def _load_echarts_js(self):
-        """读取 ECharts JS 文件内容"""
-        try:
-            with open(self.echarts_js_path, 'r', encoding='utf-8') as f:
-                echarts_content = f.read()
-
-            # 如果有单独的地理数据文件，也加载它
-            if self.china_geo_path and os.path.exists(self.china_geo_path):
-                with open(self.china_geo_path, 'r', encoding='utf-8') as f:
-                    geo_content = f.read()
-                # 将地理数据附加到echarts内容后面
-                echarts_content = echarts_content + ";\n" + geo_content
-
-            return echarts_content
-        except Exception as e:
-            QMessageBox.warning(self, "警告", f"无法加载 ECharts JS 文件: {str(e)}", QMessageBox.StandardButton.Ok)
-            return None
+    def _build_page_head(self):
+        """页面头部：ECharts（地理图另加地图数据）、样式与粒子特效，均以 asset:// 地址引用而不内联"""
+        scripts = [self.echarts_js_path]
+        if self.uses_china_map and self.china_geo_path:
+            scripts.append(self.china_geo_path)
+        head = []
+        for path in scripts:
+            if not os.path.exists(path):
+                QMessageBox.warning(self, "警告", f"无法加载 ECharts JS 文件: {path}", QMessageBox.StandardButton.Ok)
+                continue
+            head.append(f'<script src="{asset_url(path)}"></script>')
+        head.append(f'<link rel="stylesheet" type="text/css" href="{asset_url(style_css_path)}" />')
+        head.append(f'<script src="{asset_url(visual_js_path)}"></script>')
+        return '\n    '.join(head)
 
     def load_data(self):
         """加载数据"""
@@ -105,54 +217,125 @@ class CodeTemplate(QWidget):
         """创建按岗位数量统计的分组柱状图"""
         pass
 
+    def ensure_data(self):
+        """加载数据，同一视图只加载一次，可在后台线程中调用"""
+        with self.data_lock:
+            generation = self.data_generation
+            if self.loaded_generation != generation:
+                self.load_data()
+                # 加载期间若又被刷新，记录的是旧版本，下次调用时再读取
+                self.loaded_generation = generation
+
+    def invalidate_data(self):
+        """
+        丢弃已加载的数据与配置项，下次更新时重新读取（文件未变化时直接取共享缓存）
+
+        只递增数据版本而不获取 data_lock，后台线程正在加载数据时界面线程也不会被阻塞
+        """
+        self.data_generation += 1
+        self.options_cache.clear()
+
+    def refresh_data(self):
+        """重新读取数据并更新图表，已加载的页面不重新加载"""
+        self.invalidate_data()
+        self.update_chart(*self.font_sizes)
+
     def update_chart(self,title_size=18, text_size=12):
+        """
+        更新图表
+
+        页面已加载时只推送配置项与当前尺寸（同一字号的配置项只生成一次），放大/还原无需重新加载页面；
+        否则在线程池中加载数据并生成完整页面，完成后由 show_chart 显示
+        """
+        self.render_serial += 1
+        self.font_sizes = (title_size, text_size)
+        if self.chart_loaded:
+            options = self.options_cache.get(self.font_sizes)
+            if options is not None:
+                self.apply_options(options)
+                return
+        QtCore.QThreadPool.globalInstance().start(
+            ChartTask(self, self.render_serial, title_size, text_size, live=self.chart_loaded))
+
+    def show_chart(self, serial, html, base_path):
+        """界面线程中显示后台生成的图表页面"""
+        if serial != self.render_serial:
+            # 生成期间又有新的请求（如放大后立即还原），等待最新的结果
+            return
+        self.chart_requested = True
+        self.chart_loaded = False
+        self.web_view.setHtml(html, baseUrl=QtCore.QUrl.fromLocalFile(base_path))
+
+    def show_options(self, serial, title_size, text_size, options):
+        """界面线程中把后台生成的配置项推送到已加载的页面"""
+        if serial != self.render_serial:
+            # 生成期间又有新的请求或数据已刷新
+            return
+        self.options_cache[(title_size, text_size)] = options
+        self.apply_options(options)
+
+    def apply_options(self, options):
+        """按当前尺寸重绘页面中的图表并替换配置项"""
+        self.web_view.page().runJavaScript(f"updateChart('{self.win_w}px', '{self.win_h}px', {options});")
+        self.updates_applied += 1
+
+    def on_load_finished(self, ok):
+        """网页加载完成；占位页加载完成不计"""
+        if ok and self.chart_requested:
+            self.chart_loaded = True
+
+    def show_warning(self, message):
+        QMessageBox.warning(self, "警告", message, QMessageBox.StandardButton.Ok)
+
+    def render_html(self,title_size=18, text_size=12):
+        """
+        生成图表页面，只使用数据和尺寸，不访问界面控件，可在后台线程中调用
+
+        Returns:
+            tuple: (HTML, 基准路径)，图表创建失败时返回 None
+        """
         # 只生成岗位数量统计图表
         chart = self.create_job_count_chart(title_size, text_size)
 
         # 检查图表是否成功创建
         if chart is None:
             # 图表创建失败
-            return
+            return None
 
-        # 1. 渲染图表到临时HTML文件，使用离线模式
-        with tempfile.NamedTemporaryFile(suffix='.html', delete=False, mode='w', encoding='utf-8') as temp_file:
-            chart.render(path=temp_file.name, template_name="simple_chart.html", echarts_js="")
-
-        # 2. 读取临时HTML文件内容
-        with open(temp_file.name, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-
-        # 3. 将ECharts JS内容嵌入到HTML的<head>标签中，并设置body背景色
-        head_end_index = html_content.find('</head>')
-        if head_end_index != -1:
-            # 在head中添加自定义CSS样式设置body背景色以及padding和margin为0
-            custom_style = f'''
-            <link rel="stylesheet" type="text/css" href="{os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'static', 'css', 'style.css').replace(os.sep, '/')}" />
-            '''
-            # 添加JavaScript来创建随机粒子效果
-            particle_script = f'''
-            <script src="{os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'static', 'js', 'visual.js').replace(os.sep, '/')}"></script>
-            '''
-
-            modified_html = (html_content[:head_end_index] + f'<script>{self.echarts_js_content}</script>' + custom_style
-                             + particle_script + html_content[head_end_index:])
-
-        else:
-            # 如果没有</head>标签，就加在<body>前面
-            body_start_index = html_content.find('<body>')
-            custom_style = f'''
-            <link rel="stylesheet" type="text/css" href="{os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'static', 'css', 'style.css').replace(os.sep, '/')}" />
-            '''
-            # 添加JavaScript来创建随机粒子效果
-            # 添加JavaScript来创建随机粒子效果
-            particle_script = f'''<script src="{os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'static', 'js', 'visual.js').replace(os.sep, '/')}"></script>'''
-            modified_html = (html_content[:body_start_index] + f'<script>{self.echarts_js_content}</script>' + custom_style
-                             + particle_script + html_content[body_start_index:])
-                             
-        # 4. 在WebView中显示修改后的HTML
-        self.web_view.setHtml(modified_html, baseUrl=QtCore.QUrl.fromLocalFile(temp_file.name))
-        # 5. 删除临时文件
-        os.unlink(temp_file.name)
+        # 在内存中填充页面模板，无需经过临时文件
+        html = chart_page_template.substitute(
+            title=chart.page_title,
+            head=self.page_head,
+            body_style=f' style="background-color: {chart.bg_color}"' if chart.fill_bg else '',
+            chart_id=chart.chart_id,
+            width=chart.width,
+            height=chart.height,
+            horizontal_center=chart.horizontal_center,
+            theme=chart.theme,
+            renderer=chart.renderer,
+            locale=chart.locale,
+            js_functions='\n'.join(chart.js_functions.items),
+            options=chart.dump_options(),
+        )
+        # 基准路径只用于授予页面访问本地文件的权限
+        return html, os.path.abspath(__file__)
+
+    def render_options(self, title_size=18, text_size=12):
+        """
+        只生成图表的初始化参数与配置项，供已加载的页面直接 setOption，可在后台线程中调用
+
+        Returns:
+            tuple: (初始化参数 dict：theme / renderer / locale, 配置项 JS 表达式)，图表创建失败时返回 None
+        """
+        chart = self.create_job_count_chart(title_size, text_size)
+        if chart is None:
+            return None
+        init_opts = {'theme': chart.theme, 'renderer': chart.renderer, 'locale': chart.locale}
+        options = chart.dump_options()
+        if chart.js_functions.items:
+            # 配置项依赖的全局函数与配置项一同求值
+            options = f"(function () {{ {' '.join(chart.js_functions.items)} return {options}; }})()"
+        return init_opts, options
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
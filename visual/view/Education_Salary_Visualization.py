@@ -2,62 +2,34 @@
 # 饼状图
 import sys
 import pandas as pd
-from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtWidgets import QApplication
 import pyecharts.options as opts
 from pyecharts.charts import Pie
 from pyecharts.globals import ThemeType
+from visual.dataset import dataset_store
 from visual.template.view_Template import CodeTemplate
 
-# 解析薪资范围并计算平均值
-def parse_salary(salary_str):
-    """
-    解析薪资范围并计算平均值
-    
-    Args:
-        salary_str (str): 薪资字符串，如"10K-15K"或"12K"
-        
-    Returns:
-        float: 平均薪资值
-    """
-    if '-' in salary_str:
-        min_salary, max_salary = salary_str.split('-')
-        # 处理"K"后缀
-        if 'K' in min_salary.upper():
-            min_val = float(min_salary.upper().replace('K', '')) * 1000
-        else:
-            min_val = float(min_salary)
-
-        if 'K' in max_salary.upper():
-            max_val = float(max_salary.upper().replace('K', '')) * 1000
-        else:
-            max_val = float(max_salary)
-
-        return (min_val + max_val) / 2
-    else:
-        # 处理单个值的情况
-        if 'K' in salary_str.upper():
-            return float(salary_str.upper().replace('K', '')) * 1000
-        else:
-            return float(salary_str)
-
 class EducationSalaryVisualization(CodeTemplate):
     """学历要求与薪资关联可视化类"""
+    # 本视图用到的数据列
+    data_columns = ['学历', 'salary_mid']
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, embedded=False):
+        super().__init__(embedded)
         self.setWindowTitle("学历要求与薪资关联")
 
     def load_data(self):
         """加载数据"""
         try:
-            # 读取CSV文件
-            self.df = pd.read_csv(self.data_path, encoding='utf-8')
+            # 从共享数据集中取本视图需要的列（CSV 或列式格式）
+            self.df = dataset_store.get(self.data_path, self.data_columns)
             # 清理数据，去除空值
-            self.df = self.df.dropna(subset=['学历', '薪资'])
+            self.df = self.df.dropna(subset=['学历', 'salary_mid'])
         except Exception as e:
             print(f"数据加载失败: {e}")
             self.df = pd.DataFrame()
-            QMessageBox.warning(self, "警告", f"数据加载失败: {str(e)}", QMessageBox.StandardButton.Ok)
+            # 可能在后台线程中执行，经信号回到界面线程弹出提示
+            self.load_failed.emit(f"数据加载失败: {str(e)}")
 
     def create_job_count_chart(self, title_size=18, text_size=12):
         """创建学历要求与薪资关联饼状图
@@ -74,14 +46,8 @@ class EducationSalaryVisualization(CodeTemplate):
             print("数据为空，无法生成图表")
             return None
             
-        # 提取学历和薪资数据
-        education_salary_data = self.df[['学历', '薪资']].copy()
-
-        # 应用薪资解析函数
-        education_salary_data['平均薪资'] = education_salary_data['薪资'].apply(parse_salary)
-
-        # 按学历分组并计算平均薪资
-        grouped_data = education_salary_data.groupby('学历')['平均薪资'].mean().reset_index()
+        # 按学历分组并计算平均薪资（salary_mid 为加载时解析好的薪资中值）
+        grouped_data = self.df.groupby('学历')['salary_mid'].mean().rename('平均薪资').reset_index()
 
         # 按平均薪资排序
         grouped_data = grouped_data.sort_values('平均薪资', ascending=False)
@@ -1,66 +1,75 @@
 # 岗位类型与关键条件交叉分析可视化
 # 热力图
 import sys
+import numpy as np
 import pandas as pd
-from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtWidgets import QApplication
 import pyecharts.options as opts
 from pyecharts.charts import HeatMap
 from pyecharts.globals import ThemeType
+from visual.dataset import dataset_store
 from visual.template.view_Template import CodeTemplate
 
 
+def heatmap_data(df, experience_order, top_n=10):
+    """
+    统计各经验要求下最常见关键词的平均薪资
+
+    关键词列按逗号拆分展开为一行一个关键词（只对不重复的关键词字符串拆分一次），
+    再以有序的经验要求类别做一次透视求均值。
+
+    Args:
+        df (pd.DataFrame): 含 经验要求、关键词、salary_mid 列的数据
+        experience_order (list): 经验要求的显示顺序，不在其中的数据不参与统计
+        top_n (int): 取出现次数最多的关键词个数
+
+    Returns:
+        tuple: (有数据的经验要求列表, 关键词列表, 热力图数据 [[经验序号, 关键词序号, 平均薪资(K)], ...])
+    """
+    experience = pd.Categorical(df['经验要求'], categories=experience_order, ordered=True)
+    codes, uniques = pd.factorize(df['关键词'])
+    rows = pd.DataFrame({'经验要求': experience, 'code': codes, 'salary_mid': df['salary_mid'].to_numpy()})
+    # 按经验要求顺序稳定排序，关键词出现次数相同时按首次出现的先后排名
+    rows = rows[rows['经验要求'].notna()].sort_values('经验要求', kind='stable')
+    top_experience = [exp for exp in experience_order if exp in set(rows['经验要求'].unique())]
+
+    # 展开关键词：索引为关键词字符串的编码
+    keywords = pd.Series(np.asarray(uniques, dtype=object)).str.split(',').explode().str.strip()
+    keywords = keywords[keywords.fillna('') != ''].rename('关键词')
+    exploded = rows.join(keywords, on='code', how='inner')
+
+    top_industries = exploded['关键词'].value_counts().head(top_n).index.tolist()
+    exploded = exploded[exploded['关键词'].isin(top_industries)]
+    mean_salary = exploded.pivot_table(index='经验要求', columns='关键词', values='salary_mid',
+                                       aggfunc='mean', observed=True)
+    # 转换为K单位，没有数据的格子记为 0
+    mean_salary = (mean_salary.reindex(index=top_experience, columns=top_industries) / 1000).round().fillna(0)
+
+    data = [[i, j, int(value)] for i, values in enumerate(mean_salary.to_numpy()) for j, value in enumerate(values)]
+    return top_experience, top_industries, data
+
+
 class JobTypeKeyRequirementsVisualization(CodeTemplate):
     """岗位类型与关键条件交叉分析可视化类"""
+    # 去除空值时作用于全部列，因此取全部列
+    data_columns = None
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, embedded=False):
+        super().__init__(embedded)
         self.setWindowTitle("岗位类型与关键条件交叉分析")
 
     def load_data(self):
         """加载数据"""
         try:
-            # 读取CSV文件
-            self.df = pd.read_csv(self.data_path, encoding='utf-8')
-            # 清理数据，去除空值
-            self.df = self.df.dropna(subset=['经验要求', '关键词', '薪资'])
-
-            # 处理薪资范围数据，提取平均值作为代表
-            def extract_salary_avg(salary_str):
-                """
-                处理薪资范围数据，提取平均值作为代表
-
-                Args:
-                    salary_str: 薪资字符串
-
-                Returns:
-                    float: 平均薪资或None
-                """
-                if pd.isna(salary_str):
-                    return None
-                try:
-                    # 分割薪资范围字符串
-                    # 处理不同的薪资格式，如"10-15K"或"10K-15K"
-                    salary_str = str(salary_str).replace('K', '').replace('k', '').replace('元/月', '')
-                    parts = salary_str.split('-')
-                    if len(parts) == 2:
-                        low = float(parts[0])
-                        high = float(parts[1])
-                        return (low + high) / 2 * 1000  # 转换为元
-                    else:
-                        # 如果不是范围格式，尝试直接转换为数值
-                        return float(salary_str) * 1000 if 'K' in str(salary_str) or 'k' in str(salary_str) else float(salary_str)
-                except:
-                    return None
-
-            # 应用薪资处理函数
-            self.df['薪资'] = self.df['薪资'].apply(extract_salary_avg)
-
-            # 再次去除转换后产生的空值
+            # 从共享数据集中取本视图需要的列（CSV 或列式格式）
+            self.df = dataset_store.get(self.data_path, self.data_columns)
+            # 清理数据，去除空值及无法解析的薪资（salary_mid 为加载时解析好的薪资中值，单位元）
             self.df = self.df.dropna()
         except Exception as e:
             print(f"数据加载失败: {e}")
             self.df = pd.DataFrame()
-            QMessageBox.warning(self, "警告", f"数据加载失败: {str(e)}", QMessageBox.StandardButton.Ok)
+            # 可能在后台线程中执行，经信号回到界面线程弹出提示
+            self.load_failed.emit(f"数据加载失败: {str(e)}")
 
     def create_job_count_chart(self, title_size=18, text_size=12):
         """创建岗位类型与关键条件交叉分析热力图
@@ -77,66 +86,9 @@ class JobTypeKeyRequirementsVisualization(CodeTemplate):
             print("数据为空，无法生成图表")
             return None
 
-        # 提取经验要求、关键词和薪资数据
-        exp_salary_data = self.df[['经验要求', '关键词', '薪资']].copy()
-
         # 定义经验要求的正确顺序
         experience_order = ['无经验', '1年以下', '1-3年', '3-5年', '5-10年', '10年以上']
-        
-        # 按照指定顺序过滤数据
-        ordered_exp_data = []
-        for exp in experience_order:
-            exp_data = exp_salary_data[exp_salary_data['经验要求'] == exp]
-            ordered_exp_data.append(exp_data)
-            
-        # 合并排序后的数据
-        exp_salary_data = pd.concat(ordered_exp_data)
-        
-        # 获取按顺序排列的经验要求列表
-        top_experience = []
-        for exp in experience_order:
-            if not exp_salary_data[exp_salary_data['经验要求'] == exp].empty:
-                top_experience.append(exp)
-
-        # 数据预处理：提取前10个最常见的关键词作为行业标识
-        all_keywords = []
-        for keywords in exp_salary_data['关键词']:
-            if isinstance(keywords, str):
-                all_keywords.extend([kw.strip() for kw in keywords.split(',') if kw.strip()])
-
-        top_industries = pd.Series(all_keywords).value_counts().head(10).index.tolist()
-
-        # 构建热力图数据
-        data = []
-        for i, experience in enumerate(top_experience):
-            exp_data = exp_salary_data[exp_salary_data['经验要求'] == experience]
-
-            # 统计每个关键词在该经验要求下的平均薪资
-            industry_salary = {}
-            industry_count = {}
-
-            for _, row in exp_data.iterrows():
-                keywords = row['关键词']
-                salary = row['薪资']
-
-                # 确保salary是数值类型
-                if isinstance(salary, (int, float)) and isinstance(keywords, str):
-                    for kw in keywords.split(','):
-                        kw = kw.strip()
-                        if kw in top_industries:
-                            if kw not in industry_salary:
-                                industry_salary[kw] = 0.0
-                                industry_count[kw] = 0
-                            industry_salary[kw] += float(salary)
-                            industry_count[kw] += 1
-
-            # 计算平均薪资并转换为K单位
-            for j, industry in enumerate(top_industries):
-                if industry in industry_salary and industry_count[industry] > 0:
-                    avg_salary = round(industry_salary[industry] / industry_count[industry] / 1000)  # 转换为K单位
-                    data.append([i, j, avg_salary])
-                else:
-                    data.append([i, j, 0])
+        top_experience, top_industries, data = heatmap_data(self.df, experience_order)
 
         # 创建热力图
         heatmap = HeatMap(init_opts=opts.InitOpts(
@@ -2,28 +2,34 @@
 # 地理分布图
 import sys
 import pandas as pd
-from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtWidgets import QApplication
 import pyecharts.options as opts
 from pyecharts.charts import Geo
 from pyecharts.globals import ThemeType
 from pyecharts.commons.utils import JsCode
+from visual.dataset import dataset_store
 from visual.template.view_Template import CodeTemplate
 
 
 class RegionalJobVisualization(CodeTemplate):
     """地区岗位分布可视化类"""
+    # 本视图用到的数据列
+    data_columns = ['地区']
+    # 地理图需要加载中国地图数据
+    uses_china_map = True
     
     def load_data(self):
         """加载数据"""
         try:
-            # 读取CSV文件
-            self.df = pd.read_csv(self.data_path, encoding='utf-8')
+            # 从共享数据集中取本视图需要的列（CSV 或列式格式）
+            self.df = dataset_store.get(self.data_path, self.data_columns)
             # 清理数据，去除空值
             self.df = self.df.dropna(subset=['地区'])
         except Exception as e:
             print(f"数据加载失败: {e}")
             self.df = pd.DataFrame()
-            QMessageBox.warning(self, "警告", f"数据加载失败: {str(e)}", QMessageBox.StandardButton.Ok)
+            # 可能在后台线程中执行，经信号回到界面线程弹出提示
+            self.load_failed.emit(f"数据加载失败: {str(e)}")
 
     def create_job_count_chart(self, title_size=18, text_size=12):
         """创建中国地图岗位分布图
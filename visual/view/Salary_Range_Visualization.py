@@ -1,77 +1,88 @@
 # 薪资区间分布可视化
 # 桑基图
 import sys
+import numpy as np
 import pandas as pd
-from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtWidgets import QApplication
 import pyecharts.options as opts
 from pyecharts.charts import Sankey
 from pyecharts.globals import ThemeType
+import visual.setting as setting
+from visual.dataset import dataset_store
 from visual.template.view_Template import CodeTemplate
 
 
+def salary_range_labels(edges):
+    """由区间边界生成区间名称，如 [0, 5000, 8000] -> ['0-5k', '5k-8k', '8k以上']"""
+    def format_bound(value):
+        return '0' if value == 0 else f'{value / 1000:g}k'
+
+    labels = [f'{format_bound(low)}-{format_bound(high)}' for low, high in zip(edges[:-1], edges[1:])]
+    return labels + [f'{format_bound(edges[-1])}以上']
+
+
+def count_salary_ranges(salary, edges, groups=None):
+    """
+    一次遍历把薪资分入各区间并计数
+
+    Args:
+        salary: 薪资数值（元/月）
+        edges (list): 升序的区间边界，区间左闭右开，最后一个区间不设上限，低于首个边界的不计入
+        groups (pd.Series): 可选的分组列（如 职位分类），同时统计每个区间内各分组的数量
+
+    Returns:
+        tuple: (各区间数量, 区间 x 分组 的数量矩阵, 分组名称)，未给出 groups 时后两项为 None
+    """
+    salary = np.asarray(salary, dtype=float)
+    edges = np.asarray(edges, dtype=float)
+    if groups is None:
+        # 末尾补上无穷大作为最后一个区间的上界
+        counts, _ = np.histogram(salary[~np.isnan(salary)], bins=np.append(edges, np.inf))
+        return counts, None, None
+
+    bins = np.searchsorted(edges, salary, side='right') - 1
+    valid = (bins >= 0) & ~np.isnan(salary)
+    counts = np.bincount(bins[valid], minlength=len(edges))
+    codes, names = pd.factorize(groups)
+    valid &= codes >= 0
+    # 区间编号与分组编号合成一个编号，一次计数得到二维表
+    matrix = np.bincount(bins[valid] * len(names) + codes[valid], minlength=len(edges) * len(names))
+    return counts, matrix.reshape(len(edges), len(names)), list(names)
+
+
 class SalaryRangeVisualization(CodeTemplate):
     """薪资区间分布可视化类"""
-    
-    def __init__(self):
-        super().__init__()
+    # 去除空值时作用于全部列，因此取全部列
+    data_columns = None
+    # 区间边界与是否按职位分类细分，见 setting
+    salary_edges = setting.salary_range_edges
+    by_job_class = setting.salary_range_by_job_class
+
+    def __init__(self, embedded=False):
+        super().__init__(embedded)
         self.setWindowTitle("薪资区间分布")
 
     def load_data(self):
         """加载数据"""
         try:
-            # 读取CSV文件
-            self.df = pd.read_csv(self.data_path, encoding='utf-8')
+            # 从共享数据集中取本视图需要的列（CSV 或列式格式）
+            self.df = dataset_store.get(self.data_path, self.data_columns)
             # 数据加载成功，无需打印信息
             
             # 检查是否有薪资列
-            if '薪资' not in self.df.columns:
+            if 'salary_mid' not in self.df.columns:
                 print("错误：数据中没有找到'薪资'列")
                 self.df = pd.DataFrame()
                 return
                 
-            # 清理数据，去除空值
-            original_count = len(self.df)
-            self.df = self.df.dropna(subset=['薪资'])
-            # 已去除空薪资数据
-            
-            # 处理薪资范围数据，提取平均值作为代表
-            def extract_salary_avg(salary_str):
-                """
-                处理薪资范围数据，提取平均值作为代表
-                
-                Args:
-                    salary_str: 薪资字符串
-                    
-                Returns:
-                    float: 平均薪资或None
-                """
-                if pd.isna(salary_str):
-                    return None
-                try:
-                    # 分割薪资范围字符串
-                    parts = str(salary_str).split('-')
-                    if len(parts) == 2:
-                        low = int(parts[0])
-                        high = int(parts[1])
-                        return (low + high) / 2  # 返回平均值
-                    else:
-                        # 如果不是范围格式，尝试直接转换为整数
-                        return int(salary_str)
-                except:
-                    return None
-            
-            # 应用薪资处理函数
-            self.df['薪资'] = self.df['薪资'].apply(extract_salary_avg)
-            
-            # 再次去除转换后产生的空值
-            original_count = len(self.df)
+            # 清理数据，去除空值及无法解析的薪资（salary_mid 为加载时解析好的薪资中值）
             self.df = self.df.dropna()
-            # 已转换为数值类型并完成样本数据处理
             
         except Exception as e:
             print(f"数据加载失败: {e}")
             self.df = pd.DataFrame()
-            QMessageBox.warning(self, "警告", f"数据加载失败: {str(e)}", QMessageBox.StandardButton.Ok)
+            # 可能在后台线程中执行，经信号回到界面线程弹出提示
+            self.load_failed.emit(f"数据加载失败: {str(e)}")
 
     def create_job_count_chart(self, title_size=18, text_size=12):
         """创建薪资区间分布桑基图
@@ -88,40 +99,11 @@ class SalaryRangeVisualization(CodeTemplate):
             print("数据为空，无法生成图表")
             return None
 
-        # 开始创建图表
-
-        # 定义薪资区间
-        salary_ranges = [
-            (0, 5000),
-            (5000, 8000),
-            (8000, 12000),
-            (12000, 18000),
-            (18000, 25000),
-            (25000, 35000),
-            (35000, 50000),
-            (50000, float('inf'))
-        ]
-        
-        range_labels = [
-            "0-5k",
-            "5k-8k",
-            "8k-12k",
-            "12k-18k",
-            "18k-25k",
-            "25k-35k",
-            "35k-50k",
-            "50k以上"
-        ]
-
-        # 按薪资区间统计数量
-        range_counts = []
-        for min_sal, max_sal in salary_ranges:
-            if max_sal == float('inf'):
-                count = len(self.df[(self.df['薪资'] >= min_sal)])
-            else:
-                count = len(self.df[(self.df['薪资'] >= min_sal) & (self.df['薪资'] < max_sal)])
-            range_counts.append(count)
-        # 各区间统计完成
+        # 一次遍历完成分箱计数，需要时同时按职位分类细分
+        range_labels = salary_range_labels(self.salary_edges)
+        groups = self.df['职位分类'] if self.by_job_class and '职位分类' in self.df.columns else None
+        range_counts, class_counts, class_names = count_salary_ranges(self.df['salary_mid'], self.salary_edges, groups)
+        range_counts = range_counts.tolist()
 
         # 检查是否有数据
         if sum(range_counts) == 0:
@@ -150,6 +132,19 @@ class SalaryRangeVisualization(CodeTemplate):
                     "value": count
                 })
 
+        # 第二层：各薪资区间到职位分类的链接
+        if class_counts is not None:
+            for name in class_names:
+                nodes.append({"name": name})
+            for label, row in zip(range_labels, class_counts.tolist()):
+                for name, count in zip(class_names, row):
+                    if count > 0:
+                        links.append({
+                            "source": label,
+                            "target": name,
+                            "value": count
+                        })
+
         # 创建桑基图
         sankey = Sankey(init_opts=opts.InitOpts(
             theme=ThemeType.DARK, 
@@ -0,0 +1,117 @@
+"""
+爬虫吞吐基准测试
+
+在本地桩服务上运行并发爬取引擎，对比不同并发度下的 页/秒，
+裸 requests.get 与连接池会话的建连次数，服务端限流（429）下自适应限速的效果，以及越界页重复时提前停止翻页节省的请求数，全程无需网络。
+运行: python web_crawler/benchmark_crawler.py
+"""
+import argparse
+import csv
+import io
+
+import requests
+
+from crawl_engine import CrawlEngine
+from http_session import PooledSession
+from job_parser import parse_jobs
+from rate_limiter import AdaptiveRateLimiter
+from stub_server import StubJobSite
+
+
+def bare_fetch(url):
+    """不复用连接的下载方式，作为对照"""
+    return requests.get(url, timeout=15).text
+
+
+def run_crawl(site, fetch, concurrency, per_host_concurrency, page_window, max_pages=19):
+    """在桩服务上执行一次完整爬取，返回统计信息"""
+    engine = CrawlEngine(
+        fetch=fetch,
+        parse=parse_jobs,
+        url_template=site.url_template,
+        keywords=site.keywords,
+        max_pages=max_pages,
+        concurrency=concurrency,
+        per_host_concurrency=per_host_concurrency,
+        page_window=page_window,
+        verbose=False,
+    )
+    return engine.run(csv.writer(io.StringIO()))
+
+
+def bench_concurrency(site, levels):
+    print(f"{'并发度':>6} {'页数':>6} {'行数':>6} {'耗时(s)':>8} {'页/秒':>8}")
+    for level in levels:
+        with PooledSession(pool_maxsize=level) as session:
+            stats = run_crawl(site, session.get_text, concurrency=level, per_host_concurrency=level,
+                              page_window=max(1, level // 2))
+        print(f"{level:>6} {stats['pages']:>6} {stats['rows']:>6} {stats['elapsed']:>8.2f} {stats['pages_per_sec']:>8.1f}")
+
+
+def bench_connections(site, concurrency):
+    """对比裸请求与连接池会话在服务端观察到的TCP连接数"""
+    print(f"{'方式':<10} {'请求数':>6} {'服务端连接数':>10} {'耗时(s)':>8} {'页/秒':>8}")
+
+    site.reset_counters()
+    stats = run_crawl(site, bare_fetch, concurrency, concurrency, page_window=max(1, concurrency // 2))
+    print(f"{'requests.get':<10} {site.requests:>6} {site.connections:>10} {stats['elapsed']:>8.2f} {stats['pages_per_sec']:>8.1f}")
+
+    site.reset_counters()
+    with PooledSession(pool_maxsize=concurrency) as session:
+        stats = run_crawl(site, session.get_text, concurrency, concurrency, page_window=max(1, concurrency // 2))
+        http = session.connection_stats()
+    print(f"{'PooledSession':<10} {site.requests:>6} {site.connections:>10} {stats['elapsed']:>8.2f} {stats['pages_per_sec']:>8.1f}")
+    print(f"客户端统计: 新建连接 {http['new_connections']} 个，复用连接 {http['reused_connections']} 次")
+
+
+def bench_rate_limit(throttle_rate, latency, concurrency):
+    """服务端按 throttle_rate 限流时，对比不限速与自适应限速的吞吐和 429 次数"""
+    print(f"服务端限流 {throttle_rate:.0f} 请求/秒")
+    print(f"{'方式':<10} {'页数':>6} {'失败页':>6} {'429次数':>8} {'耗时(s)':>8} {'页/秒':>8} {'最终速率':>8}")
+    with StubJobSite(latency=latency, throttle_rate=throttle_rate) as site:
+        for name, adaptive in [('不限速', False), ('AIMD限速', True)]:
+            limiter = AdaptiveRateLimiter(initial_rate=2.0, max_rate=throttle_rate * 4) if adaptive else None
+            site.reset_counters()
+            with PooledSession(pool_maxsize=concurrency, backoff_base=0.2, limiter=limiter) as session:
+                stats = run_crawl(site, session.get_text, concurrency, concurrency, page_window=max(1, concurrency // 2))
+            final_rate = f"{limiter.rate:.1f}" if limiter is not None else '-'
+            print(f"{name:<10} {stats['pages']:>6} {stats['errors']:>6} {site.throttled:>8} {stats['elapsed']:>8.2f} "
+                  f"{stats['pages_per_sec']:>8.1f} {final_rate:>8}")
+
+        # 速率变化轨迹（抽样显示）
+        trace = list(limiter.history)
+        step = max(1, len(trace) // 15)
+        print("速率轨迹: " + ', '.join(f"{t:.1f}s:{rate:.1f}" for t, rate, _ in trace[::step]))
+
+
+def bench_repeat_pages(latency, concurrency):
+    """站点对越界页码重复返回最后一页/第一页时，统计重复页检测节省的请求数"""
+    print(f"{'越界页处理':<10} {'服务端请求数':>10} {'行数':>6} {'提前停止':>8} {'节省请求':>8}")
+    for out_of_range in ('empty', 'last', 'first'):
+        with StubJobSite(latency=latency, out_of_range=out_of_range) as site:
+            with PooledSession(pool_maxsize=concurrency) as session:
+                stats = run_crawl(site, session.get_text, concurrency, concurrency, page_window=2)
+            print(f"{out_of_range:<10} {site.requests:>10} {stats['rows']:>6} {stats['repeat_stops']:>8} "
+                  f"{stats['requests_saved']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='爬虫吞吐基准测试')
+    parser.add_argument('--latency', type=float, default=0.05, help='桩服务模拟响应延迟（秒）')
+    parser.add_argument('--levels', type=int, nargs='+', default=[1, 2, 4, 8, 16], help='测试的并发度')
+    parser.add_argument('--throttle', type=float, default=40.0, help='限流测试中服务端允许的请求速率')
+    args = parser.parse_args()
+
+    with StubJobSite(latency=args.latency) as site:
+        print(f"桩服务: {site.url_template}，模拟延迟 {args.latency * 1000:.0f}ms")
+        bench_concurrency(site, args.levels)
+        print()
+        bench_connections(site, max(args.levels))
+    print()
+    bench_rate_limit(args.throttle, args.latency, max(args.levels))
+    print()
+    bench_repeat_pages(args.latency, max(args.levels))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+搜索页解析微基准
+
+对比旧版 9 次正则扫描与单次JSON解析在样本页面上的耗时与结果一致性。
+样本页面可以是保存下来的真实搜索页（--pages-dir），默认由样本CSV生成。
+运行: python web_crawler/benchmark_parser.py [--pages-dir DIR] [--save DIR]
+"""
+import argparse
+import glob
+import os
+import re
+import time
+
+from job_parser import job_rows
+from stub_server import load_sample_jobs, render_page
+
+
+def regex_rows(keyword, response):
+    """旧版解析：每个字段单独正则扫描全页，再按下标拼接"""
+    names = re.findall(r'"matchInfo":.*?"name":"(.*?)"', response)
+    companyNames = re.findall(r'"companyName":"(.*?)"', response)
+    cityDistricts = re.findall(r'"cityDistrict":"(.*?)"', response)
+    educations = re.findall(r'"education":"(.*?)"', response)
+    salary60s = re.findall(r'"salary60":"(.*?)"', response)
+    workingExps = re.findall(r'"workingExp":"(.*?)"', response)
+    properties = re.findall(r'"property":"(.*?)"', response)
+    companySizes = re.findall(r'"companySize":"(.*?)"', response)
+    workTypes = re.findall(r'"workType":"(.*?)"', response)
+
+    min_count = min(len(names), len(companyNames), len(cityDistricts), len(educations),
+                    len(salary60s), len(workingExps), len(properties), len(companySizes),
+                    len(workTypes))
+
+    rows = []
+    for i in range(min_count):
+        row_data = [names[i], companyNames[i], cityDistricts[i], educations[i],
+                    salary60s[i], workingExps[i], properties[i], companySizes[i],
+                    workTypes[i]]
+        clean_data = []
+        for item in row_data:
+            item = item.replace('\\n', ' ').replace('\\r', ' ').replace('\\t', ' ').strip()
+            clean_data.append(item)
+        rows.append([keyword] + clean_data)
+    return rows
+
+
+def load_pages(pages_dir=None, jobs_per_page=20):
+    """读取保存的页面，或由样本CSV生成页面，返回 (关键词, html) 列表"""
+    if pages_dir:
+        pages = []
+        for path in sorted(glob.glob(os.path.join(pages_dir, '*.html'))):
+            with open(path, 'r', encoding='utf-8') as f:
+                pages.append((os.path.basename(path).rsplit('_', 1)[0], f.read()))
+        return pages
+
+    pages = []
+    for keyword, jobs in load_sample_jobs().items():
+        for start in range(0, len(jobs), jobs_per_page):
+            pages.append((keyword, render_page(jobs[start:start + jobs_per_page])))
+    return pages
+
+
+def save_pages(pages, pages_dir):
+    os.makedirs(pages_dir, exist_ok=True)
+    for i, (keyword, html) in enumerate(pages):
+        with open(os.path.join(pages_dir, f"{keyword}_{i:04d}.html"), 'w', encoding='utf-8') as f:
+            f.write(html)
+
+
+def time_parser(parse, pages, repeat):
+    """返回解析全部页面的最短耗时（秒）"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for keyword, html in pages:
+            parse(keyword, html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='搜索页解析微基准')
+    parser.add_argument('--pages-dir', help='保存的搜索页目录（文件名形如 关键词_序号.html）')
+    parser.add_argument('--save', help='把生成的样本页面保存到该目录')
+    parser.add_argument('--repeat', type=int, default=5, help='重复次数，取最短耗时')
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages_dir)
+    if args.save:
+        save_pages(pages, args.save)
+        print(f"已保存 {len(pages)} 个样本页面到 {args.save}")
+
+    total_bytes = sum(len(html.encode('utf-8')) for _, html in pages)
+    print(f"样本页面: {len(pages)} 页，共 {total_bytes / 1024:.0f} KB")
+
+    regex_time = time_parser(regex_rows, pages, args.repeat)
+    json_time = time_parser(job_rows, pages, args.repeat)
+    print(f"正则解析: {regex_time * 1000:8.2f} ms  ({len(pages) / regex_time:8.0f} 页/秒)")
+    print(f"JSON解析: {json_time * 1000:8.2f} ms  ({len(pages) / json_time:8.0f} 页/秒)")
+    print(f"加速比: {regex_time / json_time:.1f}x")
+
+    mismatched = sum(1 for keyword, html in pages if regex_rows(keyword, html) != job_rows(keyword, html))
+    print(f"结果不一致的页面: {mismatched}/{len(pages)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+爬取断点记录
+
+以追加写入的 JSON Lines 文件记录已完成的（关键词, 页码）单元及已写入职位的指纹。
+每完成一页追加一行，进程中途退出时最多丢失最后一行；重新运行时据此跳过已完成的页，
+并只追加之前未写入过的职位。
+"""
+import json
+import os
+
+
+class CrawlCheckpoint:
+    """爬取断点存储"""
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): 断点文件路径（.jsonl）
+        """
+        self.path = path
+        self.units = {}     # (关键词, 页码) -> 该页解析到的职位数
+        self.page_fingerprints = {}  # (关键词, 页码) -> 页面指纹
+        self.seen = set()   # 已写入CSV的职位指纹
+        self._file = None
+        self._load()
+
+    @staticmethod
+    def path_for(output_file):
+        """与输出CSV放在一起的断点文件路径"""
+        return os.path.splitext(output_file)[0] + '.checkpoint.jsonl'
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # 最后一行可能因中途退出而不完整
+                    break
+                if record.get('type') == 'reset':
+                    self.units.clear()
+                    self.page_fingerprints.clear()
+                elif record.get('type') == 'unit':
+                    unit = (record['keyword'], record['page'])
+                    self.units[unit] = record['jobs']
+                    if record.get('page_fp'):
+                        self.page_fingerprints[unit] = record['page_fp']
+                    self.seen.update(record['new'])
+
+    def _append(self, record):
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def is_done(self, keyword, page):
+        return (keyword, page) in self.units
+
+    def job_count(self, keyword, page):
+        """已完成页解析到的职位数，未完成返回 None"""
+        return self.units.get((keyword, page))
+
+    def page_fingerprint(self, keyword, page):
+        return self.page_fingerprints.get((keyword, page))
+
+    def record(self, keyword, page, job_count, new_fingerprints, page_fp=None):
+        """记录一页已完成，须在该页数据写入CSV并刷新之后调用
+
+        Args:
+            job_count (int): 该页职位数，0 表示该关键词到此为止（空页或重复页）
+            new_fingerprints (list): 本页新写入的职位指纹
+            page_fp (str): 页面指纹，用于续爬时识别重复页
+        """
+        self._append({'type': 'unit', 'keyword': keyword, 'page': page, 'jobs': job_count,
+                      'page_fp': page_fp, 'new': list(new_fingerprints)})
+        self.units[(keyword, page)] = job_count
+        if page_fp:
+            self.page_fingerprints[(keyword, page)] = page_fp
+        self.seen.update(new_fingerprints)
+
+    def reset_units(self):
+        """清空已完成页（用于定期重爬），保留职位指纹以便只追加新职位"""
+        self._append({'type': 'reset'})
+        self.units.clear()
+        self.page_fingerprints.clear()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,210 @@
+"""
+异步并发爬取引擎
+
+将 关键词 × 页码 网格并发展开，通过全局与按主机的并发上限控制请求压力。
+下载函数为同步函数（如 requests），在线程池中执行，由 asyncio 负责调度。
+可选的断点记录用于跳过已完成的页，并按职位指纹只写入未见过的职位；
+可选的页面归档保存每个页面原文，供离线重解析。
+很多招聘站对超出范围的页码仍返回最后一页（或第一页），因此对每页的职位编号集合做指纹，
+同一关键词下出现重复页即停止翻页。
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from job_parser import job_row, job_fingerprint, page_fingerprint
+
+
+class CrawlEngine:
+    """基于 asyncio 的并发爬取引擎"""
+
+    def __init__(self, fetch, parse, url_template, keywords, max_pages=19,
+                 concurrency=8, per_host_concurrency=4, page_window=4, checkpoint=None, archive=None, verbose=True):
+        """
+        Args:
+            fetch (callable): 同步下载函数，接收 url 返回页面文本
+            parse (callable): 解析函数，接收 html 返回职位记录列表
+            url_template (str): 含 {keyword} 与 {page} 占位符的URL模板
+            keywords (list): 搜索关键词列表
+            max_pages (int): 每个关键词最多爬取的页数
+            concurrency (int): 全局最大并发请求数
+            per_host_concurrency (int): 单个主机最大并发请求数
+            page_window (int): 单个关键词同时在途的最大页数
+            checkpoint (CrawlCheckpoint): 断点记录，为 None 时不记录、仅在本次运行内去重
+            archive (PageArchive): 原始页面归档，为 None 时不保存页面原文
+            verbose (bool): 是否打印逐页进度
+        """
+        self.fetch = fetch
+        self.parse = parse
+        self.url_template = url_template
+        self.keywords = list(keywords)
+        self.max_pages = max_pages
+        self.concurrency = max(1, concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.page_window = max(1, page_window)
+        self.checkpoint = checkpoint
+        self.archive = archive
+        self.verbose = verbose
+        self.stats = {}
+        self._seen = set()
+        self._flush = None
+        self._executor = None
+        self._global_semaphore = None
+        self._host_semaphores = {}
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def run(self, writer, flush=None):
+        """同步入口：执行完整爬取并把结果写入 csv writer
+
+        Args:
+            writer: csv writer
+            flush (callable): 刷新输出文件的函数，在记录断点前调用
+
+        Returns:
+            dict: 爬取统计信息
+        """
+        return asyncio.run(self.crawl(writer, flush))
+
+    async def crawl(self, writer, flush=None):
+        """并发爬取所有关键词，返回统计信息"""
+        self.stats = {'pages': 0, 'rows': 0, 'errors': 0, 'resumed_pages': 0, 'duplicates': 0,
+                      'repeat_stops': 0, 'requests_saved': 0, 'elapsed': 0.0, 'pages_per_sec': 0.0}
+        self._seen = self.checkpoint.seen if self.checkpoint is not None else set()
+        self._flush = flush
+        self._global_semaphore = asyncio.Semaphore(self.concurrency)
+        self._host_semaphores = {}
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            self._executor = executor
+            await asyncio.gather(*(self._crawl_keyword(keyword, writer) for keyword in self.keywords))
+        self._executor = None
+
+        elapsed = time.perf_counter() - start
+        self.stats['elapsed'] = elapsed
+        self.stats['pages_per_sec'] = self.stats['pages'] / elapsed if elapsed > 0 else 0.0
+        return self.stats
+
+    async def _fetch(self, url):
+        """在全局与主机并发上限内执行一次下载"""
+        host = urlsplit(url).netloc
+        host_semaphore = self._host_semaphores.get(host)
+        if host_semaphore is None:
+            host_semaphore = asyncio.Semaphore(self.per_host_concurrency)
+            self._host_semaphores[host] = host_semaphore
+
+        async with self._global_semaphore, host_semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.fetch, url)
+
+    async def _crawl_page(self, keyword, page):
+        """下载并解析单页，返回职位记录列表，出错时返回 None"""
+        url = self.url_template.format(keyword=keyword, page=page)
+        self.log(f"正在爬取关键词'{keyword}'第 {page} 页...")
+        try:
+            html = await self._fetch(url)
+            if self.archive is not None:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._executor, self.archive.store, keyword, page, url, html)
+            jobs = self.parse(html)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"处理关键词'{keyword}'第 {page} 页时出现错误: {e}")
+            return None
+        self.stats['pages'] += 1
+        return jobs
+
+    def _write_page(self, keyword, page, jobs, writer, page_fp=None):
+        """写入一页中未见过的职位，并记录断点"""
+        rows = []
+        new_fingerprints = []
+        for job in jobs:
+            fingerprint = job_fingerprint(keyword, job)
+            if fingerprint in self._seen:
+                self.stats['duplicates'] += 1
+                continue
+            self._seen.add(fingerprint)
+            new_fingerprints.append(fingerprint)
+            rows.append(job_row(keyword, job))
+
+        if rows:
+            writer.writerows(rows)
+            self.stats['rows'] += len(rows)
+        if self.checkpoint is not None:
+            if self._flush is not None:
+                self._flush()
+            self.checkpoint.record(keyword, page, len(jobs), new_fingerprints, page_fp)
+        return len(rows)
+
+    async def _crawl_keyword(self, keyword, writer):
+        """按页序处理单个关键词，最多预取 page_window 页"""
+        self.log(f"正在搜索关键词: {keyword}")
+        found_any_data = False
+        seen_pages = set()
+        pending = {}
+        next_page = 1
+        page = 1
+
+        try:
+            while page <= self.max_pages:
+                # 补满预取窗口，已完成的页不再下载
+                while next_page <= self.max_pages and next_page < page + self.page_window:
+                    if not self._is_done(keyword, next_page):
+                        pending[next_page] = asyncio.create_task(self._crawl_page(keyword, next_page))
+                    next_page += 1
+
+                if page in pending:
+                    jobs = await pending.pop(page)
+                    if jobs is None:
+                        # 出错的页跳过，继续下一页
+                        page += 1
+                        continue
+                    page_fp = page_fingerprint(jobs) if jobs else None
+                    if page_fp in seen_pages:
+                        # 重复页按空页记录，续爬时同样在此停止
+                        self._write_page(keyword, page, [], writer, page_fp)
+                        saved = self.max_pages - next_page + 1
+                        self.stats['repeat_stops'] += 1
+                        self.stats['requests_saved'] += saved
+                        self.log(f"关键词'{keyword}'第 {page} 页与之前的页面重复，停止翻页（节省 {saved} 次请求）")
+                        break
+                    job_count = len(jobs)
+                    written = self._write_page(keyword, page, jobs, writer, page_fp)
+                    if job_count:
+                        self.log(f"关键词'{keyword}'第 {page} 页数据写入完成，共写入 {written} 条数据"
+                                 f"（跳过已写入 {job_count - written} 条）")
+                else:
+                    # 断点中已完成的页
+                    job_count = self.checkpoint.job_count(keyword, page)
+                    page_fp = self.checkpoint.page_fingerprint(keyword, page)
+                    self.stats['resumed_pages'] += 1
+
+                if page_fp:
+                    seen_pages.add(page_fp)
+
+                if job_count:
+                    found_any_data = True
+                elif page == 1:
+                    self.log(f"关键词'{keyword}'第一页未找到数据，跳转到下一个关键词")
+                    break
+                else:
+                    # 当前页没有数据，后续页无需再爬
+                    break
+                page += 1
+        finally:
+            # 取消窗口中尚未用到的页
+            for task in pending.values():
+                task.cancel()
+            await asyncio.gather(*pending.values(), return_exceptions=True)
+
+        if not found_any_data:
+            self.log(f"关键词'{keyword}'未找到任何数据")
+
+    def _is_done(self, keyword, page):
+        return self.checkpoint is not None and self.checkpoint.is_done(keyword, page)
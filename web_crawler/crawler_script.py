@@ -1,8 +1,13 @@
-import re
-import requests
-import time
 import csv
+import os
 import sys
+import argparse
+from checkpoint import CrawlCheckpoint
+from crawl_engine import CrawlEngine
+from http_session import PooledSession
+from job_parser import csv_header, parse_jobs
+from page_archive import PageArchive, reparse
+from rate_limiter import AdaptiveRateLimiter
 
 # 配置标准输出编码为UTF-8
 try:
@@ -39,91 +44,125 @@ keywords = [
     '区块链工程师'
 ]
 
-# 打开CSV文件准备写入数据
-with open('zhilian_computer_jobs.csv', 'w', newline='', encoding='utf-8-sig') as csvfile:
-    writer = csv.writer(csvfile)
-    # 写入表头
-    writer.writerow(['关键词', '工作名称', '公司名称', '地区', '学历', '薪资', '经验要求', '公司性质', '公司规模', '工作类型'])
-
-    for keyword in keywords:
-        print(f"正在搜索关键词: {keyword}")
-        found_any_data = False  # 标记是否找到了数据
-        
-        for page in range(1, 20):  # 每个关键词爬取10页
-            # 按照你提供的URL格式来构造
-            url = f"https://sou.zhaopin.com/?jl=854&kw={keyword}&p={page}"
-            print(f"正在爬取关键词'{keyword}'第 {page} 页...")
-            time.sleep(1)
-            # 停顿1秒
-            
-            try:
-                response = requests.get(url, headers=headers).text
-                
-                # 先检查能匹配到多少个职位
-                names = re.findall(r'"matchInfo":.*?"name":"(.*?)"', response)
-                companyNames = re.findall(r'"companyName":"(.*?)"', response)
-                cityDistricts = re.findall(r'"cityDistrict":"(.*?)"', response)
-                educations = re.findall(r'"education":"(.*?)"', response)
-                salary60s = re.findall(r'"salary60":"(.*?)"', response)
-                workingExps = re.findall(r'"workingExp":"(.*?)"', response)
-                properties = re.findall(r'"property":"(.*?)"', response)
-                companySizes = re.findall(r'"companySize":"(.*?)"', response)
-                workTypes = re.findall(r'"workType":"(.*?)"', response)
-                
-                # 输出各字段匹配到的数量
-                print(f"关键词'{keyword}'第{page}页匹配到数据数量: 名称({len(names)}), 公司({len(companyNames)}), 地区({len(cityDistricts)}), "
-                      f"学历({len(educations)}), 薪资({len(salary60s)}), 经验({len(workingExps)}), "
-                      f"公司性质({len(properties)}), 公司规模({len(companySizes)}), 工作类型({len(workTypes)})")
-                
-                # 检查是否找到了数据
-                if len(names) > 0:
-                    found_any_data = True
-                elif page == 1:
-                    # 如果第一页就没有数据，跳出循环，尝试下一个关键词
-                    print(f"关键词'{keyword}'第一页未找到数据，跳转到下一个关键词")
-                    break
-                
-                # 以最少的字段数量为准，避免索引越界
-                min_count = min(len(names), len(companyNames), len(cityDistricts), len(educations),
-                               len(salary60s), len(workingExps), len(properties), len(companySizes),
-                               len(workTypes))
-                
-                # 写入每一行数据
-                for i in range(min_count):
-                    # 添加关键词作为第一列
-                    row = [keyword]
-                    # 添加其他字段数据
-                    row_data = [names[i], companyNames[i], cityDistricts[i], educations[i],
-                               salary60s[i], workingExps[i], properties[i], companySizes[i],
-                               workTypes[i]]
-                    
-                    # 清理数据中的特殊字符
-                    clean_data = []
-                    for item in row_data:
-                        # 处理可能存在的转义字符和特殊符号
-                        if isinstance(item, str):
-                            # 替换常见的转义字符
-                            item = item.replace('\\n', ' ').replace('\\r', ' ').replace('\\t', ' ')
-                            # 去除首尾空白字符
-                            item = item.strip()
-                        clean_data.append(item)
-                    
-                    # 合并关键词和清理后的数据
-                    full_row = [row[0]] + clean_data
-                    writer.writerow(full_row)
-                    
-                print(f"关键词'{keyword}'第 {page} 页数据写入完成，共写入 {min_count} 条数据")
-                
-                # 如果当前页没有数据，跳出循环
-                if min_count == 0 and page > 1:
-                    break
-                    
-            except Exception as e:
-                print(f"处理关键词'{keyword}'第 {page} 页时出现错误: {e}")
-                continue
-        
-        if not found_any_data:
-            print(f"关键词'{keyword}'未找到任何数据")
-
-print("所有数据爬取完成！")
-input("按Enter键退出...")
\ No newline at end of file
+# 搜索页URL模板
+url_template = "https://sou.zhaopin.com/?jl=854&kw={keyword}&p={page}"
+
+def crawl_to_writer(writer, flush=None, checkpoint=None, archive=None, concurrency=8, per_host_concurrency=4,
+                    max_pages=19, template=url_template, connect_timeout=5.0, read_timeout=15.0, max_retries=3,
+                    initial_rate=2.0, max_rate=20.0, verbose=True):
+    """并发爬取所有关键词，把原始行写入任意 csv writer 兼容对象，返回统计信息
+
+    Args:
+        writer: 提供 writerows() 的对象，如 csv writer 或流式管道的队列
+        flush (callable): 记录断点前刷新输出的函数
+        checkpoint (CrawlCheckpoint): 断点记录
+        archive (PageArchive): 原始页面归档
+        initial_rate (float): 自适应限速的初始速率（请求/秒）
+        max_rate (float): 自适应限速的速率上限，为 None 时不限速
+    """
+    limiter = AdaptiveRateLimiter(initial_rate=initial_rate, max_rate=max_rate) if max_rate else None
+
+    with PooledSession(headers=headers, pool_maxsize=per_host_concurrency, connect_timeout=connect_timeout,
+                       read_timeout=read_timeout, max_retries=max_retries, limiter=limiter) as session:
+        engine = CrawlEngine(
+            fetch=session.get_text,
+            parse=parse_jobs,
+            url_template=template,
+            keywords=keywords,
+            max_pages=max_pages,
+            concurrency=concurrency,
+            per_host_concurrency=per_host_concurrency,
+            checkpoint=checkpoint,
+            archive=archive,
+            verbose=verbose,
+        )
+        stats = engine.run(writer, flush=flush)
+        stats['http'] = session.connection_stats()
+
+    http = stats['http']
+    print(f"共爬取 {stats['pages']} 页（断点跳过 {stats['resumed_pages']} 页），写入 {stats['rows']} 条数据"
+          f"（跳过已写入 {stats['duplicates']} 条），失败 {stats['errors']} 页，"
+          f"耗时 {stats['elapsed']:.1f} 秒（{stats['pages_per_sec']:.1f} 页/秒）")
+    print(f"HTTP请求 {http['requests']} 次（重试 {http['retries']} 次），"
+          f"新建连接 {http['new_connections']} 个，复用连接 {http['reused_connections']} 次")
+    print(f"重复页提前停止 {stats['repeat_stops']} 个关键词，节省请求 {stats['requests_saved']} 次")
+    if limiter is not None:
+        stats['rate'] = limiter.rate
+        stats['rate_history'] = list(limiter.history)
+        backoffs = sum(1 for _, _, event in limiter.history if event not in ('init', 'increase'))
+        print(f"限速器最终速率 {limiter.rate:.1f} 请求/秒，期间回退 {backoffs} 次")
+    return stats
+
+
+def crawl(output_file='zhilian_computer_jobs.csv', mode='resume', archive_pages=True, **options):
+    """并发爬取所有关键词并写入CSV，返回统计信息
+
+    Args:
+        mode (str): 'resume' 从断点继续并追加未写入过的职位；
+                    'recrawl' 重新爬取所有页但只追加未写入过的职位（定期重爬）；
+                    'fresh' 丢弃断点并重写CSV
+        archive_pages (bool): 是否把页面原文压缩归档到CSV旁，供 reparse 离线重建
+        options: 透传给 crawl_to_writer 的并发、超时与限速参数
+    """
+    checkpoint_path = CrawlCheckpoint.path_for(output_file)
+    if mode != 'fresh' and os.path.exists(checkpoint_path) and not os.path.exists(output_file):
+        # 断点中记录的职位都在CSV里，CSV已不存在时断点随之作废，否则这些职位会被跳过而不再写入
+        print(f"输出文件 {output_file} 不存在，断点作废，重新爬取")
+        mode = 'fresh'
+    if mode == 'fresh' and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    checkpoint = CrawlCheckpoint(checkpoint_path)
+    if mode == 'recrawl':
+        checkpoint.reset_units()
+    if checkpoint.units:
+        print(f"从断点继续：已完成 {len(checkpoint.units)} 页，已写入 {len(checkpoint.seen)} 条职位")
+
+    archive = PageArchive(PageArchive.path_for(output_file)) if archive_pages else None
+
+    # 断点为空时重写CSV，否则在原文件后追加（CSV不存在时断点已在上面作废）
+    append = bool(checkpoint.seen)
+
+    # 打开CSV文件准备写入数据
+    with open(output_file, 'a' if append else 'w', newline='', encoding='utf-8-sig') as csvfile:
+        writer = csv.writer(csvfile)
+        if not append:
+            # 写入表头
+            writer.writerow(csv_header)
+        stats = crawl_to_writer(writer, flush=csvfile.flush, checkpoint=checkpoint, archive=archive, **options)
+    checkpoint.close()
+    return stats
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='智联招聘计算机岗位爬虫')
+    parser.add_argument('--output', default='zhilian_computer_jobs.csv', help='输出CSV文件路径')
+    parser.add_argument('--concurrency', type=int, default=8, help='全局最大并发请求数')
+    parser.add_argument('--per-host', type=int, default=4, help='单个主机最大并发请求数')
+    parser.add_argument('--pages', type=int, default=19, help='每个关键词最多爬取的页数')
+    parser.add_argument('--url-template', default=url_template, help='搜索页URL模板，可指向本地桩服务')
+    parser.add_argument('--connect-timeout', type=float, default=5.0, help='建立连接超时（秒）')
+    parser.add_argument('--read-timeout', type=float, default=15.0, help='读取响应超时（秒）')
+    parser.add_argument('--retries', type=int, default=3, help='429/5xx/超时的最大重试次数')
+    parser.add_argument('--mode', choices=['resume', 'recrawl', 'fresh'], default='resume',
+                        help='resume: 从断点继续；recrawl: 重爬全部页只追加新职位；fresh: 丢弃断点重新爬取')
+    parser.add_argument('--rate', type=float, default=2.0, help='自适应限速的初始速率（请求/秒）')
+    parser.add_argument('--max-rate', type=float, default=20.0, help='自适应限速的速率上限，0 表示不限速')
+    parser.add_argument('--no-archive', action='store_true', help='不归档页面原文')
+    parser.add_argument('--reparse', action='store_true', help='不访问网络，从页面归档重建CSV')
+    parser.add_argument('--crawl-date', help='重建时使用的归档日期（YYYY-MM-DD），默认最近一次')
+    parser.add_argument('--workers', type=int, help='重建时的进程数，默认CPU核数')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.reparse:
+        reparse(PageArchive(PageArchive.path_for(args.output)), args.output, keywords=keywords,
+                crawl_date=args.crawl_date, workers=args.workers)
+        sys.exit(0)
+    crawl(output_file=args.output, concurrency=args.concurrency, per_host_concurrency=args.per_host,
+          max_pages=args.pages, template=args.url_template, connect_timeout=args.connect_timeout,
+          read_timeout=args.read_timeout, max_retries=args.retries, mode=args.mode,
+          archive_pages=not args.no_archive, initial_rate=args.rate, max_rate=args.max_rate)
+    print("所有数据爬取完成！")
+    input("按Enter键退出...")
@@ -0,0 +1,141 @@
+"""
+连接池化的HTTP会话
+
+在 requests.Session 之上提供长连接复用、有界连接池、可配置超时，
+以及对 429/5xx 与超时的指数退避重试（带随机抖动）。
+同时统计新建连接与复用连接次数，便于核对握手开销的节省。
+可挂接自适应限速器：每次尝试（含重试）前取令牌，并把状态码与耗时反馈给限速器。
+"""
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 需要重试的HTTP状态码
+retry_statuses = frozenset({429, 500, 502, 503, 504})
+
+
+class PooledSession:
+    """带重试与连接统计的HTTP会话，可在多个线程间共享"""
+
+    def __init__(self, headers=None, pool_maxsize=8, connect_timeout=5.0, read_timeout=15.0,
+                 max_retries=3, backoff_base=0.5, backoff_max=30.0, limiter=None):
+        """
+        Args:
+            headers (dict): 每个请求附带的请求头
+            pool_maxsize (int): 每个主机保持的最大连接数，超出时请求排队等待
+            connect_timeout (float): 建立连接超时（秒）
+            read_timeout (float): 读取响应超时（秒）
+            max_retries (int): 最大重试次数（不含首次请求）
+            backoff_base (float): 退避基准时长（秒），第 n 次重试最多等待 base * 2**n
+            backoff_max (float): 单次退避的最长等待（秒）
+            limiter (AdaptiveRateLimiter): 限速器，为 None 时不限速
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.limiter = limiter
+
+        self._adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, pool_block=True, max_retries=0)
+        self._session = requests.Session()
+        self._session.mount('http://', self._adapter)
+        self._session.mount('https://', self._adapter)
+        if headers:
+            self._session.headers.update(headers)
+
+        self._lock = threading.Lock()
+        self._counters = {'requests': 0, 'retries': 0, 'failures': 0}
+
+    def _count(self, key):
+        with self._lock:
+            self._counters[key] += 1
+
+    def backoff_delay(self, attempt, retry_after=None):
+        """计算第 attempt 次重试前的等待时长（full jitter）"""
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    @staticmethod
+    def _retry_after(response):
+        """解析 Retry-After 响应头（仅支持秒数形式）"""
+        value = response.headers.get('Retry-After')
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+    def get(self, url, **kwargs):
+        """发送GET请求，对 429/5xx 与超时/连接错误进行退避重试
+
+        Returns:
+            requests.Response: 最终成功的响应
+
+        Raises:
+            requests.RequestException: 重试耗尽后仍失败
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire()
+            self._count('requests')
+            start = time.perf_counter()
+            try:
+                response = self._session.get(url, **kwargs)
+            except (requests.Timeout, requests.ConnectionError):
+                if self.limiter is not None:
+                    self.limiter.record(None, time.perf_counter() - start)
+                if attempt >= self.max_retries:
+                    self._count('failures')
+                    raise
+                delay = self.backoff_delay(attempt)
+            else:
+                if self.limiter is not None:
+                    self.limiter.record(response.status_code, time.perf_counter() - start)
+                if response.status_code not in retry_statuses:
+                    return response
+                if attempt >= self.max_retries:
+                    self._count('failures')
+                    response.raise_for_status()
+                delay = self.backoff_delay(attempt, self._retry_after(response))
+                response.close()
+
+            self._count('retries')
+            attempt += 1
+            time.sleep(delay)
+
+    def get_text(self, url):
+        """下载页面并返回文本，供爬取引擎作为 fetch 函数使用"""
+        response = self.get(url)
+        response.raise_for_status()
+        return response.text
+
+    def connection_stats(self):
+        """返回连接统计：新建连接数与复用连接数"""
+        new_connections = 0
+        pooled_requests = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            new_connections += pool.num_connections
+            pooled_requests += pool.num_requests
+        with self._lock:
+            stats = dict(self._counters)
+        stats['new_connections'] = new_connections
+        stats['reused_connections'] = max(0, pooled_requests - new_connections)
+        return stats
+
+    def close(self):
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
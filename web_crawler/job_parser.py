@@ -0,0 +1,126 @@
+"""
+搜索页职位解析
+
+智联搜索页把职位列表以JSON形式嵌入在 window.__INITIAL_STATE__ 中。
+这里只定位一次JSON起点并整体解码，再逐条职位取字段，
+避免对整页做多次正则扫描，也避免字段缺失时按下标拼接导致的错位。
+"""
+import hashlib
+import json
+import re
+
+# CSV列与页面JSON字段的对应关系
+field_map = [
+    ('工作名称', 'name'),
+    ('公司名称', 'companyName'),
+    ('地区', 'cityDistrict'),
+    ('学历', 'education'),
+    ('薪资', 'salary60'),
+    ('经验要求', 'workingExp'),
+    ('公司性质', 'property'),
+    ('公司规模', 'companySize'),
+    ('工作类型', 'workType'),
+]
+
+# CSV表头
+csv_header = ['关键词'] + [column for column, _ in field_map]
+
+_state_pattern = re.compile(r'__INITIAL_STATE__\s*=\s*')
+_decoder = json.JSONDecoder()
+
+
+def _clean_value(value):
+    """把字段值转为字符串并去除换行、制表符等特殊字符"""
+    if value is None:
+        return ''
+    value = str(value)
+    return value.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ').strip()
+
+
+def _find_position_list(state):
+    """在页面状态中查找职位列表"""
+    if isinstance(state, dict):
+        positions = state.get('positionList')
+        if isinstance(positions, list):
+            return positions
+        for value in state.values():
+            positions = _find_position_list(value)
+            if positions is not None:
+                return positions
+    elif isinstance(state, list):
+        for value in state:
+            positions = _find_position_list(value)
+            if positions is not None:
+                return positions
+    return None
+
+
+def extract_state(html):
+    """解码页面中嵌入的 __INITIAL_STATE__ JSON，找不到时返回 None"""
+    match = _state_pattern.search(html)
+    if match is None:
+        return None
+    try:
+        state, _ = _decoder.raw_decode(html, match.end())
+    except ValueError:
+        return None
+    return state
+
+
+def parse_jobs(html):
+    """解析搜索页，返回职位记录列表
+
+    Args:
+        html (str): 搜索页文本
+
+    Returns:
+        list[dict]: 每条职位一个字典，键为CSV列名，另含 'job_id'
+    """
+    state = extract_state(html)
+    positions = _find_position_list(state) if state is not None else None
+    if not positions:
+        return []
+
+    jobs = []
+    for position in positions:
+        if not isinstance(position, dict):
+            continue
+        job = {'job_id': _clean_value(position.get('number') or position.get('jobId'))}
+        for column, key in field_map:
+            job[column] = _clean_value(position.get(key))
+        jobs.append(job)
+    return jobs
+
+
+def job_rows(keyword, html):
+    """解析搜索页并转换为待写入CSV的行列表（首列为关键词）"""
+    return [job_row(keyword, job) for job in parse_jobs(html)]
+
+
+def job_row(keyword, job):
+    """把一条职位记录转换为CSV行（首列为关键词）"""
+    return [keyword] + [job[column] for column, _ in field_map]
+
+
+def _job_key(job):
+    """职位编号，页面未提供编号时退化为字段内容哈希"""
+    job_id = job.get('job_id')
+    if not job_id:
+        content = '\x1f'.join(job[column] for column, _ in field_map)
+        job_id = hashlib.sha1(content.encode('utf-8')).hexdigest()[:16]
+    return job_id
+
+
+def job_fingerprint(keyword, job):
+    """职位指纹：关键词 + 职位编号
+
+    指纹包含关键词，与清洗阶段按整行去重的口径一致：
+    同一职位出现在不同关键词下仍各保留一行。
+    """
+    return f"{keyword}:{_job_key(job)}"
+
+
+def page_fingerprint(jobs):
+    """页面指纹：页内职位编号集合的哈希，与职位顺序无关"""
+    keys = sorted(_job_key(job) for job in jobs)
+    return hashlib.sha1('\n'.join(keys).encode('utf-8')).hexdigest()[:16]
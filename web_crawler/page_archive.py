@@ -0,0 +1,163 @@
+"""
+原始页面归档与离线重解析
+
+爬取时把每个搜索页原文以 gzip 压缩存放在CSV旁的归档目录中，
+文件名由 URL + 爬取日期 的哈希决定，同一天重复下载同一URL会覆盖同一文件。
+解析逻辑变更后可用 reparse() 多进程从归档重建CSV，无需任何网络请求。
+
+目录结构：
+    zhilian_computer_jobs_pages/
+        index.jsonl                 # 每行一条 {date, keyword, page, url, key}
+        2025-11-25/<key>.html.gz
+"""
+import csv
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from job_parser import csv_header, parse_jobs, job_row, job_fingerprint, page_fingerprint
+
+
+def page_key(url, crawl_date):
+    """页面在归档中的键：URL + 爬取日期的哈希"""
+    return hashlib.sha256(f"{crawl_date}\n{url}".encode('utf-8')).hexdigest()[:32]
+
+
+class PageArchive:
+    """压缩的原始页面归档，store() 可在多个线程中并发调用"""
+
+    def __init__(self, root, crawl_date=None):
+        """
+        Args:
+            root (str): 归档目录
+            crawl_date (str): 爬取日期（YYYY-MM-DD），默认当天
+        """
+        self.root = root
+        self.crawl_date = crawl_date or datetime.date.today().isoformat()
+        self.index_path = os.path.join(root, 'index.jsonl')
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def path_for(output_file):
+        """与输出CSV放在一起的归档目录"""
+        return os.path.splitext(output_file)[0] + '_pages'
+
+    def page_path(self, key, crawl_date=None):
+        return os.path.join(self.root, crawl_date or self.crawl_date, key + '.html.gz')
+
+    def store(self, keyword, page, url, html):
+        """压缩保存一个页面并登记到索引"""
+        key = page_key(url, self.crawl_date)
+        path = self.page_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # 先写临时文件再替换，避免中途退出留下损坏的压缩文件
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(temp_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            f.write(html)
+        os.replace(temp_path, path)
+
+        record = {'date': self.crawl_date, 'keyword': keyword, 'page': page, 'url': url, 'key': key}
+        with self._lock:
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def entries(self, crawl_date=None):
+        """返回某次爬取（默认最近一次）的页面条目，同一 (关键词, 页码) 只保留最后一次"""
+        index = self._read_index()
+        if not index:
+            return []
+        crawl_date = crawl_date or max(entry['date'] for entry in index)
+        latest = {}
+        for entry in index:
+            if entry['date'] == crawl_date:
+                latest[(entry['keyword'], entry['page'])] = entry
+        return list(latest.values())
+
+    def _read_index(self):
+        if not os.path.exists(self.index_path):
+            return []
+        entries = []
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break
+        return entries
+
+
+def _parse_archived_page(path):
+    """子进程中执行：解压并解析一个归档页面"""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return parse_jobs(f.read())
+
+
+def reparse(archive, output_file, keywords=None, crawl_date=None, workers=None):
+    """从归档多进程重建职位CSV
+
+    与在线爬取保持一致：每个关键词按页序处理，遇到空页或重复页即停止，并按职位指纹去重。
+
+    Args:
+        archive (PageArchive): 页面归档
+        output_file (str): 输出CSV路径
+        keywords (list): 关键词顺序，未给出时按归档中首次出现的顺序
+        crawl_date (str): 使用哪一次爬取的归档，默认最近一次
+        workers (int): 进程数，默认CPU核数
+
+    Returns:
+        dict: 统计信息
+    """
+    start = time.perf_counter()
+    entries = archive.entries(crawl_date)
+    if not entries:
+        print(f"归档 {archive.root} 中没有可用的页面")
+        return {'pages': 0, 'rows': 0, 'elapsed': 0.0}
+
+    order = list(keywords or [])
+    for entry in entries:
+        if entry['keyword'] not in order:
+            order.append(entry['keyword'])
+    rank = {keyword: i for i, keyword in enumerate(order)}
+    entries.sort(key=lambda e: (rank[e['keyword']], e['page']))
+
+    paths = [archive.page_path(entry['key'], entry['date']) for entry in entries]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parsed = list(executor.map(_parse_archived_page, paths, chunksize=max(1, len(paths) // 64)))
+
+    pages_by_keyword = {}
+    for entry, jobs in zip(entries, parsed):
+        pages_by_keyword.setdefault(entry['keyword'], {})[entry['page']] = jobs
+
+    rows_written = 0
+    seen = set()
+    with open(output_file, 'w', newline='', encoding='utf-8-sig') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(csv_header)
+        for keyword in order:
+            pages = pages_by_keyword.get(keyword, {})
+            seen_pages = set()
+            for page in sorted(pages):
+                jobs = pages[page]
+                if not jobs:
+                    break
+                page_fp = page_fingerprint(jobs)
+                if page_fp in seen_pages:
+                    break
+                seen_pages.add(page_fp)
+                for job in jobs:
+                    fingerprint = job_fingerprint(keyword, job)
+                    if fingerprint in seen:
+                        continue
+                    seen.add(fingerprint)
+                    writer.writerow(job_row(keyword, job))
+                    rows_written += 1
+
+    elapsed = time.perf_counter() - start
+    print(f"从归档重建完成：解析 {len(entries)} 页，写入 {rows_written} 条数据，耗时 {elapsed:.2f} 秒")
+    return {'pages': len(entries), 'rows': rows_written, 'elapsed': elapsed}
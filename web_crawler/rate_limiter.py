@@ -0,0 +1,111 @@
+"""
+自适应限速器
+
+令牌桶按当前速率补充令牌，每次请求前取一个令牌。
+速率按 AIMD 调整：响应正常时加性增长，遇到 429/5xx、网络错误或延迟突增时乘性回退。
+与TCP拥塞控制类似，首次回退前处于慢启动阶段，每个正常响应都增长一次，以便尽快找到服务端上限。
+可在多个线程间共享。
+"""
+import collections
+import threading
+import time
+
+
+class AdaptiveRateLimiter:
+    """基于令牌桶的 AIMD 自适应限速器"""
+
+    def __init__(self, initial_rate=2.0, min_rate=0.5, max_rate=20.0, increase=1.0, decrease=0.5,
+                 burst=2.0, spike_factor=3.0, spike_floor=0.5, spike_weight=0.05, cooldown=1.0,
+                 history_size=10000):
+        """
+        Args:
+            initial_rate (float): 初始速率（请求/秒）
+            min_rate (float): 速率下限
+            max_rate (float): 速率上限
+            increase (float): 加性增长量，持续正常时每秒约增长该值（慢启动阶段每个响应增长该值）
+            decrease (float): 乘性回退系数，出错时 rate *= decrease
+            burst (float): 令牌桶容量，允许的瞬时突发请求数
+            spike_factor (float): 延迟超过平滑延迟的该倍数视为突增
+            spike_floor (float): 低于该延迟（秒）时不判定为突增
+            spike_weight (float): 突增的响应计入平滑延迟的权重；服务端持续变慢但仍正常响应时，
+                                  平滑延迟逐渐跟上新的延迟水平，不再每次都判定为突增
+            cooldown (float): 两次回退之间的最短间隔（秒），避免同一波错误连续回退
+            history_size (int): 保留的速率变化记录条数
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.burst = max(1.0, burst)
+        self.spike_factor = spike_factor
+        self.spike_floor = spike_floor
+        self.spike_weight = spike_weight
+        self.cooldown = cooldown
+
+        self._rate = min(max(initial_rate, min_rate), max_rate)
+        self._tokens = 1.0
+        self._start = time.monotonic()
+        self._last_refill = self._start
+        self._last_decrease = float('-inf')
+        self._latency = None
+        self._slow_start = True
+        self._lock = threading.Lock()
+        self.history = collections.deque([(0.0, self._rate, 'init')], maxlen=history_size)
+
+    @property
+    def rate(self):
+        """当前速率（请求/秒）"""
+        return self._rate
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+    def acquire(self):
+        """阻塞直到取得一个令牌"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self._rate
+            time.sleep(wait)
+
+    def record(self, status, latency):
+        """根据一次请求的结果调整速率
+
+        Args:
+            status (int): HTTP状态码，网络错误/超时传 None
+            latency (float): 请求耗时（秒）
+        """
+        with self._lock:
+            now = time.monotonic()
+            spike = (self._latency is not None and latency > self.spike_floor
+                     and latency > self._latency * self.spike_factor)
+            # 平滑延迟只跟踪成功的响应；突增的响应以较小权重计入，短暂突增影响不大，持续变慢则逐渐成为新的基线
+            if status is not None and status < 400:
+                weight = self.spike_weight if spike else 0.2
+                self._latency = latency if self._latency is None else (1 - weight) * self._latency + weight * latency
+
+            if status is None or status == 429 or status >= 500:
+                self._back_off(now, 'error' if status is None else f"status {status}")
+            elif spike:
+                self._back_off(now, 'latency spike')
+            else:
+                self._refill(now)
+                step = self.increase if self._slow_start else self.increase / self._rate
+                new_rate = min(self.max_rate, self._rate + step)
+                if new_rate != self._rate:
+                    self._rate = new_rate
+                    self.history.append((now - self._start, new_rate, 'increase'))
+
+    def _back_off(self, now, reason):
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._refill(now)
+        self._slow_start = False
+        self._last_decrease = now
+        self._rate = max(self.min_rate, self._rate * self.decrease)
+        self.history.append((now - self._start, self._rate, reason))
@@ -0,0 +1,180 @@
+"""
+本地职位站点桩服务
+
+用已爬取的CSV样本生成与智联搜索页结构一致的页面（职位列表嵌入在 __INITIAL_STATE__ 中），
+用于在无网络环境下测试爬虫并测量吞吐。
+"""
+import csv
+import hashlib
+import json
+import os
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from job_parser import field_map
+
+sample_csv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'zhilian_computer_jobs.csv')
+
+def load_sample_jobs(sample_csv=sample_csv_path):
+    """读取样本CSV，按关键词分组为页面JSON格式的职位列表"""
+    jobs = {}
+    with open(sample_csv, 'r', encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            job = {}
+            for column, key in field_map:
+                job[key] = row.get(column) or ''
+            digest = hashlib.md5(json.dumps(job, ensure_ascii=False).encode('utf-8')).hexdigest()
+            job = {'number': f"CC{digest[:16].upper()}", 'matchInfo': {'icons': [], 'tagIds': []}, **job}
+            jobs.setdefault(row['关键词'], []).append(job)
+    return jobs
+
+
+def render_page(job_list):
+    """把职位列表渲染为搜索页HTML"""
+    state = json.dumps({'positionList': job_list, 'totalCount': len(job_list)},
+                       ensure_ascii=False, separators=(',', ':'))
+    return ('<!DOCTYPE html><html><head><meta charset="utf-8"><title>搜索结果</title>'
+            f'<script>window.__INITIAL_STATE__={state}</script></head>'
+            '<body><div id="root"></div></body></html>')
+
+
+class StubJobSite:
+    """本地职位站点桩服务
+
+    用法：
+        with StubJobSite() as site:
+            crawl(template=site.url_template)
+    """
+
+    def __init__(self, sample_csv=sample_csv_path, jobs_per_page=20, latency=0.0, throttle_rate=None,
+                 out_of_range='empty', host='127.0.0.1', port=0):
+        """
+        Args:
+            sample_csv (str): 样本CSV路径
+            jobs_per_page (int): 每页职位数量
+            latency (float): 每个请求的模拟响应延迟（秒）
+            throttle_rate (float): 模拟服务端限流，请求速率超过该值（请求/秒）时返回 429
+            out_of_range (str): 页码超出范围时的返回内容：'empty' 空列表，'last' 最后一页，'first' 第一页
+            host (str): 监听地址
+            port (int): 监听端口，0 表示自动分配
+        """
+        self.jobs = load_sample_jobs(sample_csv)
+        self.jobs_per_page = jobs_per_page
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.out_of_range = out_of_range
+        self.requests = 0
+        self.connections = 0
+        self.throttled = 0
+        self._tokens = throttle_rate or 0.0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def keywords(self):
+        return list(self.jobs)
+
+    @property
+    def url_template(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/?jl=854&kw={{keyword}}&p={{page}}"
+
+    def page_jobs(self, keyword, page):
+        """返回某关键词某页的职位列表，超出范围时按 out_of_range 处理"""
+        jobs = self.jobs.get(keyword, [])
+        last_page = max(1, -(-len(jobs) // self.jobs_per_page))
+        if page > last_page:
+            if self.out_of_range == 'last':
+                page = last_page
+            elif self.out_of_range == 'first':
+                page = 1
+        start = (page - 1) * self.jobs_per_page
+        return jobs[start:start + self.jobs_per_page]
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests = 0
+            self.connections = 0
+            self.throttled = 0
+
+    def _take_token(self):
+        """服务端令牌桶（容量为1秒的配额），无令牌时应返回 429"""
+        if not self.throttle_rate:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.throttle_rate, self._tokens + (now - self._last_refill) * self.throttle_rate)
+            self._last_refill = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            self.throttled += 1
+            return False
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _make_handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                # 每个TCP连接对应一个处理器实例
+                super().setup()
+                # 关闭Nagle算法，避免长连接上头部与正文分两次写出时的延迟确认等待
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with site._lock:
+                    site.connections += 1
+
+            def do_GET(self):
+                with site._lock:
+                    site.requests += 1
+                if not site._take_token():
+                    body = b'Too Many Requests'
+                    self.send_response(429)
+                    self.send_header('Content-Type', 'text/plain')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                if site.latency:
+                    time.sleep(site.latency)
+
+                query = parse_qs(urlsplit(self.path).query)
+                keyword = query.get('kw', [''])[0]
+                try:
+                    page = int(query.get('p', ['1'])[0])
+                except ValueError:
+                    page = 1
+
+                body = render_page(site.page_jobs(keyword, page)).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler